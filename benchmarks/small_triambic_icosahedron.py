@@ -0,0 +1,56 @@
+"""
+Compare the batched SmallTriambicIcosahedron mesh with the construction it
+replaced, which took the convex hull of each pyramid and concatenated the
+hulls with the icosahedron's. Run from the repository root:
+    python -m benchmarks.small_triambic_icosahedron
+"""
+import timeit
+import numpy as np
+import trimesh
+from stellations.misc_stellations.small_triambic_icosahedron import SmallTriambicIcosahedron
+
+REPEATS = 5
+NUMBER = 20
+
+def pyramid_mesh(radius=1):
+    """
+    The previous construction: an icosahedron hull and 20 pyramid hulls,
+    concatenated, leaving the pyramids' bases inside the solid.
+    """
+    icosahedron = radius * SmallTriambicIcosahedron._icosahedron_vertices()
+    pyramids = []
+    for face in icosahedron[SmallTriambicIcosahedron._icosahedron_faces()]:
+        vertex = SmallTriambicIcosahedron.APEX_SCALE * face.mean(axis=0)
+        pyramids.append(trimesh.convex.convex_hull(np.vstack([face, vertex])))
+    return trimesh.util.concatenate(
+        [trimesh.convex.convex_hull(icosahedron)] + pyramids
+    )
+
+def batched_mesh(radius=1):
+    """
+    The batched construction, from scratch: no cached unit geometry.
+    """
+    return trimesh.Trimesh(
+        vertices=radius * SmallTriambicIcosahedron.unit_vertices(),
+        faces=SmallTriambicIcosahedron.unit_faces(),
+        process=False
+    )
+
+def cached_mesh(radius=1):
+    """
+    A new instance, reusing the class's cached unit geometry.
+    """
+    return SmallTriambicIcosahedron(radius).mesh
+
+def main():
+    old, new = pyramid_mesh(2.0), batched_mesh(2.0)
+    print(f"faces: {len(old.faces)} before, {len(new.faces)} after")
+    print(f"volume: {old.volume:.6f} before, {new.volume:.6f} after")
+    print(f"watertight: {new.is_watertight}")
+
+    for build in (pyramid_mesh, batched_mesh, cached_mesh):
+        best = min(timeit.repeat(build, repeat=REPEATS, number=NUMBER)) / NUMBER
+        print(f"{build.__name__}: {1e3 * best:.3f}ms")
+
+if __name__=='__main__':
+    main()
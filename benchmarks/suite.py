@@ -0,0 +1,215 @@
+"""
+Benchmarks for the mesh-generation paths, compared against the baseline
+stored in baseline.json. Run from the repository root:
+    python -m benchmarks.suite --save           # record a baseline
+    python -m benchmarks.suite                  # compare with the baseline
+    python -m benchmarks.suite --threshold 0.5  # allow 50% regressions
+Exits with status 1 if any benchmark is worse than its baseline by more than
+the threshold (by default 25%). Timings are the best of several runs, so
+baselines are only comparable on the same machine: baseline.json is local to
+each checkout (it is not in git), and without one the results are only
+printed. Record it from the code you want to compare against, e.g. before
+making a change.
+"""
+import argparse
+import json
+import os
+import os.path
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+import numpy as np
+from common import polyhedron
+from common.stellation_diagram import plane_points, unique_points
+from common.stl import write_stl
+from platonic.dodecahedron import Dodecahedron
+from stellations.misc_stellations.small_triambic_icosahedron import SmallTriambicIcosahedron
+from stellations.stellated_dodecahedra.main import all_stellation_keys
+from stellations.stellated_dodecahedra.stellated_dodecahedron_builder import StellatedDodecahedronBuilder
+from stellations.stellated_icosahedra.stellated_icosahedron_builder import StellatedIcosahedronBuilder
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+REPEATS = 7
+THRESHOLD = 0.25
+
+ALL_DODECAHEDRON_KEYS = ['base', 'first_shell', 'second_shell', 'third_shell']
+
+# name: (function returning a measurement, unit, higher is better)
+BENCHMARKS = {}
+
+def benchmark(name, unit, higher_is_better=False):
+    def register(function):
+        BENCHMARKS[name] = (function, unit, higher_is_better)
+        return function
+    return register
+
+def best_time(function, number=1):
+    """
+    Best time of REPEATS runs of number calls to function, per call.
+    """
+    return min(timeit.repeat(function, repeat=REPEATS, number=number)) / number
+
+def startup_time(statement):
+    """
+    Best time of REPEATS fresh interpreters running statement, minus the time
+    for an interpreter doing nothing.
+    """
+    def run(code):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True)
+        return time.perf_counter() - start
+    empty = min(run('pass') for _ in range(REPEATS))
+    return min(run(statement) for _ in range(REPEATS)) - empty
+
+@benchmark('stellated dodecahedron build', 'ms')
+def stellated_dodecahedron_build():
+    return 1e3 * best_time(lambda: StellatedDodecahedronBuilder.build_from_keys(
+        ALL_DODECAHEDRON_KEYS, cache=None
+    ), number=100)
+
+@benchmark('stellated dodecahedron welded build', 'ms')
+def stellated_dodecahedron_welded_build():
+    return 1e3 * best_time(lambda: StellatedDodecahedronBuilder.build_from_keys(
+        ALL_DODECAHEDRON_KEYS, cache=None, weld=True, drop_interior=True
+    ))
+
+@benchmark('stellated icosahedron build', 'ms')
+def stellated_icosahedron_build():
+    return 1e3 * best_time(lambda: StellatedIcosahedronBuilder.build_from_notation(
+        'H', weld=True
+    ), number=20)
+
+@benchmark('plane intersections', 'ms')
+def plane_intersections():
+    # all the vertices of the arrangement of 60 planes tangent to the unit
+    # sphere, spread evenly over it (a Fibonacci lattice)
+    k = np.arange(60) + 0.5
+    z = 1.0 - 2.0 * k / len(k)
+    angle = np.pi * (1.0 + np.sqrt(5.0)) * k
+    normals = np.column_stack([
+        np.sqrt(1.0 - z * z) * np.cos(angle), np.sqrt(1.0 - z * z) * np.sin(angle), z
+    ])
+    distances = np.ones(len(k))
+    return 1e3 * best_time(
+        lambda: unique_points(plane_points(normals, distances)[1]), number=10
+    )
+
+@benchmark('polyhedron mesh build', 'ms')
+def polyhedron_mesh_build():
+    # from scratch: the cached unit geometry is discarded before each build
+    def build():
+        for cls in (Dodecahedron, SmallTriambicIcosahedron):
+            polyhedron._unit_geometry.pop(cls, None)
+            cls().mesh
+    return 1e3 * best_time(build, number=100)
+
+@benchmark('stellated dodecahedron batch', 'meshes/s', higher_is_better=True)
+def stellated_dodecahedron_batch():
+    key_sets = all_stellation_keys()
+    def build():
+        for keys in key_sets:
+            StellatedDodecahedronBuilder.build_from_keys(keys, cache=None)
+    return len(key_sets) / best_time(build, number=10)
+
+@benchmark('stellated dodecahedron batch peak memory', 'KiB')
+def stellated_dodecahedron_batch_memory():
+    tracemalloc.start()
+    for keys in all_stellation_keys():
+        StellatedDodecahedronBuilder.build_from_keys(keys, cache=None)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 2**10
+
+@benchmark('rotations startup', 'ms')
+def rotations_startup():
+    return 1e3 * startup_time(
+        'from stellations.stellated_dodecahedra.rotations import get_rotations;'
+        'get_rotations()'
+    )
+
+@benchmark('stellation regions startup', 'ms')
+def stellation_regions_startup():
+    return 1e3 * startup_time(
+        'from stellations.stellated_dodecahedra.stellation_regions import '
+        'get_stellation_regions; get_stellation_regions()'
+    )
+
+@benchmark('STL write', 'Mtriangles/s', higher_is_better=True)
+def stl_write():
+    copies = Dodecahedron.copies(range(1, 1001))
+    vertices, faces = Dodecahedron.combined(copies)
+    with tempfile.TemporaryDirectory() as directory:
+        file = os.path.join(directory, 'benchmark.stl')
+        return 1e-6 * len(faces) / best_time(
+            lambda: write_stl(file, vertices, faces)
+        )
+
+def run(names=None):
+    results = {}
+    for name, (function, unit, higher_is_better) in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        results[name] = {
+            'value': function(), 'unit': unit,
+            'higher_is_better': higher_is_better
+        }
+    return results
+
+def regressions(results, baseline, threshold=THRESHOLD):
+    """
+    Names of the results worse than the baseline by more than threshold, as
+    a fraction of the baseline.
+    """
+    worse = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result['value'] / baseline[name]['value']
+        if result['higher_is_better']:
+            ratio = 1.0 / ratio
+        if ratio > 1.0 + threshold:
+            worse.append(name)
+    return worse
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--save', action='store_true', help="save the results as the baseline")
+    parser.add_argument('--threshold', type=float, default=THRESHOLD)
+    parser.add_argument('names', nargs='*', help="benchmarks to run (default all)")
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE) as f:
+            baseline = json.load(f)
+
+    results = run(args.names)
+    for name, result in results.items():
+        line = f"{name}: {result['value']:.3f}{result['unit']}"
+        if name in baseline:
+            line += f" (baseline {baseline[name]['value']:.3f}{result['unit']})"
+        print(line)
+
+    if args.save:
+        with open(BASELINE_FILE, 'w') as f:
+            json.dump({**baseline, **results}, f, indent=2)
+            f.write('\n')
+        print(f"Saved baseline to {BASELINE_FILE}")
+        return
+
+    if not baseline:
+        print(f"No baseline in {BASELINE_FILE}; record one with --save")
+        return
+
+    worse = regressions(results, baseline, args.threshold)
+    if worse:
+        print(f"Regressed by more than {args.threshold:.0%}: {', '.join(worse)}")
+        sys.exit(1)
+
+if __name__=='__main__':
+    main()
@@ -0,0 +1,153 @@
+"""
+A catalogue packs the vertex and face arrays of many solids into a single
+file which readers memory-map, so that any solid is found in O(1) and its
+arrays read in place, with nothing to parse but a small header.
+Layout:
+    MAGIC                       8 bytes
+    header length               uint64, little-endian
+    header                      UTF-8 JSON, padded with spaces to ALIGNMENT
+    data                        for each solid, its vertices (little-endian
+                                float64, shape (n, 3)) then its faces
+                                (little-endian int32, shape (m, 3)), each
+                                starting on a multiple of ALIGNMENT bytes
+The header holds a list of entries, one per solid, with its name, family
+(the kind of solid), stellation keys (or None; see canonical_keys), bounding box, vertex and
+face counts and the offsets of its arrays from the start of the data.
+"""
+import json
+import os
+import os.path
+import numpy as np
+
+MAGIC = b'POLYCAT1'
+ALIGNMENT = 64
+
+VERTEX_DTYPE = np.dtype('<f8')
+FACE_DTYPE = np.dtype('<i4')
+
+def _aligned(size):
+    return -(-size // ALIGNMENT) * ALIGNMENT
+
+def canonical_keys(keys):
+    """
+    The form in which stellation keys are stored and compared: a string (a
+    notation) or None as it is, any other collection of keys as a sorted
+    list, so that the order and type of the collection don't matter.
+    """
+    if keys is None or isinstance(keys, str):
+        return keys
+    return sorted(keys)
+
+def write_catalogue(file, solids):
+    """
+    Write a catalogue of solids, an iterable of dictionaries with name,
+    vertices and faces and optionally family and keys (a string or a
+    collection of strings; see canonical_keys), to file. Names must be
+    distinct.
+    """
+    entries = []
+    arrays = []
+    offset = 0
+    for solid in solids:
+        vertices = np.ascontiguousarray(solid['vertices'], dtype=VERTEX_DTYPE)
+        faces = np.ascontiguousarray(solid['faces'], dtype=FACE_DTYPE)
+        if len(vertices):
+            bounds = [vertices.min(axis=0).tolist(), vertices.max(axis=0).tolist()]
+        else:
+            bounds = None
+        entry = {
+            'name': solid['name'], 'family': solid.get('family'),
+            'keys': canonical_keys(solid.get('keys')), 'bounds': bounds,
+            'n_vertices': len(vertices), 'n_faces': len(faces),
+            'vertex_offset': offset
+        }
+        offset = _aligned(offset + vertices.nbytes)
+        entry['face_offset'] = offset
+        offset = _aligned(offset + faces.nbytes)
+        entries.append(entry)
+        arrays.append((entry['vertex_offset'], vertices))
+        arrays.append((entry['face_offset'], faces))
+
+    names = [entry['name'] for entry in entries]
+    if len(set(names)) != len(names):
+        raise ValueError("Catalogue names must be distinct")
+
+    header = json.dumps({'entries': entries}).encode()
+    start = _aligned(len(MAGIC) + 8 + len(header))
+    header = header.ljust(start - len(MAGIC) - 8)
+
+    directory = os.path.dirname(file)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(file, 'wb') as f:
+        f.write(MAGIC)
+        f.write(len(header).to_bytes(8, 'little'))
+        f.write(header)
+        for array_offset, array in arrays:
+            f.seek(start + array_offset)
+            f.write(memoryview(array))
+        # pad the last array out to its alignment
+        f.truncate(start + offset)
+
+class Catalogue:
+    """
+    Read-only view of a catalogue file. catalogue[name] is the (vertices,
+    faces) of the solid called name, as arrays mapped from the file (so
+    copy them before modifying, or to keep them after closing).
+    """
+
+    def __init__(self, file):
+        with open(file, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{file} is not a catalogue")
+            length = int.from_bytes(f.read(8), 'little')
+            header = json.loads(f.read(length))
+        self.file = file
+        self.entries = {entry['name']: entry for entry in header['entries']}
+        start = len(MAGIC) + 8 + length
+        size = os.path.getsize(file)
+        self._data = (
+            np.memmap(file, dtype=np.uint8, mode='r', offset=start)
+            if size > start else np.empty(0, dtype=np.uint8)
+        )
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __getitem__(self, name):
+        entry = self.entries[name]
+        return (
+            self._array(entry['vertex_offset'], entry['n_vertices'], VERTEX_DTYPE),
+            self._array(entry['face_offset'], entry['n_faces'], FACE_DTYPE)
+        )
+
+    def _array(self, offset, rows, dtype):
+        nbytes = 3 * rows * dtype.itemsize
+        return self._data[offset:offset + nbytes].view(dtype).reshape(rows, 3)
+
+    def find(self, family=None, keys=None):
+        """
+        Names of the solids of the given family and/or stellation keys, in
+        any order.
+        """
+        keys = canonical_keys(keys)
+        return [
+            name for name, entry in self.entries.items()
+            if (family is None or entry['family'] == family)
+            and (keys is None or entry['keys'] == keys)
+        ]
+
+    def close(self):
+        self._data = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,193 @@
+import os
+import os.path
+import queue
+import threading
+import numpy as np
+import trimesh
+from common import profiling
+from common.stl import write_stl
+
+# Root directory for exported files. Each family of solids gets its own
+# subdirectory, named after its default directory (platonic/,
+# stellated_dodecahedra/, ...), as names are reused between families; files
+# then go in a subdirectory per format (stl/, ply/, ...). If unset, each
+# caller uses its own default, normally the directory of the module defining
+# the solid.
+OUTPUT_DIR = os.environ.get('POLYHEDRA_OUTPUT_DIR')
+
+# one binary PLY face record: vertex count and three vertex indices
+PLY_FACE_DTYPE = np.dtype([('count', 'u1'), ('vertices', '<i4', (3,))])
+
+def get_output_dir(default=None):
+    """
+    Directory for the files of the family of solids whose default directory
+    is default: default itself, or if an output directory is set, the
+    subdirectory of it named like default.
+    """
+    if OUTPUT_DIR is None:
+        return default
+    if default is None:
+        return OUTPUT_DIR
+    return os.path.join(OUTPUT_DIR, os.path.basename(os.path.normpath(default)))
+
+def set_output_dir(path):
+    """
+    Export everything under path, or to each caller's default if path is
+    None.
+    """
+    global OUTPUT_DIR
+    OUTPUT_DIR = path
+
+def output_file(name, format, default_dir=None):
+    """
+    Path of the file for the solid called name in the given format, under
+    the output directory of the family with default directory default_dir
+    (see get_output_dir).
+    """
+    root = get_output_dir(default_dir)
+    if root is None:
+        raise ValueError("No output directory set")
+    return os.path.join(root, format, f"{name}.{format}")
+
+def write_ply(file, vertices, faces):
+    """
+    Write the mesh (vertices, faces) to file as binary PLY. Unlike STL this
+    is indexed, so each vertex is stored once.
+    """
+    header = (
+        "ply\n"
+        "format binary_little_endian 1.0\n"
+        f"element vertex {len(vertices)}\n"
+        "property float x\nproperty float y\nproperty float z\n"
+        f"element face {len(faces)}\n"
+        "property list uchar int vertex_indices\n"
+        "end_header\n"
+    )
+    records = np.empty(len(faces), dtype=PLY_FACE_DTYPE)
+    records['count'] = 3
+    records['vertices'] = faces
+    with open(file, 'wb') as f:
+        f.write(header.encode('ascii'))
+        f.write(memoryview(np.ascontiguousarray(vertices, dtype='<f4')))
+        f.write(memoryview(records))
+
+def write_obj(file, vertices, faces):
+    """
+    Write the mesh (vertices, faces) to file as Wavefront OBJ.
+    """
+    with open(file, 'w') as f:
+        np.savetxt(f, vertices, fmt='v %.9g %.9g %.9g')
+        # OBJ indices count from 1
+        np.savetxt(f, np.asarray(faces) + 1, fmt='f %d %d %d')
+
+def write_glb(file, vertices, faces):
+    """
+    Write the mesh (vertices, faces) to file as binary glTF.
+    """
+    mesh = trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+    with open(file, 'wb') as f:
+        f.write(trimesh.exchange.gltf.export_glb(mesh))
+
+def write_npz(file, vertices, faces):
+    """
+    Write the vertex and face arrays to file as compressed npz, for
+    reloading with read_npz.
+    """
+    with open(file, 'wb') as f:
+        np.savez_compressed(f, vertices=vertices, faces=faces)
+
+def read_npz(file):
+    """
+    The vertex and face arrays saved by write_npz.
+    """
+    with np.load(file) as arrays:
+        return arrays['vertices'], arrays['faces']
+
+# writers by format, which is also the file extension
+FORMATS = {
+    'stl': write_stl,
+    'ply': write_ply,
+    'obj': write_obj,
+    'glb': write_glb,
+    'npz': write_npz
+}
+
+def export_mesh(file, vertices, faces, format=None):
+    """
+    Write the mesh (vertices, faces) to file, in the format given by its
+    extension unless format is given, creating its directory if necessary.
+    """
+    if format is None:
+        format = os.path.splitext(file)[1][1:].lower()
+    try:
+        write = FORMATS[format]
+    except KeyError:
+        raise ValueError(f"Unsupported export format {format!r}")
+    directory = os.path.dirname(file)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with profiling.stage(f'export {format}'):
+        write(file, vertices, faces)
+
+class ExportQueue:
+    """
+    Write-behind queue: put() hands a mesh to a background thread which
+    writes it with export_mesh, so building the next mesh overlaps with
+    writing the last. At most maxsize meshes wait at once; put() blocks
+    while the queue is full. The arrays passed to put() must not be
+    modified afterwards.
+    Use as a context manager, which waits for every write to finish on exit
+    and re-raises the first error from a write, if any, unless the block
+    itself raised:
+        with ExportQueue() as exports:
+            for ...:
+                exports.put(file, vertices, faces)
+    """
+
+    def __init__(self, maxsize=8):
+        self._queue = queue.Queue(maxsize)
+        self._error = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                if self._error is None:
+                    export_mesh(*item)
+            except Exception as error:
+                self._error = error
+            finally:
+                self._queue.task_done()
+
+    def put(self, file, vertices, faces, format=None):
+        if self._error is not None:
+            raise self._error
+        self._queue.put((file, vertices, faces, format))
+
+    def _stop(self):
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+    def close(self):
+        """
+        Wait for every queued write, then stop the thread, raising the first
+        error from a write, if any.
+        """
+        self._stop()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            # don't replace the exception already on its way out
+            self._stop()
@@ -0,0 +1,90 @@
+"""
+The planes of the faces of a polyhedron centred on the origin, in which
+stellation diagrams are drawn: the isometry between R^2 and one face plane,
+and the lifting of polygons drawn there onto every face.
+"""
+import itertools
+import numpy as np
+from common import profiling
+
+# I think I could remove from_xy and to_xy using
+# https://trimsh.org/trimesh.geometry.html#trimesh.geometry.plane_transform
+class FacePlaneTransform:
+    """
+    Isometry between R^2 and the plane of a face of a polyhedron centred on
+    the origin, calibrated such that the origin of R^2 corresponds to the
+    midpoint of the face. The x-axis of R^2 is sent to the direction of
+    x_axis (projected into the plane), and the y-axis is chosen so that
+    polygons which are anticlockwise in R^2 have normals pointing away from
+    the origin.
+    """
+
+    def __init__(self, midpoint, x_axis):
+        self.midpoint = np.asarray(midpoint, dtype=float)
+        normal = self.midpoint / np.linalg.norm(self.midpoint)
+        x = x_axis - np.dot(x_axis, normal) * normal
+        x /= np.linalg.norm(x)
+        # rows are the images of the x- and y-axes and the outward normal
+        self.R = np.array([x, np.cross(normal, x), normal])
+
+    def to_xy(self, points):
+        """
+        Map points of shape (..., 3) to the plane, returning shape (..., 2).
+        """
+        return ((np.asarray(points) - self.midpoint) @ self.R.T)[..., :2]
+
+    def from_xy(self, points):
+        """
+        Map points of shape (..., 2) into the face plane, returning shape
+        (..., 3).
+        """
+        return np.asarray(points) @ self.R[:2] + self.midpoint
+
+def polygon_faces(n_vertices):
+    """
+    Triangle indices, local to a single convex polygon with n_vertices
+    vertices, for a fan about its first vertex. The triangles are wound in
+    the same direction as the polygon.
+    """
+    return np.array([[0, i, i + 1] for i in range(1, n_vertices - 1)])
+
+def orbit_arrays(regions, transform, rotations):
+    """
+    Vertex and face arrays of the convex polygons regions (shape (n, 2), in
+    the coordinates of transform) lifted into the face plane and mapped to
+    every face by rotations (shape (k, 3, 3)), as a soup of separate
+    polygons. Each polygon is a fan of triangles wound like it, so
+    anticlockwise polygons face away from the origin and clockwise ones
+    towards it.
+    Consecutive regions with the same number of vertices are lifted, rotated
+    and triangulated together as one batch, so the work is a handful of
+    array operations rather than one small mesh per polygon.
+    """
+    vertices = []
+    faces = []
+    n_vertices = 0
+
+    for n, group in itertools.groupby(regions, key=len):
+        group = np.array(list(group)) # shape (r, n, 2)
+        # map the points to the face plane, then to each face; shape
+        # (r, k, n, 3), flattened to one polygon per row
+        with profiling.stage('from_xy'):
+            group_3d = transform.from_xy(group)
+        with profiling.stage('rotate'):
+            polygons = np.einsum(
+                'kij,rnj->rkni', rotations, group_3d
+            ).reshape(-1, n, 3)
+
+        # the triangles of each polygon, offset by the position of the
+        # polygon's first vertex
+        offsets = n_vertices + n * np.arange(len(polygons))
+        group_faces = offsets[:, None, None] + polygon_faces(n)
+
+        vertices.append(polygons.reshape(-1, 3))
+        faces.append(group_faces.reshape(-1, 3))
+        n_vertices += n * len(polygons)
+
+    if not vertices:
+        return np.empty((0, 3)), np.empty((0, 3), dtype=np.int64)
+
+    return np.concatenate(vertices), np.concatenate(faces)
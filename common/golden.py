@@ -0,0 +1,151 @@
+"""
+Exact arithmetic in Z[φ], the numbers a + bφ with a and b integers, where
+φ = (1 + √5) / 2 is the golden ratio. A number is stored as the pair (a, b)
+in the last axis of an int64 array, so operations are vectorised over the
+other axes. Division is avoided: points with coordinates in Q(√5) are kept
+as integer numerators over a common integer denominator, reduced to a
+canonical form (see rational_points) so that equal points have equal
+integer rows, which can be compared and hashed exactly. Coordinates stay
+small for the solids here; nothing guards against int64 overflow.
+"""
+import numpy as np
+
+# golden ratio
+φ = (1.0 + np.sqrt(5.0)) / 2.0
+
+def golden(a, b=0):
+    """
+    The numbers a + bφ, for integer arrays a and b of the same shape.
+    """
+    return np.stack(np.broadcast_arrays(a, b), axis=-1).astype(np.int64)
+
+def mul(x, y):
+    """
+    Product of x and y, using φ^2 = φ + 1.
+    """
+    a, b = x[..., 0], x[..., 1]
+    c, d = y[..., 0], y[..., 1]
+    return golden(a * c + b * d, a * d + b * c + b * d)
+
+def conjugate(x):
+    """
+    Galois conjugate, sending φ to 1 - φ (and √5 to -√5).
+    """
+    a, b = x[..., 0], x[..., 1]
+    return golden(a + b, -b)
+
+def norm(x):
+    """
+    The integer x times its conjugate.
+    """
+    a, b = x[..., 0], x[..., 1]
+    return a * a + a * b - b * b
+
+def sign(x):
+    """
+    Sign of x as a real number: -1, 0 or 1.
+    """
+    # x = (p + q√5) / 2
+    p = 2 * x[..., 0] + x[..., 1]
+    q = x[..., 1]
+    # where p and q differ in sign, the larger of |p| and √5|q| wins (they
+    # are never equal unless both are zero)
+    return np.where(
+        (np.sign(p) == np.sign(q)) | (p * p > 5 * q * q), np.sign(p), np.sign(q)
+    )
+
+def is_zero(x):
+    return np.all(x == 0, axis=-1)
+
+def to_float(x):
+    return x[..., 0] + φ * x[..., 1]
+
+def dot(x, y):
+    """
+    Dot product of vectors in the second-last axis of x and y.
+    """
+    return mul(x, y).sum(axis=-2)
+
+def cross(x, y):
+    """
+    Cross product of 3-vectors in the second-last axis of x and y.
+    """
+    x0, x1, x2 = (x[..., i, :] for i in range(3))
+    y0, y1, y2 = (y[..., i, :] for i in range(3))
+    return np.stack([
+        mul(x1, y2) - mul(x2, y1),
+        mul(x2, y0) - mul(x0, y2),
+        mul(x0, y1) - mul(x1, y0)
+    ], axis=-2)
+
+def det3(m):
+    """
+    Determinant of the 3x3 matrices in axes -3 and -2 of m.
+    """
+    return dot(m[..., 0, :, :], cross(m[..., 1, :, :], m[..., 2, :, :]))
+
+def rational_points(numerators, denominators):
+    """
+    Canonical form of the points numerators / denominators, for numerators
+    of shape (m, 3, 2) and non-zero denominators of shape (m, 2): integer
+    rows [a0, b0, a1, b1, a2, b2, n] of shape (m, 7), meaning the point with
+    coordinates (ai + biφ) / n, with n > 0 and the greatest common divisor
+    of each row 1. Equal points give equal rows.
+    """
+    # multiplying through by the conjugate makes the denominator an integer
+    numerators = mul(numerators, conjugate(denominators)[:, None, :])
+    rows = np.concatenate([
+        numerators.reshape(-1, 6), norm(denominators)[:, None]
+    ], axis=1)
+    rows *= np.sign(rows[:, -1:])
+    divisors = np.gcd.reduce(rows, axis=1)
+    return rows // divisors[:, None]
+
+def point_numerators(points):
+    """
+    Split canonical points (shape (m, 7)) into Z[φ] numerators, shape
+    (m, 3, 2), and integer denominators, shape (m,).
+    """
+    return points[:, :6].reshape(-1, 3, 2), points[:, 6]
+
+def points_to_float(points):
+    numerators, denominators = point_numerators(points)
+    return to_float(numerators) / denominators[:, None]
+
+def plane_sides(points, normals, distances):
+    """
+    Sign of n . p - d for each of the canonical points p (shape (m, 7)) and
+    planes n . x = d (normals of shape (k, 3, 2), distances of shape
+    (k, 2)); shape (m, k). Zero exactly when the point is on the plane.
+    """
+    numerators, denominators = point_numerators(points)
+    # n . (num / den) - d has the sign of n . num - d den, as den > 0
+    values = (
+        dot(numerators[:, None], normals[None]) -
+        distances[None] * denominators[:, None, None]
+    )
+    return sign(values)
+
+def plane_intersections(normals, distances, planes):
+    """
+    The points where each triple of planes n . x = d meets, for exact
+    normals (shape (k, 3, 2)) and distances (shape (k, 2)) and index
+    triples planes (shape (m, 3)). Returns the canonical points (see
+    rational_points) of the triples meeting in a single point, and a mask
+    of those triples.
+    """
+    matrices = normals[planes] # shape (m, 3, 3, 2); rows are normals
+    right = distances[planes] # shape (m, 3, 2)
+    determinants = det3(matrices)
+    single = ~is_zero(determinants)
+    matrices, right, determinants = (
+        matrices[single], right[single], determinants[single]
+    )
+    # Cramer's rule: replace each column by the right hand side in turn
+    numerators = []
+    for column in range(3):
+        replaced = matrices.copy()
+        replaced[:, :, column] = right
+        numerators.append(det3(replaced))
+    numerators = np.stack(numerators, axis=1)
+    return rational_points(numerators, determinants), single
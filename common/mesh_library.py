@@ -0,0 +1,61 @@
+import numpy as np
+
+class MeshLibrary:
+    """
+    Named meshes packed into one contiguous vertex array and one face array,
+    with offset tables giving where each mesh's vertices and faces start.
+    Each mesh's faces index its own vertices from 0, so combining meshes is
+    a gather of slices and an offset of the face indices, with no new
+    geometry. The arrays are read-only.
+    """
+
+    def __init__(self, meshes):
+        """
+        meshes: dictionary of name: (vertices, faces).
+        """
+        self.index = {name: i for i, name in enumerate(meshes)}
+        vertices = [np.asarray(v, dtype=np.float64) for v, _ in meshes.values()]
+        faces = [np.asarray(f, dtype=np.int64) for _, f in meshes.values()]
+        self.vertex_offsets = np.cumsum([0] + [len(v) for v in vertices])
+        self.face_offsets = np.cumsum([0] + [len(f) for f in faces])
+        self.vertices = (
+            np.concatenate(vertices) if vertices else np.empty((0, 3))
+        ).reshape(-1, 3)
+        self.faces = (
+            np.concatenate(faces) if faces else np.empty((0, 3), dtype=np.int64)
+        ).reshape(-1, 3)
+        for array in (self.vertices, self.faces, self.vertex_offsets, self.face_offsets):
+            array.flags.writeable = False
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def gather(self, names):
+        """
+        Vertex and face arrays of the meshes under names, concatenated in
+        order. Raises KeyError for an unknown name.
+        """
+        indices = np.array([self.index[name] for name in names], dtype=np.int64)
+        vertex_starts = self.vertex_offsets[indices]
+        vertex_ends = self.vertex_offsets[indices + 1]
+        face_starts = self.face_offsets[indices]
+        face_ends = self.face_offsets[indices + 1]
+
+        # where each mesh's vertices start in the result
+        shifts = np.cumsum(
+            np.concatenate([[0], vertex_ends - vertex_starts])
+        )[:-1]
+        vertices = np.concatenate(
+            [self.vertices[a:b] for a, b in zip(vertex_starts, vertex_ends)] +
+            [np.empty((0, 3))]
+        )
+        faces = np.concatenate(
+            [
+                self.faces[a:b] + shift
+                for a, b, shift in zip(face_starts, face_ends, shifts)
+            ] + [np.empty((0, 3), dtype=np.int64)]
+        )
+        return vertices, faces
@@ -0,0 +1,149 @@
+import itertools
+import numpy as np
+import trimesh
+
+# distance below which vertices are considered coincident when welding
+WELD_TOLERANCE = 1e-8
+
+# offsets to half of the 26 neighbouring cells of a cell in a cubic grid;
+# the other half are covered by symmetry
+NEIGHBOUR_OFFSETS = np.array([
+    offset for offset in itertools.product((-1, 0, 1), repeat=3)
+    if offset > (0, 0, 0)
+])
+
+def weld_vertices(vertices, faces, tolerance=WELD_TOLERANCE):
+    """
+    Merge vertices lying within tolerance of one another. Vertices are hashed
+    into cubic cells of side tolerance, so only vertices in the same or
+    neighbouring cells are ever compared. Returns new vertex and face arrays;
+    faces which collapse under the merge are removed.
+    """
+    if len(vertices) == 0:
+        return vertices, faces
+
+    # merge vertices in the same cell, keeping the first as representative
+    cells, first, vertex_cell = np.unique(
+        np.floor(vertices / tolerance).astype(np.int64),
+        axis=0, return_index=True, return_inverse=True
+    )
+    vertex_cell = vertex_cell.reshape(-1)
+    points = vertices[first]
+
+    # pair up neighbouring cells whose representatives are within tolerance
+    index = {tuple(cell): i for i, cell in enumerate(cells)}
+    pairs = []
+    for offset in NEIGHBOUR_OFFSETS:
+        neighbours = np.array([
+            index.get(tuple(cell), -1) for cell in cells + offset
+        ])
+        i = np.flatnonzero(neighbours >= 0)
+        j = neighbours[i]
+        close = np.linalg.norm(points[i] - points[j], axis=1) <= tolerance
+        pairs.append(np.column_stack([i[close], j[close]]))
+    pairs = np.concatenate(pairs)
+
+    # label each connected set of cells by its smallest index
+    labels = np.arange(len(cells))
+    while len(pairs):
+        merged = labels.copy()
+        np.minimum.at(merged, pairs[:, 0], labels[pairs[:, 1]])
+        np.minimum.at(merged, pairs[:, 1], labels[pairs[:, 0]])
+        merged = merged[merged]
+        if np.array_equal(merged, labels):
+            break
+        labels = merged
+
+    kept, cell_vertex = np.unique(labels, return_inverse=True)
+    faces = cell_vertex.reshape(-1)[vertex_cell][faces]
+    collapsed = (
+        (faces[:, 0] == faces[:, 1]) |
+        (faces[:, 1] == faces[:, 2]) |
+        (faces[:, 2] == faces[:, 0])
+    )
+
+    return points[kept], faces[~collapsed]
+
+def winding_numbers(points, vertices, faces, chunk_size=256):
+    """
+    Generalised winding numbers of points (shape (m, 3)) with respect to the
+    triangle mesh (vertices, faces): the sum of the solid angles subtended by
+    the triangles, divided by 4π. This is about 1 inside and 0 outside a
+    closed outward-facing surface, and needs no connectivity, so it works on
+    unwelded triangle soup.
+    """
+    triangles = vertices[faces]
+    numbers = []
+    for start in range(0, len(points), chunk_size):
+        chunk = points[start:start + chunk_size]
+        # triangle vertices relative to each point; shape (m, f, 3, 3)
+        a, b, c = np.moveaxis(triangles[None] - chunk[:, None, None], 2, 0)
+        la, lb, lc = (np.linalg.norm(v, axis=-1) for v in (a, b, c))
+        # solid angle formula of Van Oosterom and Strackee
+        numerator = np.einsum('...i,...i', a, np.cross(b, c))
+        denominator = (
+            la * lb * lc +
+            np.einsum('...i,...i', a, b) * lc +
+            np.einsum('...i,...i', a, c) * lb +
+            np.einsum('...i,...i', b, c) * la
+        )
+        solid_angles = 2.0 * np.arctan2(numerator, denominator)
+        numbers.append(solid_angles.sum(axis=1) / (4.0 * np.pi))
+    if not numbers:
+        return np.empty(0)
+    return np.concatenate(numbers)
+
+def interior_faces(vertices, faces, offset=1e-6):
+    """
+    Boolean mask of the faces which are hidden inside the solid bounded by
+    the mesh: those for which a point just outside the face (offset along
+    its outward normal) is still enclosed by the rest of the mesh.
+    Assumes every face's normal points out of its own shell.
+    """
+    triangles = vertices[faces]
+    normals = np.cross(
+        triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0]
+    )
+    normals /= np.linalg.norm(normals, axis=1)[:, None]
+    outside = triangles.mean(axis=1) + offset * normals
+    return winding_numbers(outside, vertices, faces) >= 0.5
+
+def remove_unreferenced_vertices(vertices, faces):
+    """
+    Drop vertices not used by any face, renumbering faces to match.
+    """
+    used, faces = np.unique(faces, return_inverse=True)
+    return vertices[used], faces.reshape(-1, 3)
+
+def fan_triangles(polygons):
+    """
+    Triangle indices for convex polygons given as sequences of vertex
+    indices (not necessarily all the same length): a fan about the first
+    vertex of each, wound in the same direction as the polygon.
+    """
+    return np.array([
+        [polygon[0], polygon[i], polygon[i + 1]]
+        for polygon in polygons
+        for i in range(1, len(polygon) - 1)
+    ])
+
+def validate_closed(mesh):
+    """
+    Check that a mesh is closed and wound consistently with its faces facing
+    outward, raising ValueError if not.
+    """
+    if not mesh.is_watertight or not mesh.is_winding_consistent:
+        raise ValueError("Mesh is not closed and consistently wound")
+    if mesh.volume <= 0:
+        raise ValueError("Mesh is inside out")
+
+def validate_convex(mesh):
+    """
+    Check a mesh of a convex solid against the convex hull of its vertices,
+    raising ValueError if it is not closed, or if it is inside out or
+    encloses a different volume from the hull. Slow; for checking face
+    tables, not for every build.
+    """
+    hull = trimesh.convex.convex_hull(mesh.vertices)
+    if not mesh.is_watertight or not np.isclose(mesh.volume, hull.volume):
+        raise ValueError("Mesh does not match the convex hull of its vertices")
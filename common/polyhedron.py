@@ -0,0 +1,208 @@
+import abc
+import os.path
+import re
+import sys
+import numpy as np
+import trimesh
+from common.export import export_mesh, output_file
+from common.mesh_utils import fan_triangles, validate_closed, validate_convex
+
+# unit-radius (vertices, faces, triangles) for each Polyhedron subclass,
+# computed on first use
+_unit_geometry = {}
+
+class Polyhedron(abc.ABC):
+    """
+    Base class for solids centred on the origin, scaled by radius.
+    Subclasses give the geometry of the unit solid by overriding
+    unit_vertices() (shape (n, 3)) and unit_faces() (sequences of indices
+    into the vertices, wound anticlockwise seen from outside). These are
+    called once per class; each instance scales the result once, and its
+    vertices, faces, triangles and mesh are read-only and cached, so many
+    instances or repeated exports cost almost nothing. Non-convex subclasses
+    set convex to False.
+    """
+
+    __slots__ = ('radius', '_vertices', '_mesh')
+
+    convex = True
+
+    def __init__(self, radius=1):
+        self.radius = radius
+        self._vertices = None
+        self._mesh = None
+
+    @staticmethod
+    @abc.abstractmethod
+    def unit_vertices():
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    def unit_faces():
+        pass
+
+    @classmethod
+    def unit_geometry(cls):
+        """
+        Read-only vertices, faces (as tuples) and triangle indices of the
+        unit solid, shared by all instances of the class.
+        """
+        geometry = _unit_geometry.get(cls)
+        if geometry is None:
+            vertices = np.array(cls.unit_vertices(), dtype=float)
+            faces = tuple(tuple(face) for face in cls.unit_faces())
+            triangles = fan_triangles(faces)
+            vertices.flags.writeable = False
+            triangles.flags.writeable = False
+            geometry = _unit_geometry[cls] = (vertices, faces, triangles)
+        return geometry
+
+    @property
+    def vertices(self):
+        if self._vertices is None:
+            unit_vertices = self.unit_geometry()[0]
+            if self.radius == 1:
+                self._vertices = unit_vertices
+            else:
+                self._vertices = self.radius * unit_vertices
+                self._vertices.flags.writeable = False
+        return self._vertices
+
+    @property
+    def faces(self):
+        return self.unit_geometry()[1]
+
+    @property
+    def triangles(self):
+        """
+        Triangle indices into vertices: a fan over each face.
+        """
+        return self.unit_geometry()[2]
+
+    @property
+    def mesh(self):
+        """
+        Triangle mesh of the solid, built on first use and shared thereafter;
+        copy it before modifying it.
+        """
+        if self._mesh is None:
+            self._mesh = self._build_mesh()
+        return self._mesh
+
+    def _build_mesh(self):
+        return trimesh.Trimesh(
+            vertices=self.vertices, faces=self.triangles, process=False
+        )
+
+    def validate(self):
+        """
+        Check that the mesh is closed and faces outward (see
+        validate_closed), and for convex solids that it matches the convex
+        hull of the vertices (see validate_convex), raising ValueError if
+        not.
+        """
+        validate_closed(self.mesh)
+        if self.convex:
+            validate_convex(self.mesh)
+
+    @classmethod
+    def name(cls):
+        """
+        Name of the solid in exported file names: the class name in
+        snake_case.
+        """
+        return re.sub(r'(?<!^)(?=[A-Z])', '_', cls.__name__).lower()
+
+    @classmethod
+    def default_output_dir(cls):
+        """
+        Directory of the module defining the class, where its files go if no
+        output directory is set.
+        """
+        module = sys.modules[cls.__module__]
+        return os.path.dirname(os.path.abspath(module.__file__))
+
+    def export(self, format='stl', file=None, queue=None):
+        """
+        Write the solid in the given format (see common.export.FORMATS) to
+        file, by default <output dir>/<format>/<name>.<format>, where the
+        output directory defaults to that of the module defining the class.
+        If queue (an ExportQueue) is given, the file is written in the
+        background. Returns the file.
+        """
+        if file is None:
+            file = output_file(self.name(), format, self.default_output_dir())
+        if queue is None:
+            export_mesh(file, self.vertices, self.triangles, format)
+        else:
+            queue.put(file, self.vertices, self.triangles, format)
+        return file
+
+    def to_stl(self, file=None):
+        return self.export('stl', file)
+
+    @classmethod
+    def copies(cls, radii=1, rotations=None, translations=None):
+        """
+        Vertices of copies of the solid, scaled by radii (shape (k,)), then
+        rotated by rotations (shape (k, 3, 3)) and translated by translations
+        (shape (k, 3)), all computed from the cached unit geometry in one
+        pass. Any argument may instead be given once for every copy. Returns
+        shape (k, n, 3); copy i is the view copies[i], which has the faces
+        and triangles of the solid.
+        """
+        unit_vertices = cls.unit_geometry()[0]
+        radii = np.asarray(radii, dtype=float)
+        transforms = radii[..., None, None] * (
+            np.identity(3) if rotations is None else np.asarray(rotations)
+        )
+        if translations is None:
+            translations = np.zeros(3)
+        transforms = transforms.reshape(-1, 3, 3)
+        translations = np.asarray(translations, dtype=float).reshape(-1, 3)
+        count = max(len(transforms), len(translations))
+        transforms = np.broadcast_to(transforms, (count, 3, 3))
+        translations = np.broadcast_to(translations, (count, 3))
+        return (
+            np.einsum('kij,nj->kni', transforms, unit_vertices) +
+            translations[:, None, :]
+        )
+
+    @classmethod
+    def combined(cls, copies):
+        """
+        Vertex and face arrays of a single mesh holding all of copies (as
+        returned by copies()).
+        """
+        triangles = cls.unit_geometry()[2]
+        offsets = copies.shape[1] * np.arange(len(copies))
+        faces = offsets[:, None, None] + triangles
+        return copies.reshape(-1, 3), faces.reshape(-1, 3)
+
+    @classmethod
+    def export_copies(cls, file, copies, format=None):
+        """
+        Write all of copies (as returned by copies()) to the one file.
+        """
+        export_mesh(file, *cls.combined(copies), format)
+
+    @classmethod
+    def export_sweep(cls, radii, format='stl', queue=None):
+        """
+        Write a copy of the solid for each of radii to its own file,
+        <output dir>/<format>/<name>_<radius>.<format>, in the background if
+        queue (an ExportQueue) is given. Returns the files.
+        """
+        triangles = cls.unit_geometry()[2]
+        files = []
+        for radius, vertices in zip(np.atleast_1d(radii), cls.copies(radii)):
+            file = output_file(
+                f"{cls.name()}_{radius:g}", format, cls.default_output_dir()
+            )
+            if queue is None:
+                export_mesh(file, vertices, triangles, format)
+            else:
+                queue.put(file, vertices, triangles, format)
+            files.append(file)
+        return files
@@ -0,0 +1,164 @@
+"""
+Opt-in timing of the stages of mesh generation. Code marks its stages with
+    with profiling.stage('weld'):
+        ...
+which does nothing unless profiling has been enabled, either by calling
+enable() or by setting the environment variable POLYHEDRA_PROFILE to the
+file to write the results to when the program exits: a Chrome trace (for
+chrome://tracing or Perfetto) if its name ends in .trace.json, else a JSON
+summary of the calls, wall time and allocated bytes for each stage.
+Allocations are measured with tracemalloc, which slows everything down, so
+only if POLYHEDRA_PROFILE_MEMORY is set or enable(memory=True) is called.
+Processes in a pool inherit the setting from the environment; pass their
+events back to the parent with take() and add().
+"""
+import atexit
+import contextlib
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+PROFILE_FILE = os.environ.get('POLYHEDRA_PROFILE')
+
+# the process which writes PROFILE_FILE, rather than any of its workers
+_OWNER_VARIABLE = 'POLYHEDRA_PROFILE_PID'
+
+_enabled = False
+_memory = False
+_events = []
+_lock = threading.Lock()
+_local = threading.local()
+
+# returned by stage() when profiling is off
+_NO_STAGE = contextlib.nullcontext()
+
+def enable(memory=False):
+    global _enabled, _memory
+    _enabled = True
+    _memory = memory
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+def disable():
+    global _enabled
+    _enabled = False
+
+def enabled():
+    return _enabled
+
+def stage(name):
+    """
+    Context manager timing the code it encloses as the named stage, if
+    profiling is enabled.
+    """
+    if not _enabled:
+        return _NO_STAGE
+    return _Stage(name)
+
+class _Stage:
+
+    __slots__ = ('name', 'start', 'memory')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        if _memory:
+            current, peak = tracemalloc.get_traced_memory()
+            # [allocated at the start, highest peak of the stages inside]
+            self.memory = [current, 0]
+            stack = getattr(_local, 'stack', None)
+            if stack is None:
+                stack = _local.stack = []
+            if stack:
+                stack[-1][1] = max(stack[-1][1], peak)
+            stack.append(self.memory)
+            tracemalloc.reset_peak()
+        self.start = time.perf_counter_ns()
+
+    def __exit__(self, *exc_info):
+        end = time.perf_counter_ns()
+        event = {
+            'name': self.name, 'start': self.start, 'duration': end - self.start,
+            'pid': os.getpid(), 'tid': threading.get_ident()
+        }
+        if _memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            _local.stack.pop()
+            start_bytes, inner_peak = self.memory
+            peak = max(peak, inner_peak)
+            event['bytes'] = peak - start_bytes
+            # the enclosing stage's peak includes this one's
+            if _local.stack:
+                _local.stack[-1][1] = max(_local.stack[-1][1], peak)
+        with _lock:
+            _events.append(event)
+
+def take():
+    """
+    The events recorded so far, which are then forgotten.
+    """
+    global _events
+    with _lock:
+        events, _events = _events, []
+    return events
+
+def add(events):
+    """
+    Record events taken from another process.
+    """
+    with _lock:
+        _events.extend(events)
+
+def summary():
+    """
+    Calls, total wall time in seconds and (if measured) the largest number
+    of bytes allocated at once, for each stage.
+    """
+    with _lock:
+        events = list(_events)
+    stages = {}
+    for event in events:
+        stats = stages.setdefault(event['name'], {'calls': 0, 'seconds': 0.0})
+        stats['calls'] += 1
+        stats['seconds'] += event['duration'] * 1e-9
+        if 'bytes' in event:
+            stats['bytes'] = max(stats.get('bytes', 0), event['bytes'])
+    return stages
+
+def chrome_trace():
+    """
+    The events in Chrome's trace event format.
+    """
+    with _lock:
+        events = list(_events)
+    return {'traceEvents': [
+        {
+            'name': event['name'], 'ph': 'X',
+            'ts': event['start'] / 1e3, 'dur': event['duration'] / 1e3,
+            'pid': event['pid'], 'tid': event['tid'],
+            'args': {'bytes': event['bytes']} if 'bytes' in event else {}
+        }
+        for event in events
+    ]}
+
+def write(file):
+    """
+    Write a Chrome trace to file if its name ends in .trace.json, else a
+    JSON summary.
+    """
+    report = chrome_trace() if file.endswith('.trace.json') else summary()
+    with open(file, 'w') as f:
+        json.dump(report, f, indent=2)
+        f.write('\n')
+
+def _write_profile_file():
+    if os.environ.get(_OWNER_VARIABLE) == str(os.getpid()):
+        write(PROFILE_FILE)
+
+if PROFILE_FILE:
+    enable(memory=bool(os.environ.get('POLYHEDRA_PROFILE_MEMORY')))
+    os.environ.setdefault(_OWNER_VARIABLE, str(os.getpid()))
+    atexit.register(_write_profile_file)
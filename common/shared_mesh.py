@@ -0,0 +1,146 @@
+"""
+Hand meshes built in worker processes back to the parent through shared
+memory. A worker copies its vertex and face arrays into a new
+multiprocessing.shared_memory block and returns only a SharedMesh
+descriptor (the block's name and the array lengths), so nothing but a few
+bytes is pickled however big the mesh; the parent attaches to the block and
+reads the arrays in place, then frees it:
+    with MeshPool() as pool:
+        for args in jobs:
+            pool.submit(args, build, *args) # build(*args) -> (vertices, faces)
+        for args, mesh in pool.results():
+            with mesh:
+                export_mesh(file, mesh.vertices, mesh.faces)
+Vertices are float64 and faces int64, laid out one after the other in the
+block.
+"""
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import resource_tracker, shared_memory
+import numpy as np
+
+VERTEX_DTYPE = np.dtype(np.float64)
+FACE_DTYPE = np.dtype(np.int64)
+
+class SharedMesh:
+    """
+    A mesh held in a shared memory block. Pickles to its descriptor only.
+    Use as a context manager to attach: inside the with block, vertices and
+    faces are views of the shared memory, without copying; on exit they are
+    set to None and the block is freed, so copy them to keep them.
+    """
+
+    __slots__ = ('name', 'n_vertices', 'n_faces', 'vertices', 'faces', '_block')
+
+    def __init__(self, name, n_vertices, n_faces):
+        self.name = name
+        self.n_vertices = n_vertices
+        self.n_faces = n_faces
+        self.vertices = None
+        self.faces = None
+        self._block = None
+
+    def __reduce__(self):
+        return SharedMesh, (self.name, self.n_vertices, self.n_faces)
+
+    @classmethod
+    def create(cls, vertices, faces):
+        """
+        Copy vertices (shape (n, 3)) and faces (shape (m, 3)) into a new
+        shared memory block, which stays allocated until the SharedMesh
+        returned is attached and detached, or freed with free().
+        """
+        vertices = np.asarray(vertices, dtype=VERTEX_DTYPE)
+        faces = np.asarray(faces, dtype=FACE_DTYPE)
+        block = shared_memory.SharedMemory(
+            create=True, size=max(1, vertices.nbytes + faces.nbytes)
+        )
+        mesh = cls(block.name, len(vertices), len(faces))
+        shared_vertices, shared_faces = mesh._views(block)
+        shared_vertices[...] = vertices
+        shared_faces[...] = faces
+        # the views must go before the block can be closed
+        del shared_vertices, shared_faces
+        block.close()
+        return mesh
+
+    def _views(self, block):
+        vertices = np.ndarray(
+            (self.n_vertices, 3), VERTEX_DTYPE, buffer=block.buf
+        )
+        faces = np.ndarray(
+            (self.n_faces, 3), FACE_DTYPE, buffer=block.buf,
+            offset=vertices.nbytes
+        )
+        return vertices, faces
+
+    def __enter__(self):
+        self._block = shared_memory.SharedMemory(self.name)
+        self.vertices, self.faces = self._views(self._block)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.vertices = self.faces = None
+        self._block.close()
+        self._block.unlink()
+        self._block = None
+
+    def free(self):
+        """
+        Free the block without reading it.
+        """
+        with self:
+            pass
+
+def _build_shared(build, args):
+    """
+    Worker for MeshPool: build the mesh and put it in shared memory.
+    """
+    vertices, faces = build(*args)
+    return SharedMesh.create(vertices, faces)
+
+class MeshPool:
+    """
+    Pool of processes (by default one per CPU) building meshes, which are
+    handed back through shared memory as SharedMesh objects. build functions
+    must be picklable (defined at module level) and return a pair (vertices,
+    faces). On exit, the blocks of any meshes not handed out by results()
+    are freed.
+    """
+
+    def __init__(self, processes=None):
+        # workers must share the parent's resource tracker, or each would
+        # unlink the blocks it made when it exits
+        resource_tracker.ensure_running()
+        self._executor = ProcessPoolExecutor(max_workers=processes)
+        self._futures = {}
+
+    def submit(self, tag, build, *args):
+        """
+        Build the mesh build(*args) in a worker; results() hands it back
+        paired with tag.
+        """
+        future = self._executor.submit(_build_shared, build, args)
+        self._futures[future] = tag
+
+    def results(self):
+        """
+        Generator of (tag, SharedMesh) for the meshes submitted, in order of
+        completion. The caller must attach (or free) each mesh to free its
+        block. Re-raises any error from a build.
+        """
+        for future in as_completed(list(self._futures)):
+            tag = self._futures.pop(future)
+            yield tag, future.result()
+
+    def close(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        for future in self._futures:
+            if not future.cancelled() and future.exception() is None:
+                future.result().free()
+        self._futures.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
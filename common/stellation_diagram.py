@@ -0,0 +1,208 @@
+import itertools
+import numpy as np
+from common import golden, profiling
+
+# coordinates agreeing to this tolerance are treated as equal
+TOLERANCE = 1e-9
+
+def stellation_diagram(normals, distances, transform):
+    """
+    The bounded regions of the stellation diagram of a polyhedron centred on
+    the origin with face planes n . x = d (rows of normals, entries of
+    distances), in the plane of one face. transform maps the xy-plane
+    isometrically onto that face plane via transform.from_xy. Returns a list
+    of anticlockwise (n, 2) arrays of vertices in xy-coordinates.
+    This needs no knowledge of the shape of the diagram: its vertices are
+    where the face plane meets pairs of the others (see plane_points), and
+    the regions are traced from which lines they lie on (see
+    trace_regions). For n faces it costs O(n^2 log n).
+    """
+    with profiling.stage('stellation diagram'):
+        # points of the face plane are origin + p @ axes
+        origin = transform.from_xy(np.zeros(2))
+        axes = transform.from_xy(np.identity(2)) - origin
+        normal = np.cross(axes[0], axes[1])
+
+        # only planes not parallel to the face plane meet it in a line
+        meets = np.linalg.norm(normals @ axes.T, axis=1) > TOLERANCE
+        normals, distances = normals[meets], distances[meets]
+
+        # the face plane is plane 0, the others follow
+        all_normals = np.vstack([normal, normals])
+        all_distances = np.concatenate([[normal @ origin], distances])
+        i, j = np.triu_indices(len(normals), 1)
+        triples = np.column_stack([np.zeros_like(i), i + 1, j + 1])
+        _, points = plane_points(all_normals, all_distances, triples)
+        # several lines may meet at a vertex
+        first, _ = unique_points(points)
+        points = points[first]
+
+        # planes through the same vertices meet the face plane in the same
+        # line
+        on_plane = np.abs(points @ normals.T - distances) < TOLERANCE ** 0.5
+        on_line = np.unique(on_plane, axis=1)
+
+        vertices = transform.to_xy(points)
+        return [vertices[cycle] for cycle in trace_regions(vertices, on_line)]
+
+def exact_stellation_diagram(normals, distances, face, transform, scale=1.0):
+    """
+    As stellation_diagram, with the face planes n . x = d given exactly in
+    Z[φ] (normals of shape (k, 3, 2), distances of shape (k, 2); see
+    common.golden), in the plane of the face with index face. The vertices
+    of the diagram, where that plane meets two others, and which lines they
+    lie on are found with exact arithmetic, so coincident vertices are
+    merged by exact comparison rather than a tolerance; floating point is
+    only used to order them. scale converts the exact coordinates to those
+    of transform.
+    Returns the regions as for stellation_diagram, and for each region the
+    exact points (see golden.rational_points) of its vertices.
+    """
+    with profiling.stage('exact stellation diagram'):
+        others = np.delete(np.arange(len(normals)), face)
+        i, j = np.triu_indices(len(others), 1)
+        triples = np.column_stack([np.full(len(i), face), others[i], others[j]])
+        points, _ = golden.plane_intersections(normals, distances, triples)
+        points = np.unique(points, axis=0)
+
+        # a plane not parallel to the face plane meets it in a line; planes
+        # through the same vertices meet it in the same line
+        parallel = golden.is_zero(golden.cross(normals[face], normals)).all(axis=1)
+        on_plane = golden.plane_sides(points, normals, distances) == 0
+        on_line = np.unique(on_plane[:, ~parallel], axis=1)
+
+        vertices = transform.to_xy(scale * golden.points_to_float(points))
+        cycles = trace_regions(vertices, on_line)
+        return [vertices[c] for c in cycles], [points[c] for c in cycles]
+
+def plane_lines(normals, distances):
+    """
+    The lines in which the planes n . x = d (rows of normals, entries of
+    distances) meet in pairs, for every pair at once. Returns the index pairs
+    (shape (m, 2)) of the planes which meet, parallel pairs being skipped,
+    the point of each line nearest the origin and its direction n_i x n_j.
+    """
+    i, j = np.triu_indices(len(normals), 1)
+    directions = np.cross(normals[i], normals[j])
+    lengths = np.linalg.norm(directions, axis=1)
+    meets = lengths > TOLERANCE
+    i, j, directions = i[meets], j[meets], directions[meets]
+    # d_i (n_j x u) + d_j (u x n_i) is on both planes and perpendicular to u
+    points = (
+        distances[i, None] * np.cross(normals[j], directions) +
+        distances[j, None] * np.cross(directions, normals[i])
+    ) / lengths[meets, None] ** 2
+    return np.column_stack([i, j]), points, directions
+
+def plane_points(normals, distances, triples=None):
+    """
+    The points where triples of the planes n . x = d meet: every triple, or
+    the index triples given (shape (m, 3)), all at once. Returns the triples
+    meeting in a single point, those with two planes parallel or all three
+    through a line being skipped, and the points. Several triples may give
+    the same point; see unique_points.
+    """
+    if triples is None:
+        triples = np.array(
+            list(itertools.combinations(range(len(normals)), 3)), dtype=np.int64
+        ).reshape(-1, 3)
+    n = normals[triples]
+    # row r of products is n_(r+1) x n_(r+2)
+    products = np.cross(n[:, [1, 2, 0]], n[:, [2, 0, 1]])
+    det = np.einsum('mi,mi->m', n[:, 0], products[:, 0])
+    meets = np.abs(det) > TOLERANCE
+    # Cramer's rule, in the form x = sum of d_r (n_(r+1) x n_(r+2)) / det
+    points = np.einsum(
+        'mr,mri->mi', distances[triples[meets]], products[meets]
+    ) / det[meets, None]
+    return triples[meets], points
+
+def unique_points(points, tolerance=TOLERANCE ** 0.5):
+    """
+    Merge the points (rows of points) agreeing to within tolerance, by
+    snapping them to a grid of that spacing and sorting the grid cells, so
+    that equal points are adjacent. Returns the index of the first point of
+    each group, in increasing order, and for each point the number of its
+    group. Points either side of a grid line may fail to merge, so tolerance
+    should be well above the error in the points and well below the distance
+    between distinct ones.
+    """
+    cells = np.round(points / tolerance).astype(np.int64)
+    # lexsort is stable, so each group starts with its first point
+    order = np.lexsort(cells.T[::-1])
+    cells = cells[order]
+    starts = np.ones(len(points), dtype=bool)
+    starts[1:] = np.any(cells[1:] != cells[:-1], axis=1)
+    first = order[starts]
+    # number the groups by their first point
+    by_first = np.argsort(first)
+    numbers = np.empty(len(first), dtype=np.int64)
+    numbers[by_first] = np.arange(len(first))
+    inverse = np.empty(len(points), dtype=np.int64)
+    inverse[order] = numbers[np.cumsum(starts) - 1]
+    return first[by_first], inverse
+
+def trace_regions(vertices, on_line):
+    """
+    The bounded regions of an arrangement of lines with the given vertices
+    (shape (m, 2)), where on_line[i, l] says whether vertex i is on line l,
+    as a list of arrays of vertex indices, anticlockwise.
+    Built with a half-edge structure: the edges join consecutive vertices
+    along each line, and each region is traced by repeatedly turning as far
+    right as possible (i.e. clockwise) at each vertex.
+    """
+    # edges join consecutive vertices along each line
+    edges = []
+    for line in on_line.T:
+        along = np.flatnonzero(line)
+        if len(along) < 2:
+            continue
+        direction = vertices[along[1]] - vertices[along[0]]
+        along = along[np.argsort(vertices[along] @ direction)]
+        edges.append(np.column_stack([along[:-1], along[1:]]))
+    if not edges:
+        return []
+    edges = np.concatenate(edges)
+
+    # half-edges: edge k is the half-edge k, its twin is k + len(edges)
+    half_edges = np.concatenate([edges, edges[:, ::-1]])
+    n_edges = len(edges)
+    twin = np.concatenate([np.arange(n_edges) + n_edges, np.arange(n_edges)])
+
+    # sort the half-edges leaving each vertex anticlockwise
+    direction = vertices[half_edges[:, 1]] - vertices[half_edges[:, 0]]
+    angle = np.arctan2(direction[:, 1], direction[:, 0])
+    order = np.lexsort((angle, half_edges[:, 0]))
+    rank = np.empty(len(half_edges), dtype=np.int64)
+    rank[order] = np.arange(len(half_edges))
+    start = np.searchsorted(half_edges[order, 0], np.arange(len(vertices)))
+    degree = np.bincount(half_edges[:, 0], minlength=len(vertices))
+
+    # the half-edge following u -> v around the region on its left leaves v
+    # just clockwise of v -> u
+    v = half_edges[:, 1]
+    following = order[start[v] + (rank[twin] - start[v] - 1) % degree[v]]
+
+    regions = []
+    visited = np.zeros(len(half_edges), dtype=bool)
+    for h in range(len(half_edges)):
+        cycle = []
+        while not visited[h]:
+            visited[h] = True
+            cycle.append(half_edges[h, 0])
+            h = following[h]
+        if not cycle:
+            continue
+        # the unbounded region is traced clockwise
+        if signed_area(vertices[cycle]) > TOLERANCE:
+            regions.append(np.array(cycle))
+
+    return regions
+
+def signed_area(polygon):
+    """
+    Area of the polygon with vertices the rows of polygon (shape (n, 2)),
+    positive if they are anticlockwise.
+    """
+    x, y = polygon.T
+    return 0.5 * np.sum(x * np.roll(y, -1) - np.roll(x, -1) * y)
@@ -0,0 +1,88 @@
+import numpy as np
+
+# one binary STL triangle record: normal, three vertices and a (here unused)
+# attribute byte count, little-endian and unpadded
+STL_DTYPE = np.dtype([
+    ('normal', '<f4', (3,)),
+    ('vertices', '<f4', (3, 3)),
+    ('attributes', '<u2')
+])
+
+HEADER_SIZE = 80
+
+# triangles converted and written at a time; bounds the memory used
+CHUNK_SIZE = 2**16
+
+class StlWriter:
+    """
+    Streams triangles into a binary STL file without building a mesh
+    object. Each call to write() converts its triangles a chunk at a time
+    into one reused buffer of STL records, so memory use is bounded by the
+    chunk size however many triangles are written; the triangle count
+    in the file's header is filled in on close(). Use as a context manager:
+        with StlWriter(file) as writer:
+            for vertices, faces in meshes:
+                writer.write(vertices, faces)
+    """
+
+    def __init__(self, file, header=b'', chunk_size=CHUNK_SIZE):
+        self.file = open(file, 'wb')
+        self.count = 0
+        self.chunk_size = chunk_size
+        self.buffer = np.zeros(0, dtype=STL_DTYPE)
+        self.file.write(header[:HEADER_SIZE].ljust(HEADER_SIZE, b'\0'))
+        self.file.write(np.array(0, dtype='<u4').tobytes())
+
+    def write(self, vertices, faces):
+        """
+        Append the triangles of the mesh (vertices, faces); vertices has
+        shape (n, 3) and faces (m, 3). Normals are computed from the
+        winding of each triangle.
+        """
+        # float, so that the normals can be normalised in place
+        vertices = np.asarray(vertices, dtype=float)
+        faces = np.asarray(faces)
+        # the buffer grows to fit the largest write, up to the chunk size
+        size = min(len(faces), self.chunk_size)
+        if len(self.buffer) < size:
+            self.buffer = np.zeros(size, dtype=STL_DTYPE)
+        for start in range(0, len(faces), self.chunk_size):
+            triangles = vertices[faces[start:start + self.chunk_size]]
+            records = self.buffer[:len(triangles)]
+            normals = np.cross(
+                triangles[:, 1] - triangles[:, 0],
+                triangles[:, 2] - triangles[:, 0]
+            )
+            lengths = np.linalg.norm(normals, axis=1)
+            # degenerate triangles get a zero normal
+            normals /= np.where(lengths > 0, lengths, 1.0)[:, None]
+            records['normal'] = normals
+            records['vertices'] = triangles
+            self.file.write(memoryview(records))
+        self.count += len(faces)
+
+    def close(self):
+        if self.file.closed:
+            return
+        self.file.seek(HEADER_SIZE)
+        self.file.write(np.array(self.count, dtype='<u4').tobytes())
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def write_stl(file, vertices, faces, chunk_size=CHUNK_SIZE):
+    """
+    Write the mesh (vertices, faces) to file as binary STL.
+    """
+    with StlWriter(file, chunk_size=chunk_size) as writer:
+        writer.write(vertices, faces)
+
+def read_stl(file):
+    """
+    The records of a binary STL file, as a memory-mapped array of STL_DTYPE.
+    """
+    return np.memmap(file, dtype=STL_DTYPE, mode='r', offset=HEADER_SIZE + 4)
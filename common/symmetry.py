@@ -0,0 +1,111 @@
+import functools
+import numpy as np
+
+# golden ratio
+φ = (1.0 + np.sqrt(5.0)) / 2.0
+
+# matrices whose entries agree to this tolerance are treated as equal
+TOLERANCE = 1e-6
+
+def rotation(axis, angle):
+    """
+    Matrix of the rotation by angle (anticlockwise, looking down the axis
+    towards the origin) about axis, which need not be a unit vector.
+    """
+    x, y, z = np.asarray(axis, dtype=float) / np.linalg.norm(axis)
+    K = np.array([
+        [0.0,  -z,   y],
+        [  z, 0.0,  -x],
+        [ -y,   x, 0.0]
+    ])
+    return np.identity(3) + np.sin(angle) * K + (1.0 - np.cos(angle)) * K @ K
+
+def _keys(arrays, tolerance):
+    """
+    Hashable keys for a stack of arrays, equal for arrays whose entries agree
+    to within tolerance (up to rounding at the boundaries of the grid).
+    """
+    rounded = np.round(arrays / tolerance).astype(np.int64)
+    # avoid distinct keys for +0 and -0 after rounding
+    rounded[rounded == 0] = 0
+    return [row.tobytes() for row in rounded.reshape(len(arrays), -1)]
+
+def generate_group(generators, tolerance=TOLERANCE):
+    """
+    The group generated by the given (n, 3, 3) matrices, as an array of shape
+    (order, 3, 3) starting with the identity. Built by closure: every element
+    found so far is multiplied by all the generators at once, and new
+    products are kept, until nothing new appears. Products are deduplicated
+    by hashing their entries rounded to tolerance.
+    """
+    generators = np.asarray(generators, dtype=float)
+    group = [np.identity(3)]
+    seen = set(_keys(np.array(group), tolerance))
+    frontier = np.array(group)
+    while len(frontier):
+        products = (generators[None] @ frontier[:, None]).reshape(-1, 3, 3)
+        new = []
+        for key, product in zip(_keys(products, tolerance), products):
+            if key not in seen:
+                seen.add(key)
+                new.append(product)
+        group += new
+        frontier = np.array(new)
+    return np.array(group)
+
+def _read_only(array):
+    array.flags.writeable = False
+    return array
+
+@functools.lru_cache(maxsize=None)
+def tetrahedral_group():
+    """
+    The 12 rotational symmetries of the regular tetrahedron with vertices
+    (1, 1, 1), (1, -1, -1), (-1, 1, -1), (-1, -1, 1).
+    """
+    return _read_only(generate_group([
+        rotation([1.0, 1.0, 1.0], 2.0 * np.pi / 3.0),
+        rotation([0.0, 0.0, 1.0], np.pi)
+    ]))
+
+@functools.lru_cache(maxsize=None)
+def octahedral_group():
+    """
+    The 24 rotational symmetries of the cube with vertices (±1, ±1, ±1).
+    """
+    return _read_only(generate_group([
+        rotation([1.0, 1.0, 1.0], 2.0 * np.pi / 3.0),
+        rotation([0.0, 0.0, 1.0], np.pi / 2.0)
+    ]))
+
+@functools.lru_cache(maxsize=None)
+def icosahedral_group():
+    """
+    The 60 rotational symmetries of the icosahedron with vertices the cyclic
+    permutations of (0, ±1, ±φ), or equivalently of the dodecahedron with
+    vertices (±1, ±1, ±1) and the cyclic permutations of (0, ±1/φ, ±φ).
+    """
+    return _read_only(generate_group([
+        rotation([1.0, 1.0, 1.0], 2.0 * np.pi / 3.0),
+        rotation([0.0, 1.0, φ], 2.0 * np.pi / 5.0)
+    ]))
+
+def orbit(group, points):
+    """
+    Images of points (shape (..., 3)) under every element of group, in one
+    batched product; shape (order, ..., 3).
+    """
+    points = np.asarray(points)
+    return np.einsum('kij,...j->k...i', group, points)
+
+def orbit_representatives(group, point, tolerance=TOLERANCE):
+    """
+    One element of group for each distinct image of point, namely the first
+    element (in the group's order) sending point there. For a point on an
+    axis of symmetry, such as a face midpoint, these send the corresponding
+    face to each face in its orbit.
+    """
+    first = {}
+    for i, key in enumerate(_keys(orbit(group, point), tolerance)):
+        first.setdefault(key, i)
+    return group[sorted(first.values())]
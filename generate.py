@@ -0,0 +1,288 @@
+"""
+Generate the solids listed in a manifest. Run from the repository root:
+    python -m generate manifest.toml [--processes N] [--output-dir DIR]
+    python -m generate manifest.toml --catalogue solids.cat
+The manifest (JSON, or TOML if its name ends in .toml) lists jobs, each
+naming a solid and optionally the radii and formats to write it in:
+    output_dir = "out"          # optional, relative to the manifest
+    [[jobs]]
+    solid = "cube"
+    radii = [1, 1.5, 2]
+    formats = ["stl", "ply"]
+    [[jobs]]
+    solid = "stellated_dodecahedron"
+    keys = [["first_shell"], ["base", "third_shell"]]
+    [[jobs]]
+    solid = "stellated_icosahedron"
+    keys = ["C", "Ef1'"]
+Solids are the names in SOLIDS; the stellations also take keys, a list of
+lists of region keys for the dodecahedron and of notations for the
+icosahedron. Radii default to [1] and formats to ["stl"]. Identical items
+are only made once.
+Items are built across a pool of processes and handed back through shared
+memory (see common.shared_mesh) to be written by this one.
+Progress is recorded in a state file next to the manifest, so an
+interrupted run picks up where it left off; --restart ignores it.
+With --catalogue, the formats are ignored and every distinct solid is packed
+into a single memory-mappable catalogue file instead (see common.catalogue).
+"""
+import argparse
+import json
+import os
+import os.path
+import sys
+import time
+from common.catalogue import write_catalogue
+from common.export import export_mesh, get_output_dir, set_output_dir
+from common.shared_mesh import MeshPool
+from misc.permutahedron import Permutahedron
+from platonic.cube import Cube
+from platonic.dodecahedron import Dodecahedron
+from platonic.icosahedron import Icosahedron
+from platonic.octahedron import Octahedron
+from platonic.tetrahedron import Tetrahedron
+from stellations.misc_stellations.small_triambic_icosahedron import SmallTriambicIcosahedron
+from stellations.misc_stellations.stella_octangula import StellaOctangula
+from stellations.stellated_dodecahedra import main as stellated_dodecahedra
+from stellations.stellated_dodecahedra.stellated_dodecahedron_builder import StellatedDodecahedronBuilder
+from stellations.stellated_icosahedra import main as stellated_icosahedra
+from stellations.stellated_icosahedra.stellated_icosahedron_builder import StellatedIcosahedronBuilder
+
+POLYHEDRA = {
+    cls.name(): cls for cls in (
+        Tetrahedron, Cube, Octahedron, Dodecahedron, Icosahedron,
+        Permutahedron, StellaOctangula, SmallTriambicIcosahedron
+    )
+}
+
+STELLATIONS = ('stellated_dodecahedron', 'stellated_icosahedron')
+
+SOLIDS = list(POLYHEDRA) + list(STELLATIONS)
+
+STATE_SUFFIX = '.state'
+
+def load_manifest(file):
+    if file.endswith('.toml'):
+        import tomllib
+        with open(file, 'rb') as f:
+            return tomllib.load(f)
+    with open(file) as f:
+        return json.load(f)
+
+def expand(manifest):
+    """
+    The distinct items (solid, key, radius, format) described by the jobs of
+    manifest, in order. key is None for solids without keys, a sorted tuple
+    of region keys for the stellated dodecahedron and a notation for the
+    stellated icosahedron.
+    """
+    items = {}
+    for job in manifest.get('jobs', []):
+        solid = job.get('solid')
+        if solid not in SOLIDS:
+            raise ValueError(f"Unknown solid {solid!r}")
+        if solid == 'stellated_dodecahedron':
+            keys = [tuple(sorted(keys)) for keys in job.get('keys', [])]
+        elif solid == 'stellated_icosahedron':
+            keys = list(job.get('keys', []))
+        else:
+            keys = [None]
+        for key in keys:
+            for radius in job.get('radii', [1]):
+                for format in job.get('formats', ['stl']):
+                    items[(solid, key, float(radius), format)] = None
+    return list(items)
+
+def item_name(solid, key, radius):
+    """
+    Name of an item: the name of the solid (or stellation), with the radius
+    appended unless it is 1.
+    """
+    if solid == 'stellated_dodecahedron':
+        name = stellated_dodecahedra.stellation_name(list(key))
+    elif solid == 'stellated_icosahedron':
+        name = stellated_icosahedra.stellation_name(key)
+    else:
+        name = solid
+    if radius != 1:
+        name = f"{name}_{radius:g}"
+    return name
+
+def item_file(item):
+    """
+    The file an item is written to: <output dir>/<format>/<name>.<format>,
+    the output directory being that of the solid's family (see
+    common.export.get_output_dir), by default the directory of the module
+    defining it.
+    """
+    solid, key, radius, format = item
+    if solid == 'stellated_dodecahedron':
+        default_dir = stellated_dodecahedra.OUTPUT_DIR
+    elif solid == 'stellated_icosahedron':
+        default_dir = stellated_icosahedra.OUTPUT_DIR
+    else:
+        default_dir = POLYHEDRA[solid].default_output_dir()
+    name = item_name(solid, key, radius)
+    return os.path.join(get_output_dir(default_dir), format, f"{name}.{format}")
+
+def build(solid, key, radius):
+    """
+    Vertex and face arrays of an item. Runs in a worker process.
+    """
+    if solid == 'stellated_dodecahedron':
+        mesh = StellatedDodecahedronBuilder.build_from_keys(list(key))
+        return radius * mesh.vertices, mesh.faces
+    elif solid == 'stellated_icosahedron':
+        mesh = StellatedIcosahedronBuilder.build_from_notation(key, weld=True)
+        return radius * mesh.vertices, mesh.faces
+    else:
+        solid = POLYHEDRA[solid](radius)
+        return solid.vertices, solid.triangles
+
+def state_key(item):
+    solid, key, radius, format = item
+    return json.dumps([solid, key, radius, format])
+
+def load_state(file):
+    """
+    The keys of the items recorded as done in the state file, if any.
+    """
+    if not os.path.exists(file):
+        return set()
+    with open(file) as f:
+        return {line.strip() for line in f if line.strip()}
+
+def progress(done, total, message):
+    line = f"[{done:>{len(str(total))}}/{total}] {message}"
+    if sys.stderr.isatty():
+        print(f"\r\033[K{line}", end='', file=sys.stderr, flush=True)
+    else:
+        print(line, file=sys.stderr)
+
+def run(manifest_file, processes=None, output_dir=None, restart=False):
+    """
+    Make every item of the manifest not already made, across a pool of
+    processes (by default one per CPU). output_dir, if given, is used as it
+    is and overrides the manifest's output_dir, which is relative to the
+    manifest; with neither, the output directory already set (see
+    common.export.OUTPUT_DIR) is used. Either is only in force until run()
+    returns. Returns the number of items made.
+    """
+    manifest = load_manifest(manifest_file)
+    if output_dir is None and manifest.get('output_dir') is not None:
+        output_dir = os.path.join(
+            os.path.dirname(os.path.abspath(manifest_file)),
+            manifest['output_dir']
+        )
+    previous_output_dir = get_output_dir()
+    if output_dir is not None:
+        set_output_dir(output_dir)
+    try:
+        return make(expand(manifest), manifest_file + STATE_SUFFIX, processes, restart)
+    finally:
+        set_output_dir(previous_output_dir)
+
+def make(items, state_file, processes=None, restart=False):
+    """
+    Make the items not recorded as done in state_file (all of them if
+    restart), recording each as it is written. Returns the number made.
+    """
+    if restart and os.path.exists(state_file):
+        os.remove(state_file)
+    done = load_state(state_file)
+    files = {}
+    for item in items:
+        file = item_file(item)
+        if file in files:
+            raise ValueError(
+                f"{state_key(files[file])} and {state_key(item)} would both "
+                f"be written to {file}"
+            )
+        files[file] = item
+    jobs = {
+        file: item for file, item in files.items()
+        if not (state_key(item) in done and os.path.exists(file))
+    }
+    print(
+        f"{len(items)} items, {len(items) - len(jobs)} already done",
+        file=sys.stderr
+    )
+
+    start = time.perf_counter()
+    finished = 0
+    # items differing only in format share one build
+    builds = {}
+    for file, item in jobs.items():
+        builds.setdefault(item[:3], []).append((file, item))
+    with open(state_file, 'a') as state, MeshPool(processes) as pool:
+        for solid_key_radius, writes in builds.items():
+            pool.submit(writes, build, *solid_key_radius)
+        for writes, mesh in pool.results():
+            with mesh:
+                for file, item in writes:
+                    export_mesh(file, mesh.vertices, mesh.faces, item[3])
+                    # recorded as soon as it is written, so an interruption
+                    # loses nothing finished
+                    state.write(state_key(item) + '\n')
+                    state.flush()
+                    finished += 1
+                    progress(finished, len(jobs), file)
+    if sys.stderr.isatty() and jobs:
+        print(file=sys.stderr)
+    print(
+        f"Made {finished} items in {time.perf_counter() - start:.3f}s",
+        file=sys.stderr
+    )
+    return finished
+
+def run_catalogue(manifest_file, file, processes=None):
+    """
+    Build every distinct solid of the manifest, whatever its formats, across
+    a pool of processes and pack them into the catalogue file, in manifest
+    order. Stellations are named <solid>/<name>, as the same name may be
+    used in both families and for a platonic solid. Returns the number of
+    solids.
+    """
+    builds = list(dict.fromkeys(
+        item[:3] for item in expand(load_manifest(manifest_file))
+    ))
+    start = time.perf_counter()
+    solids = {}
+    with MeshPool(processes) as pool:
+        for solid_key_radius in builds:
+            pool.submit(solid_key_radius, build, *solid_key_radius)
+        for (solid, key, radius), mesh in pool.results():
+            name = item_name(solid, key, radius)
+            if solid in STELLATIONS:
+                name = f"{solid}/{name}"
+            with mesh:
+                solids[solid, key, radius] = {
+                    'name': name, 'family': solid, 'keys': key,
+                    'vertices': mesh.vertices.copy(), 'faces': mesh.faces.copy()
+                }
+            progress(len(solids), len(builds), name)
+    if sys.stderr.isatty() and builds:
+        print(file=sys.stderr)
+    write_catalogue(file, [solids[solid_key_radius] for solid_key_radius in builds])
+    print(
+        f"Wrote {len(builds)} solids to {file} in "
+        f"{time.perf_counter() - start:.3f}s",
+        file=sys.stderr
+    )
+    return len(builds)
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the solids listed in a manifest")
+    parser.add_argument('manifest', help="JSON or TOML manifest of jobs")
+    parser.add_argument('--processes', type=int, help="worker processes (default one per CPU)")
+    parser.add_argument('--output-dir', help="root directory for the files written")
+    parser.add_argument('--restart', action='store_true', help="ignore the saved progress")
+    parser.add_argument('--catalogue', help="pack the solids into this catalogue file instead")
+    args = parser.parse_args()
+    if args.catalogue:
+        run_catalogue(args.manifest, args.catalogue, args.processes)
+    else:
+        run(args.manifest, args.processes, args.output_dir, args.restart)
+
+if __name__=='__main__':
+    main()
@@ -1,12 +1,12 @@
 import numpy as np
-import trimesh
+from common.polyhedron import Polyhedron
 
-class Permutahedron:
+class Permutahedron(Polyhedron):
 
-  def __init__(self, radius=1):
-    self.radius = radius
+  __slots__ = ()
 
-  def vertices(self):
+  @staticmethod
+  def unit_vertices():
     invsqrt2 = 1.0 / np.sqrt(2.0)
     unscaled = np.array([
       [ (1.0 / 3.0) * invsqrt2,  (1.0 / 3.0) * invsqrt2,  (2.0 / 3.0)],
@@ -34,11 +34,20 @@ class Permutahedron:
       [-(1.0 / 3.0) * invsqrt2,                invsqrt2,          0.0],
       [-(1.0 / 3.0) * invsqrt2,               -invsqrt2,          0.0]
     ])
-    return self.radius * (9.0 / 5.0) * unscaled
+    return (9.0 / 5.0) * unscaled
 
-  def mesh(self):
-    return trimesh.convex.convex_hull(self.vertices())
-
-  def to_stl(self):
-    self.mesh().export("stl/permutahedron.stl")
-    
\ No newline at end of file
+  @staticmethod
+  def unit_faces():
+    """
+    Indices into the vertices of the squares and hexagons bounding the solid,
+    each wound anticlockwise seen from outside.
+    """
+    return [
+      [0, 4, 6, 2], [1, 3, 7, 5],
+      [8, 16, 9, 20], [10, 21, 11, 17],
+      [12, 22, 13, 18], [14, 19, 15, 23],
+      [0, 2, 10, 17, 16, 8], [0, 8, 20, 22, 12, 4],
+      [1, 5, 13, 22, 20, 9], [1, 9, 16, 17, 11, 3],
+      [2, 6, 14, 23, 21, 10], [3, 11, 21, 23, 15, 7],
+      [4, 12, 18, 19, 14, 6], [5, 7, 15, 19, 18, 13]
+    ]
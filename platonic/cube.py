@@ -1,12 +1,12 @@
 import numpy as np
-import trimesh
+from common.polyhedron import Polyhedron
 
-class Cube:
+class Cube(Polyhedron):
 
-  def __init__(self, radius=1):
-    self.radius = radius
+  __slots__ = ()
 
-  def vertices(self):
+  @staticmethod
+  def unit_vertices():
     unscaled = np.array([
       [ 1.0,  1.0,  1.0],
       [ 1.0,  1.0, -1.0],
@@ -17,10 +17,16 @@ class Cube:
       [-1.0, -1.0,  1.0],
       [-1.0, -1.0, -1.0]
     ])
-    return self.radius * (1.0 / np.sqrt(3.0)) * unscaled
+    return (1.0 / np.sqrt(3.0)) * unscaled
 
-  def mesh(self):
-    return trimesh.convex.convex_hull(self.vertices())
-
-  def to_stl(self):
-    self.mesh().export("stl/cube.stl")
+  @staticmethod
+  def unit_faces():
+    """
+    Indices into the vertices of the squares bounding the solid, each wound
+    anticlockwise seen from outside.
+    """
+    return [
+      [0, 1, 5, 4], [0, 2, 3, 1],
+      [0, 4, 6, 2], [1, 3, 7, 5],
+      [2, 6, 7, 3], [4, 5, 7, 6]
+    ]
@@ -1,12 +1,12 @@
 import numpy as np
-import trimesh
+from common.polyhedron import Polyhedron
 
-class Dodecahedron:
+class Dodecahedron(Polyhedron):
 
-  def __init__(self, radius=1):
-    self.radius = radius
+  __slots__ = ()
 
-  def vertices(self):
+  @staticmethod
+  def unit_vertices():
     φ = (1.0 + np.sqrt(5.0)) / 2.0
     unscaled = np.array([
         [     1.0,      1.0,      1.0],
@@ -30,33 +30,22 @@ class Dodecahedron:
         [-1.0 / φ,      0.0,        φ],
         [-1.0 / φ,      0.0,       -φ],
     ])
-    return self.radius * (1.0 / np.sqrt(3.0)) * unscaled
+    return (1.0 / np.sqrt(3.0)) * unscaled
   
-  def face_midpoints(self):
-    faces = [
-      [0, 2, 8, 9, 16], 
-      [2, 6, 14, 16, 18], 
-      [2, 3, 9, 14, 15], 
-      [1, 3, 8, 9, 17], 
-      [0, 1, 8, 12, 13], 
-      [0, 4, 12, 16, 18], 
-      [4, 6, 10, 11, 18], 
-      [6, 7, 11, 14, 15], 
-      [3, 7, 15, 17, 19], 
-      [1, 5, 13, 17, 19], 
-      [4, 5, 10, 12, 13], 
-      [5, 7, 10, 11, 19]
+  @staticmethod
+  def unit_faces():
+    """
+    Indices into the vertices of the pentagons bounding the solid, each wound
+    anticlockwise seen from outside.
+    """
+    return [
+      [0, 16, 2, 9, 8], [2, 16, 18, 6, 14],
+      [2, 14, 15, 3, 9], [1, 8, 9, 3, 17],
+      [0, 8, 1, 13, 12], [0, 12, 4, 18, 16],
+      [4, 10, 11, 6, 18], [6, 11, 7, 15, 14],
+      [3, 15, 7, 19, 17], [1, 17, 19, 5, 13],
+      [4, 12, 13, 5, 10], [5, 19, 7, 11, 10]
     ]
-    midpoints = np.array([
-      self.vertices[face,:].mean(axis=0)
-    ])
-    return midpoints
-
-  def mesh(self):
-    return trimesh.convex.convex_hull(self.vertices())
 
-  def to_stl(self):
-    self.mesh().export("../stl/dodecahedron.stl")
-
-    
-    
\ No newline at end of file
+  def face_midpoints(self):
+    return self.vertices[np.array(self.faces)].mean(axis=1)
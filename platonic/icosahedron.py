@@ -1,12 +1,12 @@
 import numpy as np
-import trimesh
+from common.polyhedron import Polyhedron
 
-class Icosahedron:
+class Icosahedron(Polyhedron):
 
-  def __init__(self, radius=1):
-    self.radius = radius
+  __slots__ = ()
 
-  def vertices(self):
+  @staticmethod
+  def unit_vertices():
     φ = (1.0 + np.sqrt(5.0)) / 2.0
     unscaled = np.array([
         [ 1.0,    φ,  0.0],
@@ -22,16 +22,18 @@ class Icosahedron:
         [  -φ,  0.0,  1.0],
         [  -φ,  0.0, -1.0]
     ])
-    return self.radius * (1.0 / np.sqrt(1.0 + φ**2)) * unscaled
+    return (1.0 / np.sqrt(1.0 + φ**2)) * unscaled
 
-  def faces(self):
-    indices = [
-      []
+  @staticmethod
+  def unit_faces():
+    """
+    Indices into the vertices of the triangles bounding the solid, each wound
+    anticlockwise seen from outside.
+    """
+    return [
+      [0, 2, 4], [0, 5, 2], [0, 4, 8], [0, 9, 5],
+      [0, 8, 9], [1, 6, 3], [1, 3, 7], [1, 8, 6],
+      [1, 7, 9], [1, 9, 8], [2, 10, 4], [2, 5, 11],
+      [2, 11, 10], [3, 6, 10], [3, 11, 7], [3, 10, 11],
+      [4, 6, 8], [4, 10, 6], [5, 9, 7], [5, 7, 11]
     ]
-
-  def mesh(self):
-    return trimesh.convex.convex_hull(self.vertices())
-
-  def to_stl(self):
-    self.mesh().export("stl/icosahedron.stl")
-    
\ No newline at end of file
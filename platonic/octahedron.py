@@ -1,12 +1,12 @@
 import numpy as np
-import trimesh
+from common.polyhedron import Polyhedron
 
-class Octahedron:
+class Octahedron(Polyhedron):
 
-  def __init__(self, radius=1):
-    self.radius = radius
+  __slots__ = ()
 
-  def vertices(self):
+  @staticmethod
+  def unit_vertices():
     invsqrt2 = 1.0 / np.sqrt(2.0)
     unscaled = np.array([
       [      0.0,       0.0,  1.0],
@@ -16,11 +16,15 @@ class Octahedron:
       [-invsqrt2,  invsqrt2,  0.0],
       [-invsqrt2, -invsqrt2,  0.0]
     ])
-    return self.radius * unscaled
+    return unscaled
 
-  def mesh(self):
-    return trimesh.convex.convex_hull(self.vertices())
-
-  def to_stl(self):
-    self.mesh().export("stl/octahedron.stl")
-    
\ No newline at end of file
+  @staticmethod
+  def unit_faces():
+    """
+    Indices into the vertices of the triangles bounding the solid, each wound
+    anticlockwise seen from outside.
+    """
+    return [
+      [0, 2, 4], [0, 3, 2], [0, 4, 5], [0, 5, 3],
+      [1, 2, 3], [1, 3, 5], [1, 4, 2], [1, 5, 4]
+    ]
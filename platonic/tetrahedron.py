@@ -1,23 +1,26 @@
 import numpy as np
-import trimesh
+from common.polyhedron import Polyhedron
 
-class Tetrahedron:
+class Tetrahedron(Polyhedron):
 
-  def __init__(self, radius=1):
-    self.radius = radius
+  __slots__ = ()
 
-  def vertices(self):
+  @staticmethod
+  def unit_vertices():
     unscaled = np.array([
       [                0.0,                       0.0,        1.0],
       [                0.0,  2.0 * np.sqrt(2.0) / 3.0, -1.0 / 3.0],
       [-np.sqrt(2.0 / 3.0),       -np.sqrt(2.0) / 3.0, -1.0 / 3.0],
       [ np.sqrt(2.0 / 3.0),       -np.sqrt(2.0) / 3.0, -1.0 / 3.0]
     ])
-    return self.radius * unscaled
+    return unscaled
 
-  def mesh(self):
-    return trimesh.convex.convex_hull(self.vertices())
-
-  def to_stl(self):
-    self.mesh().export("stl/tetrahedron.stl")
-    
\ No newline at end of file
+  @staticmethod
+  def unit_faces():
+    """
+    Indices into the vertices of the triangles bounding the solid, each wound
+    anticlockwise seen from outside.
+    """
+    return [
+      [0, 1, 2], [0, 2, 3], [0, 3, 1], [1, 3, 2]
+    ]
@@ -1,12 +1,23 @@
 import numpy as np
-import trimesh
+from common.polyhedron import Polyhedron
 
-class SmallTriambicIcosahedron:
+class SmallTriambicIcosahedron(Polyhedron):
+  """
+  An icosahedron with a pyramid raised on each face. Only the 60 triangles
+  of the pyramids' sides are on the surface; vertices 0 to 11 are the
+  icosahedron's and 12 to 31 the apexes of the pyramids, in the order of
+  _icosahedron_faces().
+  """
 
-  def __init__(self, radius=1):
-    self.radius = radius
+  __slots__ = ()
 
-  def icosahedron_vertices(self):
+  convex = False
+
+  # the apexes of the pyramids are the midpoints of the faces scaled by this
+  APEX_SCALE = 3.0 / np.sqrt(5.0)
+
+  @staticmethod
+  def _icosahedron_vertices():
     φ = (1.0 + np.sqrt(5.0)) / 2.0
     unscaled = np.array([
         [ 1.0,    φ,  0.0],
@@ -22,50 +33,33 @@ class SmallTriambicIcosahedron:
         [   φ,  0.0, -1.0],
         [  -φ,  0.0, -1.0]
     ])
-    return self.radius * (1.0 / np.sqrt(1.0 + φ**2)) * unscaled
+    return (1.0 / np.sqrt(1.0 + φ**2)) * unscaled
   
-  def icosahedron_faces(self):
-    vertices = self.icosahedron_vertices()
+  @staticmethod
+  def _icosahedron_faces():
+    # wound anticlockwise seen from outside
     return np.array([
-      [vertices[0], vertices[4], vertices[8]],
-      [vertices[0], vertices[5], vertices[10]],
-      [vertices[1], vertices[6], vertices[8]],
-      [vertices[1], vertices[7], vertices[10]],
-      [vertices[2], vertices[4], vertices[9]],
-      [vertices[2], vertices[5], vertices[11]],
-      [vertices[3], vertices[6], vertices[9]],
-      [vertices[3], vertices[7], vertices[11]],
-      [vertices[0], vertices[2], vertices[4]],
-      [vertices[0], vertices[2], vertices[5]],
-      [vertices[1], vertices[3], vertices[6]],
-      [vertices[1], vertices[3], vertices[7]],
-      [vertices[4], vertices[6], vertices[8]],
-      [vertices[4], vertices[6], vertices[9]],
-      [vertices[5], vertices[7], vertices[10]],
-      [vertices[5], vertices[7], vertices[11]],
-      [vertices[8], vertices[10], vertices[0]],
-      [vertices[8], vertices[10], vertices[1]],
-      [vertices[9], vertices[11], vertices[2]],
-      [vertices[9], vertices[11], vertices[3]]
+      [0, 4, 8], [0, 10, 5], [1, 8, 6], [1, 7, 10],
+      [2, 9, 4], [2, 5, 11], [3, 6, 9], [3, 11, 7],
+      [0, 2, 4], [0, 5, 2], [1, 6, 3], [1, 3, 7],
+      [4, 6, 8], [4, 9, 6], [5, 10, 7], [5, 7, 11],
+      [8, 10, 0], [8, 1, 10], [9, 2, 11], [9, 11, 3]
     ])
 
-  def mesh(self):
-    # regular icosahedron mesh
-    icos_mesh = trimesh.convex.convex_hull(self.icosahedron_vertices())
-    pyramids = []
-    for face in self.icosahedron_faces():
-      # for each face, build a pyramid of the right height with the face as its base
-      vertex = (3.0 / np.sqrt(5.0)) * face.mean(axis=0)
-      pyramid = trimesh.convex.convex_hull(
-        np.vstack([face, vertex])
-      )
-      pyramids.append(pyramid)
-    # merge the pyramids onto the icosahedron
-    mesh = trimesh.util.concatenate(
-      [icos_mesh] + pyramids
-    )
-    return mesh
-      
-  def to_stl(self):
-    self.mesh().export("stl/small_triambic_icosahedron.stl")
-    
\ No newline at end of file
+  @classmethod
+  def unit_vertices(cls):
+    icosahedron = cls._icosahedron_vertices()
+    apexes = cls.APEX_SCALE * icosahedron[cls._icosahedron_faces()].mean(axis=1)
+    return np.concatenate([icosahedron, apexes])
+
+  @classmethod
+  def unit_faces(cls):
+    """
+    The three sides [a, b, apex], [b, c, apex], [c, a, apex] of the pyramid
+    on each icosahedron face [a, b, c], wound like the face.
+    """
+    bases = cls._icosahedron_faces()
+    apexes = 12 + np.arange(len(bases))
+    sides = np.stack([bases, np.roll(bases, -1, axis=1)], axis=2)
+    apex_column = np.broadcast_to(apexes[:, None, None], (len(bases), 3, 1))
+    return np.concatenate([sides, apex_column], axis=2).reshape(-1, 3)
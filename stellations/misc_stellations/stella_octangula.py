@@ -1,40 +1,44 @@
 import numpy as np
-import trimesh
+from common.polyhedron import Polyhedron
 
-class StellaOctangula:
+class StellaOctangula(Polyhedron):
 
-  def __init__(self, radius=1):
-    self.radius = radius
+  __slots__ = ()
 
-  def _up_vertices(self):
+  convex = False
+
+  @staticmethod
+  def _up_vertices():
     unscaled = np.array([
       [                0.0,                       0.0,        1.0],
       [                0.0,  2.0 * np.sqrt(2.0) / 3.0, -1.0 / 3.0],
       [-np.sqrt(2.0 / 3.0),       -np.sqrt(2.0) / 3.0, -1.0 / 3.0],
       [ np.sqrt(2.0 / 3.0),       -np.sqrt(2.0) / 3.0, -1.0 / 3.0]
     ])
-    return self.radius * unscaled
+    return unscaled
 
-  def _down_vertices(self):
+  @staticmethod
+  def _down_vertices():
     unscaled = np.array([
       [                0.0,                       0.0,      -1.0],
       [                0.0, -2.0 * np.sqrt(2.0) / 3.0, 1.0 / 3.0],
       [-np.sqrt(2.0 / 3.0),        np.sqrt(2.0) / 3.0, 1.0 / 3.0],
       [ np.sqrt(2.0 / 3.0),        np.sqrt(2.0) / 3.0, 1.0 / 3.0]
     ])
-    return self.radius * unscaled
+    return unscaled
     
-  def vertices(self):
+  @classmethod
+  def unit_vertices(cls):
     return np.concatenate([
-        self._up_vertices(), self._down_vertices()
-      ])
-
-  def mesh(self):
-    return trimesh.util.concatenate([
-        trimesh.convex.convex_hull(self._up_vertices()),
-        trimesh.convex.convex_hull(self._down_vertices())
+        cls._up_vertices(), cls._down_vertices()
       ])
 
-  def to_stl(self):
-    self.mesh().export("stl/stella_octangula.stl")
-    
\ No newline at end of file
+  @staticmethod
+  def unit_faces():
+    """
+    The faces of the two tetrahedra, each wound anticlockwise seen from
+    outside its own tetrahedron. The second tetrahedron's vertices are
+    numbered in the same way as the first's, so they share a face table.
+    """
+    tetrahedron = [[0, 1, 2], [0, 2, 3], [0, 3, 1], [1, 3, 2]]
+    return tetrahedron + [[i + 4 for i in face] for face in tetrahedron]
@@ -0,0 +1,101 @@
+import contextlib
+import os
+import os.path
+import threading
+import numpy as np
+
+# Directory holding the precomputed arrays. Defaults to the data directory
+# next to this file, so it doesn't depend on the current working directory.
+DATA_DIR = os.environ.get(
+    'POLYHEDRA_DATA_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+)
+
+_lazy_values = []
+
+def get_data_dir():
+    return DATA_DIR
+
+def set_data_dir(path):
+    """
+    Use path as the data directory, discarding anything already loaded.
+    """
+    global DATA_DIR
+    DATA_DIR = path
+    for lazy in _lazy_values:
+        lazy.reset()
+
+class Lazy:
+    """
+    Thread-safe lazily computed value: compute() is called on the first call
+    to get() and its result is returned from then on.
+    """
+
+    def __init__(self, compute):
+        self._compute = compute
+        self._lock = threading.Lock()
+        self._value = None
+        self._ready = False
+        _lazy_values.append(self)
+
+    def get(self):
+        if not self._ready:
+            with self._lock:
+                if not self._ready:
+                    self._value = self._compute()
+                    self._ready = True
+        return self._value
+
+    def reset(self):
+        with self._lock:
+            self._value = None
+            self._ready = False
+
+def load_or_generate(filename, generate, shape):
+    """
+    Load the array in filename in the data directory, memory-mapped and
+    read-only, if it exists; else generate it from scratch and try to save
+    it. Check shape is correct and error otherwise.
+    """
+    path = os.path.join(get_data_dir(), filename)
+
+    if os.path.exists(path):
+        array = np.load(path, mmap_mode='r')
+    else:
+        array = generate()
+
+    if array.shape != shape:
+        raise ValueError(f"'{filename}' is not the correct shape")
+
+    if not isinstance(array, np.memmap):
+        try:
+            with atomic_file(path) as f:
+                np.save(f, array)
+        except OSError:
+            # a read-only data directory just means regenerating next time
+            pass
+
+    return array
+
+@contextlib.contextmanager
+def atomic_file(file, mode='wb'):
+    """
+    Context manager giving a temporary file, opened with mode, which
+    replaces file (creating its directory if necessary) when the with block
+    finishes, so that other processes never read a partial file. If the
+    block raises, file is left as it was.
+    """
+    directory = os.path.dirname(file)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp = f"{file}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, mode) as f:
+            yield f
+        os.replace(tmp, file)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
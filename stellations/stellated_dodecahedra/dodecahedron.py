@@ -1,4 +1,6 @@
+import itertools
 import numpy as np
+from common.golden import golden
 
 class Dodecahedron:
   """
@@ -37,8 +39,29 @@ class Dodecahedron:
       ])
     return self.radius * unscaled
   
-  def _faces(self):
-    face_vertices = [
+  @staticmethod
+  def exact_vertices():
+    """
+    The vertices scaled by √3, exactly: coordinates a + bφ are stored as
+    pairs (a, b) (see common.golden). Shape (20, 3, 2).
+    """
+    zero, one, φ = golden(0), golden(1), golden(0, 1)
+    inv_φ = golden(-1, 1) # 1 / φ = φ - 1
+    cube = [
+      [x * one, y * one, z * one]
+      for x, y, z in itertools.product((1, -1), repeat=3)
+    ]
+    signs = list(itertools.product((1, -1), repeat=2))
+    return np.array(
+      cube +
+      [[x * φ, y * inv_φ, zero] for x, y in signs] +
+      [[zero, x * φ, y * inv_φ] for x, y in signs] +
+      [[x * inv_φ, zero, y * φ] for x, y in signs]
+    )
+
+  @staticmethod
+  def face_indices():
+    return [
         [0, 2, 8, 9, 16], 
         [2, 6, 14, 16, 18], 
         [2, 3, 9, 14, 15], 
@@ -52,8 +75,10 @@ class Dodecahedron:
         [4, 5, 10, 12, 13], 
         [5, 7, 10, 11, 19]
       ]
+
+  def _faces(self):
     faces = np.array([
-      self.vertices[face,:] for face in face_vertices
+      self.vertices[face,:] for face in self.face_indices()
     ])
     return faces
 
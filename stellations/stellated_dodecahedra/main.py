@@ -1,26 +1,191 @@
+import itertools
+import json
+import os
 import os.path
-from stellated_dodecahedron_builder import StellatedDodecahedronBuilder
-
-def generate_all_primitive_stellated_dodecahedra(path='stl', overwrite=False):
-    primitive_stellated_dodecahedra_mappings = {
-        'dodecahedron': ['base'],
-        'small_stellated_dodecahedron': ['first_shell'],
-        'great_dodecahedron': ['second_shell'],
-        'great_stellated_dodecahedron': ['third_shell']
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from common import export, profiling, stl
+from common.export import export_mesh, get_output_dir
+from .data_files import atomic_file
+from .mesh_cache import MeshCache, source_hash
+from .rotations import get_rotations
+from .stellated_dodecahedron_builder import CODE_VERSION, StellatedDodecahedronBuilder
+from .stellation_regions import get_stellation_regions
+
+# Default output directory, next to this file; files go in a subdirectory
+# per format.
+OUTPUT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# file in each output directory recording what each of its files was built
+# from
+DEPENDENCIES_FILE = 'dependencies.json'
+
+PRIMITIVE_STELLATED_DODECAHEDRA = {
+    'dodecahedron': ['base'],
+    'small_stellated_dodecahedron': ['first_shell'],
+    'great_dodecahedron': ['second_shell'],
+    'great_stellated_dodecahedron': ['third_shell']
+}
+
+def all_stellation_keys():
+    """
+    Every non-empty combination of the keys of get_stellation_regions(), in
+    the order the keys are defined.
+    """
+    keys = list(get_stellation_regions())
+    return [
+        list(combination)
+        for r in range(1, len(keys) + 1)
+        for combination in itertools.combinations(keys, r)
+    ]
+
+def stellation_name(keys):
+    """
+    File name (without extension) for the stellation built from keys: the
+    usual name for the primitive stellations, else the keys joined by '-'.
+    """
+    for name, regions in PRIMITIVE_STELLATED_DODECAHEDRA.items():
+        if sorted(regions) == sorted(keys):
+            return name
+    return '-'.join(keys)
+
+def dependency_hashes(key_sets):
+    """
+    For each list of keys in key_sets, hashes of everything the stellation
+    built from them depends on: the regions under each key, the rotations,
+    the building code and the writing code. A file needs rebuilding exactly
+    when these have changed since it was written.
+    """
+    stellation_regions = get_stellation_regions()
+    region_hashes = {
+        k: MeshCache.key(regions, '') for k, regions in stellation_regions.items()
     }
-    for name, regions in primitive_stellated_dodecahedra_mappings.items():
-        print(f"Generating {name}...")
-        mesh = StellatedDodecahedronBuilder.build_from_keys(regions)
-        file = f"{path}/{name}.stl"
-        if os.path.exists(file) and not overwrite:
-            print(f"{file} exists, not overwriting")
+    shared = {
+        'rotations': MeshCache.key([get_rotations()], ''),
+        'code': CODE_VERSION,
+        'writer': source_hash([export.__file__, stl.__file__])
+    }
+    return [
+        {'regions': {k: region_hashes[k] for k in sorted(keys)}, **shared}
+        for keys in key_sets
+    ]
+
+def output_stamp(file):
+    """
+    Size and modification time of a written file, recorded with its
+    dependency hashes so that a file changed or replaced since it was
+    written is rebuilt. None if there is no such file.
+    """
+    try:
+        stat = os.stat(file)
+    except FileNotFoundError:
+        return None
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+def load_dependencies(path):
+    """
+    The dependency hashes and output stamps recorded in path for the files
+    written there, by file name.
+    """
+    try:
+        with open(os.path.join(path, DEPENDENCIES_FILE)) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def save_dependencies(path, dependencies):
+    with atomic_file(os.path.join(path, DEPENDENCIES_FILE), 'w') as f:
+        json.dump(dependencies, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+def _build_and_write(keys, file):
+    """
+    Worker for generate_stellated_dodecahedra. Returns the time taken to
+    build and to write the mesh, and the profiling events recorded meanwhile
+    (empty unless profiling is enabled).
+    """
+    # forget any events inherited from the parent process
+    profiling.take()
+    start = time.perf_counter()
+    with profiling.stage('build'):
+        mesh = StellatedDodecahedronBuilder.build_from_keys(keys)
+    built = time.perf_counter()
+    export_mesh(file, mesh.vertices, mesh.faces)
+    written = time.perf_counter()
+    return built - start, written - built, profiling.take()
+
+def generate_stellated_dodecahedra(
+    key_sets=None, path=None, overwrite=False, processes=None, format='stl'
+):
+    """
+    Build the stellated dodecahedra described by key_sets (a list of lists of
+    keys of get_stellation_regions(); by default every combination of keys)
+    across a pool of processes, each of which writes its own file in the
+    given format (see common.export.FORMATS). Files go in path, by default
+    the format's subdirectory of the output directory. Processes defaults
+    to the number of CPUs.
+    Existing files are only rebuilt if something they depend on (see
+    dependency_hashes) has changed since they were written, as recorded in
+    DEPENDENCIES_FILE in path, if the file itself has changed (see
+    output_stamp), or if there is no record of them; with overwrite=True,
+    every file is rebuilt. The record holds modification times, so it is
+    local to one copy of the files and is not committed: in a fresh clone
+    every file is rebuilt once, to the same bytes as the committed one
+    unless something it depends on has changed.
+    """
+    if key_sets is None:
+        key_sets = all_stellation_keys()
+    if path is None:
+        path = os.path.join(get_output_dir(OUTPUT_DIR), format)
+
+    stellation_regions = get_stellation_regions()
+    for keys in key_sets:
+        invalid = [k for k in keys if k not in stellation_regions]
+        if invalid:
+            raise ValueError(f"Invalid stellation region keys {invalid}")
+
+    key_sets = [list(keys) for keys in key_sets]
+    recorded = load_dependencies(path)
+    jobs = {}
+    dependencies = {}
+    for keys, hashes in zip(key_sets, dependency_hashes(key_sets)):
+        name = f"{stellation_name(keys)}.{format}"
+        file = f"{path}/{name}"
+        up_to_date = recorded.get(name) == {**hashes, 'output': output_stamp(file)}
+        if up_to_date and not overwrite:
+            print(f"{file} is up to date")
             continue
-        print(f"Writing {file}...")
-        mesh.export(file)
-    print("Done")
+        jobs[file] = keys
+        dependencies[file] = (name, hashes)
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = {
+            executor.submit(_build_and_write, keys, file): file
+            for file, keys in jobs.items()
+        }
+        for future in as_completed(futures):
+            build_time, write_time, events = future.result()
+            profiling.add(events)
+            name, hashes = dependencies[futures[future]]
+            recorded[name] = {**hashes, 'output': output_stamp(futures[future])}
+            save_dependencies(path, recorded)
+            print(
+                f"Wrote {futures[future]} "
+                f"(build {build_time:.3f}s, write {write_time:.3f}s)"
+            )
+    print(f"Done: {len(jobs)} files in {time.perf_counter() - start:.3f}s")
+
+def generate_all_primitive_stellated_dodecahedra(
+    path=None, overwrite=False, format='stl'
+):
+    generate_stellated_dodecahedra(
+        PRIMITIVE_STELLATED_DODECAHEDRA.values(), path, overwrite,
+        format=format
+    )
 
 def main():
     generate_all_primitive_stellated_dodecahedra()
 
 if __name__=='__main__':
-    main()
\ No newline at end of file
+    main()
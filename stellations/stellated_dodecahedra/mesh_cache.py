@@ -0,0 +1,154 @@
+import hashlib
+import os
+import os.path
+from collections import OrderedDict
+import numpy as np
+from .data_files import atomic_file, get_data_dir
+
+# subdirectory of the data directory holding cached meshes
+DIRNAME = 'cache'
+
+def source_hash(paths):
+    """
+    Hash of the contents of the given source files, used as a code version so
+    that cached results are invalidated whenever the code producing them
+    changes.
+    """
+    h = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+class MeshCache:
+    """
+    Content-addressed cache of (vertices, faces) arrays, held as float64 and
+    int64 respectively.
+    Entries are stored on disk as uncompressed .npz files named by their key,
+    with an in-process LRU dictionary in front of them. The disk cache is
+    kept under max_bytes by removing the least recently used files. If path
+    is None, the cache subdirectory of the data directory is used.
+    """
+
+    def __init__(self, path=None, max_bytes=256 * 2**20, max_entries=128):
+        self._path = path
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._memory = OrderedDict()
+
+    @property
+    def path(self):
+        if self._path is None:
+            return os.path.join(get_data_dir(), DIRNAME)
+        return self._path
+
+    @staticmethod
+    def key(arrays, version):
+        """
+        Hash of a sequence of numpy arrays (shapes and float64 contents)
+        together with a version string.
+        """
+        h = hashlib.sha256(version.encode())
+        for array in arrays:
+            array = np.ascontiguousarray(array, dtype=np.float64)
+            h.update(str(array.shape).encode())
+            h.update(array.tobytes())
+        return h.hexdigest()
+
+    def _file(self, key):
+        return os.path.join(self.path, f"{key}.npz")
+
+    def get(self, key):
+        """
+        Return the (vertices, faces) stored under key, or None. The arrays are
+        read-only; copy them before modifying.
+        """
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+
+        file = self._file(key)
+        try:
+            with np.load(file) as data:
+                arrays = data['vertices'], data['faces']
+        except (FileNotFoundError, KeyError, ValueError, OSError):
+            return None
+        # mark as recently used for disk eviction; another process may have
+        # just evicted it
+        try:
+            os.utime(file)
+        except OSError:
+            pass
+
+        self._remember(key, arrays)
+        return arrays
+
+    def put(self, key, vertices, faces):
+        """
+        Store vertices and faces under key, in memory and on disk. If the
+        cache directory can't be written, the entry is kept in memory only.
+        """
+        arrays = (
+            np.array(vertices, dtype=np.float64),
+            np.array(faces, dtype=np.int64)
+        )
+        self._remember(key, arrays)
+
+        try:
+            with atomic_file(self._file(key)) as f:
+                np.savez(f, vertices=arrays[0], faces=arrays[1])
+        except OSError:
+            # a read-only data directory just means rebuilding next time
+            return
+
+        self._evict()
+
+    def clear(self):
+        """
+        Remove every entry from memory and disk.
+        """
+        self._memory.clear()
+        for file in self._files():
+            os.remove(file)
+
+    def _remember(self, key, arrays):
+        for array in arrays:
+            array.flags.writeable = False
+        self._memory[key] = arrays
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _files(self):
+        if not os.path.isdir(self.path):
+            return []
+        return [
+            os.path.join(self.path, name)
+            for name in os.listdir(self.path)
+            if name.endswith('.npz')
+        ]
+
+    def _evict(self):
+        """
+        Remove the least recently used files until the cache on disk fits in
+        max_bytes.
+        """
+        entries = []
+        for file in self._files():
+            try:
+                stat = os.stat(file)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, file))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, file in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(file)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+MESH_CACHE = MeshCache()
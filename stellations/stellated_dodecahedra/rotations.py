@@ -1,28 +1,20 @@
-import os.path
 import numpy as np
+from common.symmetry import tetrahedral_group
+from .data_files import Lazy, load_or_generate
 
-PATH = 'data/rotations.npy'
+FILENAME = 'rotations.npy'
+
+_rotations = Lazy(lambda: load_or_generate(
+    FILENAME, generate_rotations, (12, 3, 3)
+))
 
 def get_rotations():
     """
-    Load the rotations from file if it exists; else generate them from scratch.
-    Check shape is correct and error otherwise. Save rotations if generated.
+    The rotations, loaded from the data directory (memory-mapped) if saved
+    there, else generated from scratch and saved. Computed on first use and
+    shared between threads thereafter.
     """
-    loaded = False
-
-    if os.path.exists(PATH):
-        rotations = np.load(PATH)
-        loaded = True
-    else:
-        rotations = generate_rotations()
-    
-    if rotations.shape != (12, 3, 3):
-        raise ValueError("'rotations' is not the correct shape")
-    
-    if not loaded:
-        np.save(PATH, rotations)
-    
-    return rotations
+    return _rotations.get()
 
 def generate_rotations():
     """
@@ -37,45 +29,13 @@ def generate_rotations():
         ])
     to 11 other pentagons such that the images
     form a dodecahedron inscribed in the unit sphere.
+    These are the 12 rotational symmetries of the tetrahedron inscribed in
+    the dodecahedron, which act simply transitively on its faces.
     """
+    return np.array(tetrahedral_group())
 
-    # We define rotation by 2π/3 about the unit dodecahedron vertex
-    # [ 1.0, 1.0, 1.0 ] by rotating this vector to the x-axis,
-    # performing a 2π/3 rotation in the yz-plane, and then reversing
-    # the first rotation.
-    toX = np.array([
-        [ 1.0 / np.sqrt(3.0), 1.0 / np.sqrt(3.0),  1.0 / np.sqrt(3.0)],
-        [-1.0 / np.sqrt(6.0), 2.0 / np.sqrt(6.0), -1.0 / np.sqrt(6.0)],
-        [-1.0 / np.sqrt(2.0),                0.0,  1.0 / np.sqrt(2.0)]
-    ])
-    aroundX = np.array([
-        [1.0,                0.0,                 0.0],
-        [0.0,         -1.0 / 2.0, -np.sqrt(3.0) / 2.0],
-        [0.0, np.sqrt(3.0) / 2.0,          -1.0 / 2.0]
-    ])
-    R = np.linalg.inv(toX) @ aroundX @ toX
-
-    # The identity and rotations by π in the xy- and xz-planes
-    # suffice together with R to generate the rotations we need.
-    I = np.identity(3)
-    S = np.array([
-        [-1.0,  0.0, 0.0],
-        [ 0.0, -1.0, 0.0],
-        [ 0.0,  0.0, 1.0]
-    ])
-    T = np.array([
-        [-1.0, 0.0,  0.0],
-        [ 0.0, 1.0,  0.0],
-        [ 0.0, 0.0, -1.0]
-    ])
-
-    rotations = np.array([
-            I,         R,         R @ R,
-            S,     R @ S,     R @ R @ S,
-            T,     R @ T,     R @ R @ T,
-        T @ S, R @ T @ S, R @ R @ T @ S,
-    ])
-
-    return rotations
-
-ROTATIONS = get_rotations()
\ No newline at end of file
+def __getattr__(name):
+    # ROTATIONS is computed on first access rather than at import time
+    if name == 'ROTATIONS':
+        return get_rotations()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,62 +1,183 @@
 import trimesh
 import numpy as np
-from utils import from_xy, build_polygon
-from rotations import ROTATIONS
-from stellation_regions import STELLATION_REGIONS
+from common import face_plane, mesh_library, mesh_utils, profiling
+from common.mesh_library import MeshLibrary
+from common.mesh_utils import (
+    weld_vertices, interior_faces, remove_unreferenced_vertices
+)
+from . import utils
+from .data_files import Lazy
+from .utils import FACE_PLANE
+from .rotations import get_rotations
+from .stellation_regions import get_stellation_regions
+from .mesh_cache import MESH_CACHE, source_hash
+
+# Version of the code producing meshes, for keying cached results.
+CODE_VERSION = source_hash([
+    __file__, utils.__file__, face_plane.__file__, mesh_utils.__file__,
+    mesh_library.__file__
+])
 
 class StellatedDodecahedronBuilder:
-    
+
     @classmethod
-    def build_from_keys(cls, keys):
+    def build_from_keys(
+        cls, keys, cache=MESH_CACHE, validate=False, weld=False,
+        drop_interior=False
+    ):
+        """
+        Build the stellation made up of the regions under the given keys of
+        get_stellation_regions(), gathered from get_region_library(). Results
+        are looked up in and saved to cache (a MeshCache, keyed by the region
+        coordinates, the rotations, the code version and the options); pass
+        cache=None to always rebuild. See build_from_regions for the other
+        arguments.
+        """
+        all_stellation_regions = get_stellation_regions()
         stellation_regions = []
         for k in keys:
             try:
-                stellation_regions += STELLATION_REGIONS[k]
+                stellation_regions += all_stellation_regions[k]
             except KeyError:
                 raise ValueError("Invalid stellation region key")
 
-        mesh = cls.build_from_regions(stellation_regions)
+        options = dict(
+            validate=validate, weld=weld, drop_interior=drop_interior
+        )
+        if cache is None:
+            return cls.build_from_library(keys, **options)
+
+        key = cache.key(
+            stellation_regions + [get_rotations()],
+            f"{CODE_VERSION}:weld={weld}:drop_interior={drop_interior}"
+        )
+        with profiling.stage('cache get'):
+            cached = cache.get(key)
+        if cached is not None:
+            vertices, faces = cached
+            return cls.build_mesh(vertices.copy(), faces.copy(), validate)
+
+        mesh = cls.build_from_library(keys, **options)
+        with profiling.stage('cache put'):
+            cache.put(key, mesh.vertices, mesh.faces)
 
         return mesh
 
     @classmethod
-    def build_from_regions(cls, stellation_regions):
+    def build_from_library(
+        cls, keys, validate=False, weld=False, drop_interior=False
+    ):
         """
-        Takes an array of 2d numpy arrays (shape (n, 2)) representing the 
+        As build_from_regions for the regions under keys, but with their
+        orbits gathered from get_region_library() rather than built.
+        """
+        with profiling.stage('gather'):
+            vertices, faces = get_region_library().gather(keys)
+        vertices, faces = cls.finish_arrays(
+            vertices, faces, weld, drop_interior
+        )
+        return cls.build_mesh(vertices, faces, validate)
+
+    @classmethod
+    def build_from_regions(
+        cls, stellation_regions, validate=False, weld=False,
+        drop_interior=False
+    ):
+        """
+        Takes an array of 2d numpy arrays (shape (n, 2)) representing the
         selected polygons in the stellation diagram and builds a Trimesh
         model by lifting and rotating those polygons to the 12 face planes of
         the dodecahedron.
+        Faces are wound so that their normals point away from the origin. If
+        validate is True, check that trimesh.repair.fix_normals agrees with
+        this orientation and raise ValueError if it does not.
+        If weld is True, coincident vertices are merged so that the mesh is
+        indexed rather than a soup of separate polygons. If drop_interior is
+        True, faces hidden inside the solid (such as those of lower shells
+        covered by higher ones) are removed.
         """
-        region_meshes = []
-
-        # we'll build the mesh by building a mesh of all the 
-        # rotations of each region and merging these meshes
-        # at the end.
-        for region in stellation_regions:
-            # map the points to the special plane in R^3
-            # described in from_xy
-            region_3d = np.array([
-                from_xy(vertex) for vertex in region
-            ])
-            # map these points to each of the 12 dodecahedron planes
-            rotated_regions = [
-                (M @ region_3d.T).T for M in ROTATIONS
-            ]
-
-            # build a mesh by building all the regions and concatenating
-            # them; append to ongoing array of meshes
-            region_mesh = trimesh.util.concatenate(
-                [
-                    build_polygon(rotated_region) 
-                    for rotated_region in rotated_regions
-                ]
+        vertices, faces = cls.build_arrays(
+            stellation_regions, weld, drop_interior
+        )
+        return cls.build_mesh(vertices, faces, validate)
+
+    @classmethod
+    def build_mesh(cls, vertices, faces, validate=False):
+        with profiling.stage('trimesh'):
+            mesh = trimesh.Trimesh(
+                vertices=vertices, faces=faces, process=False
             )
-            region_meshes.append(region_mesh)
+        if validate:
+            with profiling.stage('validate'):
+                cls.validate_normals(mesh)
 
-        mesh = trimesh.util.concatenate(region_meshes)
-        # Fix any normals. This is hacky and shouldn't be necessary if I build
-        # the polygons consistently in the first place.
-        trimesh.repair.fix_normals(mesh)
-        
         return mesh
-    
\ No newline at end of file
+
+    @staticmethod
+    def validate_normals(mesh):
+        """
+        Raise ValueError unless repairing the normals of (a vertex-merged copy
+        of) mesh with trimesh.repair.fix_normals leaves every face as it is.
+        """
+        repaired = mesh.copy()
+        # fix_normals can only orient faces consistently across shared edges
+        repaired.merge_vertices()
+        trimesh.repair.fix_normals(repaired)
+        if not np.allclose(repaired.face_normals, mesh.face_normals):
+            raise ValueError("Face normals disagree with fix_normals")
+
+    @classmethod
+    def build_arrays(cls, stellation_regions, weld=False, drop_interior=False):
+        """
+        Vertex and face arrays for the mesh described in build_from_regions.
+        """
+        vertices, faces = cls.orbit_arrays(stellation_regions)
+        return cls.finish_arrays(vertices, faces, weld, drop_interior)
+
+    @staticmethod
+    def orbit_arrays(stellation_regions):
+        """
+        Vertex and face arrays of the polygons stellation_regions lifted and
+        rotated to all 12 face planes, as a soup of separate polygons (see
+        common.face_plane.orbit_arrays). The regions of the diagram are
+        anticlockwise, so every face points away from the origin.
+        """
+        return face_plane.orbit_arrays(
+            stellation_regions, FACE_PLANE, get_rotations()
+        )
+
+    @staticmethod
+    def finish_arrays(vertices, faces, weld=False, drop_interior=False):
+        """
+        Weld vertices and drop interior faces, as asked, from the arrays
+        given by orbit_arrays.
+        """
+        if weld:
+            with profiling.stage('weld'):
+                vertices, faces = weld_vertices(vertices, faces)
+        if drop_interior:
+            with profiling.stage('drop interior'):
+                faces = faces[~interior_faces(vertices, faces)]
+                vertices, faces = remove_unreferenced_vertices(vertices, faces)
+
+        return vertices, faces
+
+def build_region_library():
+    """
+    The orbit of the regions under each key of get_stellation_regions(),
+    lifted, rotated and triangulated once and packed into a MeshLibrary, so
+    that any stellation is a gather of the orbits of its keys.
+    """
+    return MeshLibrary({
+        key: StellatedDodecahedronBuilder.orbit_arrays(regions)
+        for key, regions in get_stellation_regions().items()
+    })
+
+_region_library = Lazy(build_region_library)
+
+def get_region_library():
+    """
+    The MeshLibrary from build_region_library(), built on first use and
+    shared between threads thereafter.
+    """
+    return _region_library.get()
@@ -1,117 +1,75 @@
-import os.path
 import numpy as np
-from utils import to_xy
-from dodecahedron import Dodecahedron
+from common import golden
+from common.stellation_diagram import exact_stellation_diagram
+from .utils import FACE_PLANE
+from .dodecahedron import Dodecahedron
+from .data_files import Lazy
 
-PATH = 'data/stellation_diagram_points.npy'
+# keys of stellation_regions() by shell: the number of face planes crossed to
+# reach the cell below a region from the dodecahedron
+SHELLS = ['base', 'first_shell', 'second_shell', 'third_shell']
 
-def get_stellation_diagram_points():
+def exact_face_planes():
     """
-    Load the points from file if it exists; else generate them from scratch.
-    Check shape is correct and error otherwise. Save points if generated.
+    Exact normals and distances n . x = d (see common.golden) of the 12 face
+    planes of the dodecahedron with vertices Dodecahedron.exact_vertices(),
+    in the order of Dodecahedron().faces, with d > 0. Face 0 is the
+    privileged face, whose plane holds the stellation diagram.
     """
-    loaded = False
+    vertices = Dodecahedron.exact_vertices()
+    # any three vertices of a face span its plane
+    a, b, c = np.moveaxis(
+        vertices[[face[:3] for face in Dodecahedron.face_indices()]], 1, 0
+    )
+    normals = golden.cross(b - a, c - a)
+    distances = golden.dot(normals, a)
+    outward = golden.sign(distances)
+    return normals * outward[:, None, None], distances * outward[:, None]
 
-    if os.path.exists(PATH):
-        stellation_diagram_points = np.load(PATH)
-        loaded = True
-    else:
-        stellation_diagram_points = generate_stellation_diagram_points()
-    
-    if stellation_diagram_points.shape != (15, 2):
-        raise ValueError("'stellation_diagram_points' is not the correct shape")
-    
-    if not loaded:
-        np.save(PATH, stellation_diagram_points)
-    
-    return stellation_diagram_points
-
-def generate_stellation_diagram_points():
+def stellation_regions():
     """
-    Generate the stellation diagram points from scratch. 
-    Done by intersecting the plane containing the privileged face (index 0 in
-    the dodecahedron's face array) with a specially-chosen pairs of other face
-    planes sufficient to represent all points of intersection in the diagram. 
-    This requires foreknowledge of the shape of the diagram but is simpler 
-    than calculating all (11 C 2) = 55 intersections of the privileged plane 
-    with two other planes and removing redundancies.
+    Compute the regions of the stellation diagram and return a hash of the
+    possible component regions of a stellation.
+    The regions are found from the face planes alone, in exact arithmetic
+    (see common.stellation_diagram.exact_stellation_diagram), with no
+    foreknowledge of the shape of the diagram, and grouped into sets of
+    necessary mutual co-occurrence: the regions lying on top of each shell
+    of cells.
     """
+    normals, distances = exact_face_planes()
+    # the exact vertices are √3 times those of the unit dodecahedron
+    all_regions, region_points = exact_stellation_diagram(
+        normals, distances, 0, FACE_PLANE, 1.0 / np.sqrt(3.0)
+    )
 
-    # Helper for getting the points.
-    def intersect(three_faces):
-        """
-        Find the point of intersection of the triple of planes defined by:
-        m0 . (x - m0) = 0
-        m1 . (x - m1) = 0
-        m2 . (x - m2) = 0,
-        where three_faces = np.array([m0, m1, m2]), mi.shape = (3,).
-        These are the planes through mi and orthogonal to mi;
-        for us the mi are the midpoints of the faces of a dodecahedron
-        centered on the origin.
-
-        (Requires m0, m1, m2 linearly independent, else raises 
-        numpy.linalg.LinAlgError)
-        """
-        M = three_faces
-        b = np.array([
-            np.dot(M[0], M[0]), np.dot(M[1], M[1]), np.dot(M[2], M[2]),
-        ])
-
-        return np.linalg.solve(M, b)
-
-    # Use the unit dodecahedron
-    face_midpoints = Dodecahedron().faces.mean(axis=1)
+    # the cell below a region is beyond exactly the planes which have some
+    # vertex of the region beyond them
+    shells = [
+        np.count_nonzero(
+            np.any(golden.plane_sides(points, normals, distances) > 0, axis=0)
+        )
+        for points in region_points
+    ]
 
-    # Defining the intersection sets below is contingent on the order of faces
-    # in dodecahedron.py (bad!)
-    face_sets_to_intersect = np.array([
-        face_midpoints[face_indices]
-        for face_indices in [
-            [0, 1, 2],  [0, 2, 3], [0, 3, 4], [0, 4, 5], [0, 5, 1],
-            [0, 1, 3],  [0, 2, 4], [0, 3, 5], [0, 4, 1], [0, 5, 2],  
-            [0, 6, 9], [0, 7, 10], [0, 8, 6], [0, 9, 7], [0, 10, 8]
-        ]
-    ])
-    
-    # Intersect the sets of three face planes and return the images of the 
-    # resulting points under the map sending the privileged face plane to the
-    # xy-plane.
-    stellation_diagram_points = np.array([
-        to_xy(intersect(faces))
-        for faces in face_sets_to_intersect
-    ])
+    stellation_regions = {
+        k: [region for region, shell in zip(all_regions, shells) if shell == i]
+        for i, k in enumerate(SHELLS)
+    }
 
-    return stellation_diagram_points
+    return stellation_regions
 
+_stellation_regions = Lazy(stellation_regions)
 
-def stellation_regions():
+def get_stellation_regions():
     """
-    Generate or load the points of the stellation diagram and return a hash
-    of the possible component regions of a stellation.
+    The hash returned by stellation_regions(), computed on first use and
+    shared between threads thereafter.
     """
-    points = get_stellation_diagram_points()
-    # All individual regions in the stellation diagram. Contingent on the 
-    # order of points chosen in generate_stellation_diagram_points().
-    all_regions = [
-        points[idxs] for idxs in [
-            [0, 1, 2, 3, 4],
-            [0, 1, 5],  [1, 2, 6], [2, 3, 7], [3, 4, 8], [4, 0, 9], 
-            [0, 9, 5],  [1, 5, 6], [2, 6, 7], [3, 7, 8], [4, 8, 9],
-            [5, 6, 13], [6, 7, 14], [7, 8, 10], [8, 9, 11], [9, 5, 12]
-        ]
-    ]
-    # Regions grouped into sets of necessary mutual co-occurrence.
-    regions = {
-        'base': [0],                  
-        'first_shell':  [1, 2, 3, 4, 5],
-        'second_shell': [6, 7, 8, 9, 10],     
-        'third_shell':  [11, 12, 13, 14, 15]  
-    }
-    stellation_regions = {
-        k: [all_regions[idx] for idx in v] 
-        for k, v in regions.items()
-    }
-    
-    return stellation_regions
+    return _stellation_regions.get()
 
-STELLATION_REGIONS = stellation_regions()
+def __getattr__(name):
+    # STELLATION_REGIONS is computed on first access rather than at import
+    # time
+    if name == 'STELLATION_REGIONS':
+        return get_stellation_regions()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
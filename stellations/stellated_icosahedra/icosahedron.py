@@ -0,0 +1,44 @@
+import numpy as np
+
+class Icosahedron:
+  """
+  Class containing a model for the standard icosahedron inscribed in the unit
+  sphere.
+  """
+
+  def __init__(self, radius=1):
+    self.radius = radius
+    self.vertices = self._vertices()
+    self.faces = self._faces()
+
+  def _vertices(self):
+    φ = (1.0 + np.sqrt(5.0)) / 2.0
+    unscaled = (1.0 / np.sqrt(1.0 + φ**2)) * np.array([
+        [ 1.0,    φ,  0.0],
+        [ 1.0,   -φ,  0.0],
+        [-1.0,    φ,  0.0],
+        [-1.0,   -φ,  0.0],
+        [ 0.0,  1.0,    φ],
+        [ 0.0,  1.0,   -φ],
+        [ 0.0, -1.0,    φ],
+        [ 0.0, -1.0,   -φ],
+        [   φ,  0.0,  1.0],
+        [   φ,  0.0, -1.0],
+        [  -φ,  0.0,  1.0],
+        [  -φ,  0.0, -1.0]
+      ])
+    return self.radius * unscaled
+
+  def _faces(self):
+    # wound anticlockwise seen from outside; face 0 is the face used for the
+    # stellation diagram
+    face_vertices = [
+        [0, 2, 4], [0, 5, 2], [0, 4, 8], [0, 9, 5], [0, 8, 9],
+        [1, 6, 3], [1, 3, 7], [1, 8, 6], [1, 7, 9], [1, 9, 8],
+        [2, 10, 4], [2, 5, 11], [2, 11, 10], [3, 6, 10], [3, 11, 7],
+        [3, 10, 11], [4, 6, 8], [4, 10, 6], [5, 9, 7], [5, 7, 11]
+      ]
+    faces = np.array([
+      self.vertices[face,:] for face in face_vertices
+    ])
+    return faces
@@ -0,0 +1,81 @@
+import os
+import os.path
+import time
+from common.export import ExportQueue, get_output_dir
+from .stellated_icosahedron_builder import StellatedIcosahedronBuilder
+
+# Default output directory, next to this file; files go in a subdirectory
+# per format.
+OUTPUT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# named stellations, all main stellations (whole shells), whose notation is
+# the same as Coxeter's
+NAMED_STELLATED_ICOSAHEDRA = {
+    'icosahedron': 'A',
+    'small_triambic_icosahedron': 'B',
+    'compound_of_five_octahedra': 'C',
+    'great_icosahedron': 'G',
+    'final_stellation_of_the_icosahedron': 'H'
+}
+
+# every stellation allowed by Miller's rules, one of each mirror image pair,
+# in the notation of StellationCells.parse (see StellationCells.stellations,
+# which derives it): the 32 equal to their mirror images, then the 27 chiral
+FIFTY_NINE_ICOSAHEDRA = (
+    'A', 'e1', 'e2', 'f2', 'g1', 'g2', 'B', 'e1f2', 'f1', 'f2g1', 'C',
+    'e1f2g1', 'e2f1', 'f1g2', 'D', 'e2f1g2', 'De1', 'De2', 'De1f2', 'E',
+    'De1f2g1', 'De2f1', 'Ef2', 'De2f1g2', 'Ef1', 'Ef2g1', 'Ef1g2', 'F', 'Fg1',
+    'Fg2', 'G', 'H',
+    "f1'", "e1f1'", "e2f1'", "f1''g1", "f1''g2", "e1f1''f2", "e1f1''g2",
+    "e2f1''g1", "e2f1''g2", "f1''f2g1", "e1f1''f2g1", "e1f1''f2g2",
+    "e2f1''f2g1", "De1f1'", "De2f1'", "De1f1''f2", "De1f1''g2", "De2f1''g1",
+    "De2f1''g2", "Ef1'", "De1f1''f2g1", "De1f1''f2g2", "De2f1''f2g1",
+    "Ef1''f2", "Ef1''g2", "Ef1''f2g1", "Ef1''f2g2",
+)
+
+def stellation_name(notation):
+    """
+    File name (without extension) for the stellation with the given
+    notation (see StellationCells.parse): its usual name if it has one, else
+    the notation itself.
+    """
+    for name, named_notation in NAMED_STELLATED_ICOSAHEDRA.items():
+        if named_notation == notation:
+            return name
+    return notation
+
+def generate_stellated_icosahedra(
+    notations=None, path=None, overwrite=False, format='stl'
+):
+    """
+    Build and write the stellated icosahedra with the given notations (by
+    default the named ones) in the given format (see
+    common.export.FORMATS), reporting the time taken to build each. Files
+    go in path, by default the format's subdirectory of the output
+    directory, and are written in the background while the next is built.
+    """
+    if notations is None:
+        notations = NAMED_STELLATED_ICOSAHEDRA.values()
+    if path is None:
+        path = os.path.join(get_output_dir(OUTPUT_DIR), format)
+
+    start = time.perf_counter()
+    with ExportQueue() as exports:
+        for notation in notations:
+            file = f"{path}/{stellation_name(notation)}.{format}"
+            if os.path.exists(file) and not overwrite:
+                print(f"{file} exists, not overwriting")
+                continue
+            built = time.perf_counter()
+            mesh = StellatedIcosahedronBuilder.build_from_notation(
+                notation, weld=True
+            )
+            exports.put(file, mesh.vertices, mesh.faces)
+            print(f"Built {file} ({time.perf_counter() - built:.3f}s)")
+    print(f"Done in {time.perf_counter() - start:.3f}s")
+
+def main():
+    generate_stellated_icosahedra()
+
+if __name__=='__main__':
+    main()
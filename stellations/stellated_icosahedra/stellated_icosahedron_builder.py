@@ -0,0 +1,62 @@
+import trimesh
+from common import face_plane, profiling
+from common.mesh_utils import weld_vertices
+from .stellation_cells import get_stellation_cells
+from .utils import FACE_PLANE
+
+class StellatedIcosahedronBuilder:
+
+    @classmethod
+    def build_from_notation(cls, notation, weld=False):
+        """
+        Build the stellation given in the notation of StellationCells.parse,
+        e.g. "C" for the compound of five octahedra; main.FIFTY_NINE_ICOSAHEDRA
+        gives each of the 59 stellations in this notation. Capital letters
+        are Coxeter's main stellations; the numbered cell classes are
+        StellationCells' own and need not match his.
+        """
+        keys = get_stellation_cells().parse(notation)
+        return cls.build_from_keys(keys, weld)
+
+    @classmethod
+    def build_from_keys(cls, keys, weld=False):
+        """
+        Build the stellation made up of the cells under the given keys (see
+        StellationCells.cells), from the regions of the stellation diagram
+        on its surface.
+        """
+        cells = get_stellation_cells()
+        regions = cells.surface_regions(cells.cells(keys))
+        return cls.build_from_regions(regions, weld)
+
+    @classmethod
+    def build_from_regions(cls, stellation_regions, weld=False):
+        """
+        Takes an array of 2d numpy arrays (shape (n, 2)) representing
+        selected convex polygons in the stellation diagram and builds a
+        Trimesh model by lifting and rotating those polygons to the 20 face
+        planes of the icosahedron. Anticlockwise polygons face away from the
+        origin and clockwise ones towards it. If weld is True, coincident
+        vertices are merged.
+        """
+        vertices, faces = cls.build_arrays(stellation_regions, weld)
+        with profiling.stage('trimesh'):
+            return trimesh.Trimesh(
+                vertices=vertices, faces=faces, process=False
+            )
+
+    @classmethod
+    def build_arrays(cls, stellation_regions, weld=False):
+        """
+        Vertex and face arrays for the mesh described in build_from_regions
+        (see common.face_plane.orbit_arrays).
+        """
+        vertices, faces = face_plane.orbit_arrays(
+            stellation_regions, FACE_PLANE, get_stellation_cells().rotations
+        )
+
+        if weld:
+            with profiling.stage('weld'):
+                vertices, faces = weld_vertices(vertices, faces)
+
+        return vertices, faces
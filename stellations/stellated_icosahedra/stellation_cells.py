@@ -0,0 +1,299 @@
+import functools
+import itertools
+import re
+import string
+import numpy as np
+from common.stellation_diagram import stellation_diagram
+from common.symmetry import icosahedral_group, orbit_representatives
+from .icosahedron import Icosahedron
+from .utils import FACE_PLANE
+
+# distance either side of a region of the diagram at which to sample the
+# cells it separates
+OFFSET = 1e-6
+
+# a capital letter (a whole shell and everything inside it) or a cell name
+NOTATION = re.compile(r"[A-H]|[a-h][12]?'{0,2}")
+
+def face_planes():
+    """
+    Unit normals and distances from the origin of the 20 face planes of the
+    unit icosahedron, in the order of Icosahedron().faces.
+    """
+    midpoints = Icosahedron().faces.mean(axis=1)
+    distances = np.linalg.norm(midpoints, axis=1)
+    return midpoints / distances[:, None], distances
+
+def plane_permutations(rotations, normals):
+    """
+    perm[k, i] is the index of the plane that rotations[k] sends plane i to.
+    """
+    images = np.einsum('kij,pj->kpi', rotations, normals)
+    return np.argmax(images @ normals.T, axis=2)
+
+class StellationCells:
+    """
+    The cells into which the 20 face planes of the icosahedron divide space,
+    and the regions of the stellation diagram (in face 0's plane) separating
+    them.
+    A cell is identified by its sign vector, the set of planes it lies
+    beyond, encoded as a 20 bit integer; cells in the same orbit under the
+    rotation group are identified by the smallest code in the orbit.
+    Classes are named by shell (the number of planes crossed to reach them
+    from the icosahedron: 'a' to 'h'), then where a shell holds more than one
+    class by decreasing number of cells ('e1', 'e2', ...). The two mirror
+    image halves of a chiral class such as 'f1' are also available on their
+    own as "f1'" (the half containing the smaller code) and "f1''".
+    The shells are those of Coxeter's The Fifty-Nine Icosahedra, so whole
+    shells ('A' to 'H') are his main stellations, but the numbering within a
+    shell is this class's own: 'e1', 'f2', ... need not be the cells Coxeter
+    gives those names, and notation mixing them names a different solid
+    from his. stellations() lists all 59 in this notation.
+    """
+
+    def __init__(self):
+        self.normals, self.distances = face_planes()
+        group = icosahedral_group()
+        self.permutations = plane_permutations(group, self.normals)
+        # reflection in the origin sends each plane to the opposite one
+        self.mirror = np.argmax(-self.normals @ self.normals.T, axis=1)
+        # one rotation taking face 0 to each face
+        self.rotations = orbit_representatives(group, self.normals[0])
+
+        self.regions = stellation_diagram(
+            self.normals, self.distances, FACE_PLANE
+        )
+
+        # the cells either side of each region: inner is on the side of the
+        # origin
+        centroids = FACE_PLANE.from_xy(
+            np.array([region.mean(axis=0) for region in self.regions])
+        )
+        inner = self.images(self.codes(centroids - OFFSET * self.normals[0]))
+        outer = self.images(self.codes(centroids + OFFSET * self.normals[0]))
+        self.inner = inner.min(axis=1)
+        self.outer = outer.min(axis=1)
+        # every cell next to a face plane, with its class, and the pairs of
+        # them (as indices) sharing a face
+        self.cell_codes, adjacent = np.unique(
+            np.column_stack([inner.reshape(-1), outer.reshape(-1)]),
+            return_inverse=True
+        )
+        self.cell_classes = self.canonical(self.cell_codes)
+        self.adjacent = adjacent.reshape(-1, 2)
+        self.adjacent_classes = np.unique(self.cell_classes[self.adjacent], axis=0)
+
+        self.names = self._name_classes()
+
+    def codes(self, points):
+        """
+        Sign vector codes of the cells containing points (shape (m, 3)).
+        """
+        beyond = points @ self.normals.T > self.distances
+        return beyond.astype(np.int64) @ (1 << np.arange(len(self.normals)))
+
+    def images(self, codes):
+        """
+        Codes of the images of the cells under each rotation; shape (m, 60).
+        """
+        bits = (codes[:, None] >> np.arange(len(self.normals))) & 1
+        return bits @ (1 << self.permutations).T
+
+    def canonical(self, codes):
+        return self.images(codes).min(axis=1)
+
+    def mirror_image(self, codes):
+        bits = (codes[:, None] >> np.arange(len(self.normals))) & 1
+        return self.canonical(bits @ (1 << self.mirror))
+
+    def bounded(self, code):
+        """
+        Whether the cell with the given code is bounded: whether no direction
+        v != 0 keeps to the same side of every plane. If there were one, some
+        such v would lie on the intersection of two of the planes through the
+        origin parallel to the face planes.
+        """
+        beyond = (code >> np.arange(len(self.normals))) & 1
+        rows = np.where(beyond[:, None] == 1, self.normals, -self.normals)
+        i, j = np.triu_indices(len(rows), 1)
+        candidates = np.cross(rows[i], rows[j])
+        lengths = np.linalg.norm(candidates, axis=1)
+        candidates = candidates[lengths > OFFSET] / lengths[lengths > OFFSET, None]
+        candidates = np.concatenate([candidates, -candidates])
+        return not np.any(np.all(candidates @ rows.T >= -OFFSET, axis=1))
+
+    def _name_classes(self):
+        codes = np.unique(np.concatenate([self.inner, self.outer]))
+        codes = [code for code in codes if self.bounded(code)]
+        shells = {}
+        for code in codes:
+            shell = string.ascii_lowercase[bin(code).count('1')]
+            size = len(np.unique(self.images(np.array([code]))))
+            shells.setdefault(shell, []).append((-size, code))
+
+        names = {}
+        for shell, classes in sorted(shells.items()):
+            classes.sort()
+            # pair up each chiral class with its mirror image
+            groups = []
+            for _, code in classes:
+                mirror = self.mirror_image(np.array([code]))[0]
+                if mirror < code:
+                    continue
+                groups.append([code] if mirror == code else [code, mirror])
+            for index, group in enumerate(groups, start=1):
+                name = shell if len(groups) == 1 else f"{shell}{index}"
+                names[name] = frozenset(group)
+                if len(group) == 2:
+                    names[f"{name}'"] = frozenset(group[:1])
+                    names[f"{name}''"] = frozenset(group[1:])
+        return names
+
+    def cells(self, keys):
+        """
+        The set of cell codes described by keys: cell class names as in
+        self.names, or capital letters meaning a whole shell together with
+        every shell inside it.
+        """
+        codes = set()
+        for key in keys:
+            if key in string.ascii_uppercase:
+                for name, group in self.names.items():
+                    if name[0] <= key.lower() and not name.endswith("'"):
+                        codes |= group
+            elif key in self.names:
+                codes |= self.names[key]
+            else:
+                raise ValueError(f"Invalid stellation cell key {key!r}")
+        return codes
+
+    def notation(self, codes):
+        """
+        The shortest notation for the cells with the given codes: the
+        largest capital letter whose cells they include, followed by the
+        names of the other classes, a chiral pair by its own name where both
+        halves are present.
+        """
+        codes = set(codes)
+        notation = ''
+        for key in string.ascii_uppercase[7::-1]:
+            if self.cells([key]) <= codes:
+                notation = key
+                codes -= self.cells([key])
+                break
+        for name, group in self.names.items():
+            if group <= codes:
+                notation += name
+                codes -= group
+        return notation
+
+    def is_stellation(self, codes):
+        """
+        Whether the cells with the given codes make one of the stellations
+        allowed by Miller's rules, as counted in Coxeter's The Fifty-Nine
+        Icosahedra. The rules about the face planes and symmetry hold for any
+        union of classes; what is left is that
+        - every part of each face must be accessible: no cell outside the
+          stellation is enclosed by it, cut off from the unbounded cells, and
+        - it must not divide into two solids, each as symmetric as the
+          whole, which share no face.
+        """
+        codes = set(codes)
+        if not codes:
+            return False
+        bounded = set().union(*self.names.values())
+
+        # search outwards from the unbounded cells across the faces between
+        # cells outside the stellation
+        outside = ~np.isin(self.cell_classes, list(codes))
+        reached = outside & ~np.isin(self.cell_classes, list(bounded))
+        a, b = self.adjacent[outside[self.adjacent].all(axis=1)].T
+        while True:
+            grown = reached.copy()
+            grown[a] |= reached[b]
+            grown[b] |= reached[a]
+            if np.array_equal(grown, reached):
+                break
+            reached = grown
+        if np.any(outside & ~reached):
+            return False
+
+        # the parts are the classes, or for a stellation equal to its mirror
+        # image the classes together with their mirror images
+        part = {code: code for code in codes}
+        mirrors = self.mirror_image(np.array(sorted(codes)))
+        if set(mirrors) == codes:
+            for code, mirror in zip(sorted(codes), mirrors):
+                part[code] = min(code, mirror)
+        parts = set(part.values())
+        joined = {}
+        for a, b in self.adjacent_classes:
+            if a in part and b in part and part[a] != part[b]:
+                joined.setdefault(part[a], set()).add(part[b])
+                joined.setdefault(part[b], set()).add(part[a])
+        connected = {min(parts)}
+        frontier = list(connected)
+        while frontier:
+            for p in joined.get(frontier.pop(), ()):
+                if p not in connected:
+                    connected.add(p)
+                    frontier.append(p)
+        return connected == parts
+
+    def stellations(self):
+        """
+        The notations of every stellation allowed by Miller's rules (see
+        is_stellation), taking one of each mirror image pair: 32 equal to
+        their mirror images, then 27 chiral, each group by number of
+        classes and then notation.
+        """
+        classes = sorted(set().union(*self.names.values()))
+        reflexible = []
+        chiral = {}
+        for r in range(1, len(classes) + 1):
+            for codes in itertools.combinations(classes, r):
+                if not self.is_stellation(codes):
+                    continue
+                codes = frozenset(codes)
+                mirror = frozenset(self.mirror_image(np.array(sorted(codes))))
+                notation = self.notation(codes)
+                if mirror == codes:
+                    reflexible.append((r, notation))
+                else:
+                    pair = frozenset([codes, mirror])
+                    chiral[pair] = min(chiral.get(pair, (r, notation)), (r, notation))
+        return [notation for _, notation in sorted(reflexible) + sorted(chiral.values())]
+
+    def parse(self, notation):
+        """
+        Split a stellation written as a string of keys for cells(), such as
+        "De2f1''g1", into those keys. Whitespace is ignored.
+        """
+        notation = ''.join(notation.split())
+        keys = NOTATION.findall(notation)
+        if ''.join(keys) != notation:
+            raise ValueError(f"Invalid stellation notation {notation!r}")
+        return keys
+
+    def surface_regions(self, codes):
+        """
+        The regions of the diagram on the surface of the stellation made of
+        the cells with the given codes: those with the stellation on exactly
+        one side. Regions are anticlockwise (outward facing) where the
+        stellation is on the side of the origin, and clockwise otherwise.
+        """
+        codes = np.array(sorted(codes), dtype=np.int64)
+        inside = np.isin(self.inner, codes)
+        outside = np.isin(self.outer, codes)
+        return [
+            region if inner else region[::-1]
+            for region, inner, outer in zip(self.regions, inside, outside)
+            if inner != outer
+        ]
+
+@functools.lru_cache(maxsize=None)
+def get_stellation_cells():
+    """
+    The StellationCells of the icosahedron, computed on first use.
+    """
+    return StellationCells()
@@ -0,0 +1,13 @@
+import numpy as np
+from common.face_plane import FacePlaneTransform
+from .icosahedron import Icosahedron
+
+# The face used for the stellation diagram: face 0 of the unit icosahedron,
+# with vertices proportional to
+#     [ 1.0,    φ,  0.0]
+#     [-1.0,    φ,  0.0]
+#     [ 0.0,  1.0,    φ]
+# and with the x-axis along the edge joining the first two.
+FACE_PLANE = FacePlaneTransform(
+    Icosahedron().faces[0].mean(axis=0), np.array([1.0, 0.0, 0.0])
+)
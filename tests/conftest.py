@@ -0,0 +1,13 @@
+import pytest
+from stellations.stellated_dodecahedra.data_files import get_data_dir, set_data_dir
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """
+    A fresh data directory, so that nothing is read from or written to the
+    repository's (cached meshes in particular).
+    """
+    previous = get_data_dir()
+    set_data_dir(str(tmp_path / 'data'))
+    yield get_data_dir()
+    set_data_dir(previous)
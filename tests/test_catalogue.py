@@ -0,0 +1,64 @@
+import json
+import numpy as np
+import pytest
+import generate
+from common.catalogue import Catalogue, write_catalogue
+from platonic.cube import Cube
+from platonic.dodecahedron import Dodecahedron
+
+def test_round_trip(tmp_path):
+    file = str(tmp_path / 'solids.cat')
+    cube, dodecahedron = Cube(1.5), Dodecahedron(2)
+    write_catalogue(file, [
+        {'name': 'cube', 'vertices': cube.vertices, 'faces': cube.triangles},
+        {
+            'name': 'dodecahedron_2', 'family': 'dodecahedron',
+            'vertices': dodecahedron.vertices, 'faces': dodecahedron.triangles
+        },
+        {
+            'name': 'star', 'family': 'stellated_dodecahedron',
+            'keys': ('third_shell', 'base'), 'vertices': [], 'faces': []
+        }
+    ])
+    with Catalogue(file) as catalogue:
+        assert list(catalogue) == ['cube', 'dodecahedron_2', 'star']
+        vertices, faces = catalogue['dodecahedron_2']
+        assert np.array_equal(vertices, dodecahedron.vertices)
+        assert np.array_equal(faces, dodecahedron.triangles)
+        assert np.array_equal(catalogue['cube'][0], cube.vertices)
+        assert catalogue['star'][0].shape == (0, 3)
+        assert catalogue.find(family='dodecahedron') == ['dodecahedron_2']
+        assert catalogue.find(keys=('base', 'third_shell')) == ['star']
+        assert catalogue.find(keys=['third_shell', 'base']) == ['star']
+        assert catalogue.find(keys=['base']) == []
+
+def test_errors(tmp_path):
+    file = str(tmp_path / 'solids.cat')
+    write_catalogue(file, [])
+    with Catalogue(file) as catalogue:
+        assert len(catalogue) == 0
+    with pytest.raises(ValueError):
+        write_catalogue(file, [
+            {'name': 'a', 'vertices': [], 'faces': []},
+            {'name': 'a', 'vertices': [], 'faces': []}
+        ])
+
+def test_generate_catalogue(tmp_path, data_dir):
+    manifest = tmp_path / 'manifest.json'
+    manifest.write_text(json.dumps({'jobs': [
+        {'solid': 'cube', 'radii': [1, 2], 'formats': ['stl', 'npz']},
+        {'solid': 'dodecahedron'},
+        {'solid': 'stellated_dodecahedron', 'keys': [['base']]},
+        {'solid': 'stellated_icosahedron', 'keys': ['A']}
+    ]}))
+    file = str(tmp_path / 'solids.cat')
+    assert generate.run_catalogue(str(manifest), file, processes=1) == 5
+    with Catalogue(file) as catalogue:
+        assert list(catalogue) == [
+            'cube', 'cube_2', 'dodecahedron',
+            'stellated_dodecahedron/dodecahedron', 'stellated_icosahedron/icosahedron'
+        ]
+        assert catalogue.find(family='stellated_dodecahedron', keys=('base',)) == [
+            'stellated_dodecahedron/dodecahedron'
+        ]
+        assert np.allclose(catalogue['cube_2'][0], Cube(2).vertices)
@@ -0,0 +1,75 @@
+import os
+import subprocess
+import sys
+import threading
+import numpy as np
+import pytest
+from stellations.stellated_dodecahedra import data_files
+from stellations.stellated_dodecahedra.data_files import (
+    Lazy, atomic_file, load_or_generate, set_data_dir
+)
+from stellations.stellated_dodecahedra.rotations import FILENAME, get_rotations
+
+def test_lazy_computes_once():
+    calls = []
+    barrier = threading.Barrier(8)
+    lazy = Lazy(lambda: calls.append(None) or len(calls))
+
+    def get():
+        barrier.wait()
+        assert lazy.get() == 1
+
+    threads = [threading.Thread(target=get) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    lazy.reset()
+    assert lazy.get() == 2
+
+def test_set_data_dir(data_dir):
+    # generated and saved on first use, then memory-mapped
+    rotations = get_rotations()
+    assert not isinstance(rotations, np.memmap)
+    assert os.listdir(data_dir) == [FILENAME]
+    set_data_dir(data_dir)
+    assert isinstance(get_rotations(), np.memmap)
+    assert np.array_equal(get_rotations(), rotations)
+
+def test_unwritable_data_dir(tmp_path):
+    (tmp_path / 'file').touch()
+    previous = data_files.get_data_dir()
+    try:
+        set_data_dir(str(tmp_path / 'file' / 'data'))
+        assert get_rotations().shape == (12, 3, 3)
+    finally:
+        set_data_dir(previous)
+
+def test_wrong_shape(data_dir):
+    with pytest.raises(ValueError):
+        load_or_generate('array.npy', lambda: np.zeros(3), (4,))
+
+def test_atomic_file(tmp_path):
+    file = str(tmp_path / 'directory' / 'file')
+    with atomic_file(file, 'w') as f:
+        f.write('first')
+    with pytest.raises(RuntimeError):
+        with atomic_file(file, 'w') as f:
+            f.write('second')
+            raise RuntimeError
+    with open(file) as f:
+        assert f.read() == 'first'
+    assert os.listdir(tmp_path / 'directory') == ['file']
+
+def test_import_has_no_side_effects(tmp_path):
+    data_dir = tmp_path / 'data'
+    subprocess.run(
+        [
+            sys.executable, '-c',
+            'import stellations.stellated_dodecahedra.main, generate'
+        ],
+        check=True, env={**os.environ, 'POLYHEDRA_DATA_DIR': str(data_dir)},
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    assert not data_dir.exists()
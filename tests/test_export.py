@@ -0,0 +1,84 @@
+import os.path
+import numpy as np
+import pytest
+import trimesh
+from common import export
+from common.stl import read_stl
+from platonic.cube import Cube
+
+@pytest.fixture
+def cube():
+    solid = Cube(1.5)
+    return solid.vertices, solid.triangles
+
+@pytest.mark.parametrize('format', ['ply', 'obj', 'glb'])
+def test_trimesh_formats(tmp_path, cube, format):
+    vertices, faces = cube
+    file = str(tmp_path / f'cube.{format}')
+    export.export_mesh(file, vertices, faces)
+    mesh = trimesh.load(file, force='mesh', process=False)
+    assert np.allclose(mesh.vertices, vertices)
+    assert np.array_equal(mesh.faces, faces)
+
+def test_npz(tmp_path, cube):
+    vertices, faces = cube
+    file = str(tmp_path / 'npz' / 'cube.npz')
+    export.export_mesh(file, vertices, faces)
+    read_vertices, read_faces = export.read_npz(file)
+    assert np.array_equal(read_vertices, vertices)
+    assert np.array_equal(read_faces, faces)
+
+def test_stl(tmp_path, cube):
+    vertices, faces = cube
+    file = str(tmp_path / 'cube.stl')
+    export.export_mesh(file, vertices, faces)
+    assert np.allclose(read_stl(file)['vertices'], vertices[faces])
+
+def test_unknown_format(tmp_path, cube):
+    with pytest.raises(ValueError):
+        export.export_mesh(str(tmp_path / 'cube.xyz'), *cube)
+
+def test_output_dir_per_family(tmp_path):
+    previous = export.OUTPUT_DIR
+    try:
+        export.set_output_dir(str(tmp_path))
+        assert export.output_file('cube', 'stl', Cube.default_output_dir()) == \
+            os.path.join(str(tmp_path), 'platonic', 'stl', 'cube.stl')
+        assert export.get_output_dir('stellations/stellated_dodecahedra/') == \
+            os.path.join(str(tmp_path), 'stellated_dodecahedra')
+        export.set_output_dir(None)
+        assert export.get_output_dir('platonic') == 'platonic'
+        with pytest.raises(ValueError):
+            export.output_file('cube', 'stl')
+    finally:
+        export.set_output_dir(previous)
+
+def test_export_queue(tmp_path, cube):
+    files = [str(tmp_path / 'stl' / f'cube_{i}.stl') for i in range(20)]
+    with export.ExportQueue(maxsize=2) as exports:
+        for i, file in enumerate(files):
+            exports.put(file, cube[0] + i, cube[1])
+    for i, file in enumerate(files):
+        assert np.allclose(read_stl(file)['vertices'], cube[0][cube[1]] + i)
+
+def test_export_queue_errors(tmp_path, cube):
+    # a failed write is raised on leaving the block
+    with pytest.raises(ValueError):
+        with export.ExportQueue() as exports:
+            exports.put(str(tmp_path / 'cube.xyz'), *cube)
+    # and by the next put
+    exports = export.ExportQueue()
+    exports.put(str(tmp_path / 'cube.xyz'), *cube)
+    exports._queue.join()
+    with pytest.raises(ValueError):
+        exports.put(str(tmp_path / 'cube.stl'), *cube)
+    with pytest.raises(ValueError):
+        exports.close()
+    assert not os.path.exists(tmp_path / 'cube.stl')
+
+def test_export_queue_keeps_the_original_error(tmp_path, cube):
+    with pytest.raises(KeyError):
+        with export.ExportQueue() as exports:
+            exports.put(str(tmp_path / 'cube.xyz'), *cube)
+            exports._queue.join()
+            raise KeyError('original')
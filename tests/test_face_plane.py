@@ -0,0 +1,65 @@
+import numpy as np
+import trimesh
+from common.face_plane import orbit_arrays, polygon_faces
+from stellations.stellated_dodecahedra.dodecahedron import Dodecahedron
+from stellations.stellated_dodecahedra.rotations import get_rotations
+from stellations.stellated_dodecahedra.utils import FACE_PLANE
+
+# the pentagon described in FacePlaneTransform
+φ = (1.0 + np.sqrt(5.0)) / 2.0
+PENTAGON = (1.0 / np.sqrt(3.0)) * np.array([
+    [    1.0,      1.0, 1.0],
+    [    1.0,     -1.0, 1.0],
+    [      φ,  1.0 / φ, 0.0],
+    [      φ, -1.0 / φ, 0.0],
+    [1.0 / φ,      0.0,   φ]
+])
+
+def test_round_trip():
+    points = np.random.default_rng(0).normal(size=(4, 5, 2))
+    lifted = FACE_PLANE.from_xy(points)
+    assert lifted.shape == (4, 5, 3)
+    assert np.allclose(FACE_PLANE.to_xy(lifted), points)
+    # an isometry
+    assert np.allclose(
+        np.linalg.norm(lifted[:, 1:] - lifted[:, :1], axis=-1),
+        np.linalg.norm(points[:, 1:] - points[:, :1], axis=-1)
+    )
+
+def test_pentagon():
+    # the origin goes to the pentagon's midpoint, and the pentagon to a
+    # regular pentagon about the origin
+    assert np.allclose(FACE_PLANE.from_xy(np.zeros(2)), PENTAGON.mean(axis=0))
+    assert np.allclose(FACE_PLANE.from_xy(FACE_PLANE.to_xy(PENTAGON)), PENTAGON)
+    radii = np.linalg.norm(FACE_PLANE.to_xy(PENTAGON), axis=1)
+    assert np.allclose(radii, radii[0])
+    # it is a face of the dodecahedron
+    assert np.all(np.isclose(
+        Dodecahedron().vertices[:, None], PENTAGON
+    ).all(axis=2).any(axis=0))
+
+def test_polygon_faces():
+    assert polygon_faces(3).tolist() == [[0, 1, 2]]
+    assert polygon_faces(5).tolist() == [[0, 1, 2], [0, 2, 3], [0, 3, 4]]
+
+def test_orbit_arrays():
+    # the face, anticlockwise, on every face is the dodecahedron
+    pentagon = FACE_PLANE.to_xy(PENTAGON)
+    angles = np.arctan2(pentagon[:, 1], pentagon[:, 0])
+    pentagon = pentagon[np.argsort(angles)]
+    vertices, faces = orbit_arrays([pentagon], FACE_PLANE, get_rotations())
+    assert vertices.shape == (12 * 5, 3)
+    assert faces.shape == (12 * 3, 3)
+    mesh = trimesh.Trimesh(vertices, faces)
+    mesh.merge_vertices()
+    assert mesh.is_watertight
+    hull = trimesh.convex.convex_hull(Dodecahedron().vertices)
+    assert np.isclose(mesh.volume, hull.volume)
+    # reversed, it faces inwards
+    vertices, faces = orbit_arrays([pentagon[::-1]], FACE_PLANE, get_rotations())
+    assert np.isclose(trimesh.Trimesh(vertices, faces).volume, -mesh.volume)
+
+def test_orbit_arrays_empty():
+    vertices, faces = orbit_arrays([], FACE_PLANE, get_rotations())
+    assert vertices.shape == (0, 3)
+    assert faces.shape == (0, 3)
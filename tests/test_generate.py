@@ -0,0 +1,81 @@
+import json
+import os.path
+import numpy as np
+import pytest
+import generate
+from common import export
+from common.export import read_npz
+
+MANIFEST = {
+    'jobs': [
+        {'solid': 'cube', 'radii': [1, 2], 'formats': ['stl', 'npz']},
+        {'solid': 'dodecahedron'},
+        {'solid': 'stellated_dodecahedron', 'keys': [['base']]},
+        {'solid': 'stellated_icosahedron', 'keys': ['A']}
+    ]
+}
+
+@pytest.fixture
+def manifest(tmp_path, data_dir):
+    file = tmp_path / 'manifest.json'
+    file.write_text(json.dumps(MANIFEST))
+    previous = export.OUTPUT_DIR
+    yield str(file)
+    export.set_output_dir(previous)
+
+def output_files(output_dir):
+    return {
+        os.path.relpath(os.path.join(root, name), output_dir)
+        for root, _, names in os.walk(output_dir) for name in names
+    }
+
+def test_expand():
+    items = generate.expand({'jobs': MANIFEST['jobs'] + [
+        {'solid': 'stellated_dodecahedron', 'keys': [['base']], 'radii': [1.0]}
+    ]})
+    assert len(items) == 7
+    assert ('stellated_dodecahedron', ('base',), 1.0, 'stl') in items
+    with pytest.raises(ValueError):
+        generate.expand({'jobs': [{'solid': 'sphere'}]})
+
+def test_run_and_resume(tmp_path, manifest):
+    output_dir = str(tmp_path / 'out')
+    assert generate.run(manifest, processes=1, output_dir=output_dir) == 7
+    # each family in its own directory, so the dodecahedra don't collide
+    assert output_files(output_dir) == {
+        os.path.join('platonic', 'stl', 'cube.stl'),
+        os.path.join('platonic', 'stl', 'cube_2.stl'),
+        os.path.join('platonic', 'npz', 'cube.npz'),
+        os.path.join('platonic', 'npz', 'cube_2.npz'),
+        os.path.join('platonic', 'stl', 'dodecahedron.stl'),
+        os.path.join('stellated_dodecahedra', 'stl', 'dodecahedron.stl'),
+        os.path.join('stellated_icosahedra', 'stl', 'icosahedron.stl')
+    }
+    vertices, _ = read_npz(os.path.join(output_dir, 'platonic', 'npz', 'cube_2.npz'))
+    assert np.allclose(np.abs(vertices), 2 / np.sqrt(3))
+
+    assert generate.run(manifest, processes=1, output_dir=output_dir) == 0
+    # a missing file is made again
+    os.remove(os.path.join(output_dir, 'platonic', 'stl', 'cube.stl'))
+    assert generate.run(manifest, processes=1, output_dir=output_dir) == 1
+    assert generate.run(manifest, processes=1, output_dir=output_dir, restart=True) == 7
+
+def test_manifest_output_dir(tmp_path, manifest):
+    with open(manifest, 'w') as f:
+        json.dump({'output_dir': 'out', 'jobs': MANIFEST['jobs'][:1]}, f)
+    assert generate.run(manifest, processes=1) == 4
+    assert os.path.exists(tmp_path / 'out' / 'platonic' / 'stl' / 'cube_2.stl')
+
+def test_output_dir_already_set(tmp_path, manifest):
+    # as if from POLYHEDRA_OUTPUT_DIR
+    output_dir = str(tmp_path / 'env')
+    export.set_output_dir(output_dir)
+    with open(manifest, 'w') as f:
+        json.dump({'jobs': MANIFEST['jobs'][1:2]}, f)
+    assert generate.run(manifest, processes=1) == 1
+    assert output_files(output_dir) == {
+        os.path.join('platonic', 'stl', 'dodecahedron.stl')
+    }
+    # an output directory given for one run is dropped afterwards
+    generate.run(manifest, processes=1, output_dir=str(tmp_path / 'out'))
+    assert export.OUTPUT_DIR == output_dir
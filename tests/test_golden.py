@@ -0,0 +1,78 @@
+import itertools
+import numpy as np
+from common import golden
+from common.stellation_diagram import signed_area, stellation_diagram
+from stellations.stellated_dodecahedra.stellation_regions import (
+    exact_face_planes, stellation_regions
+)
+from stellations.stellated_dodecahedra.utils import FACE_PLANE
+
+# a spread of small numbers a + bφ, including zero and both signs
+PAIRS = np.array(list(itertools.product(range(-4, 5), repeat=2)))
+
+def test_arithmetic_matches_floats():
+    x = golden.golden(PAIRS[:, 0], PAIRS[:, 1])
+    y = x[::-1]
+    assert np.allclose(
+        golden.to_float(golden.mul(x, y)),
+        golden.to_float(x) * golden.to_float(y)
+    )
+    assert np.allclose(
+        golden.norm(x),
+        golden.to_float(x) * golden.to_float(golden.conjugate(x))
+    )
+
+def test_sign():
+    x = golden.golden(PAIRS[:, 0], PAIRS[:, 1])
+    assert np.array_equal(golden.sign(x), np.sign(golden.to_float(x)))
+
+def test_rational_points_are_canonical():
+    numerators = golden.golden([[1, 2, 3]], [[1, 0, -1]]) # shape (1, 3, 2)
+    k = golden.golden(3, 1)
+    # the same point as numerators / 1 and (k numerators) / k
+    points = golden.rational_points(
+        np.concatenate([numerators, golden.mul(numerators, k)]),
+        golden.golden([1, 3], [0, 1])
+    )
+    assert np.array_equal(points[0], points[1])
+    assert points[0, -1] > 0
+    assert np.gcd.reduce(points[0]) == 1
+    assert np.allclose(golden.points_to_float(points[:1]), golden.to_float(numerators))
+
+    # dividing by φ
+    points = golden.rational_points(numerators, golden.golden([0], [1]))
+    assert np.allclose(
+        golden.points_to_float(points), golden.to_float(numerators) / golden.φ
+    )
+
+def test_plane_intersections_match_solve():
+    rng = np.random.default_rng(0)
+    normals = golden.golden(
+        rng.integers(-3, 4, (6, 3)), rng.integers(-3, 4, (6, 3))
+    )
+    distances = golden.golden(rng.integers(1, 4, 6), rng.integers(0, 3, 6))
+    triples = np.array(list(itertools.combinations(range(6), 3)))
+    points, single = golden.plane_intersections(normals, distances, triples)
+    expected = [
+        np.linalg.solve(golden.to_float(normals[t]), golden.to_float(distances[t]))
+        for t in triples[single]
+    ]
+    assert np.allclose(golden.points_to_float(points), expected)
+    assert np.all(golden.plane_sides(points, normals, distances)[
+        np.arange(len(points))[:, None], triples[single]
+    ] == 0)
+
+def test_exact_dodecahedron_diagram_matches_float():
+    normals, distances = exact_face_planes()
+    # the exact vertices are √3 times those of the unit dodecahedron
+    regions = stellation_diagram(
+        golden.to_float(normals),
+        golden.to_float(distances) / np.sqrt(3.0),
+        FACE_PLANE
+    )
+    exact = [region for shell in stellation_regions().values() for region in shell]
+    assert len(regions) == len(exact) == 16
+    assert np.allclose(
+        sorted(signed_area(region) for region in regions),
+        sorted(signed_area(region) for region in exact)
+    )
@@ -0,0 +1,77 @@
+import os
+import numpy as np
+import pytest
+from stellations.stellated_dodecahedra.mesh_cache import MeshCache
+from stellations.stellated_dodecahedra.stellated_dodecahedron_builder import StellatedDodecahedronBuilder
+
+VERTICES = np.random.default_rng(0).normal(size=(10, 3))
+FACES = np.arange(30).reshape(10, 3) % 10
+
+def test_round_trip(tmp_path):
+    cache = MeshCache(str(tmp_path))
+    key = MeshCache.key([VERTICES], 'version')
+    assert key != MeshCache.key([VERTICES], 'other version')
+    assert cache.get(key) is None
+    cache.put(key, VERTICES, FACES)
+    # from memory, then from disk in a new cache
+    for cache in (cache, MeshCache(str(tmp_path))):
+        vertices, faces = cache.get(key)
+        assert np.array_equal(vertices, VERTICES)
+        assert np.array_equal(faces, FACES)
+        assert faces.dtype == np.int64
+        assert not vertices.flags.writeable
+    cache.clear()
+    assert cache.get(key) is None and os.listdir(tmp_path) == []
+
+def test_memory_is_lru(tmp_path):
+    cache = MeshCache(str(tmp_path), max_entries=2)
+    for key in 'abc':
+        cache.put(key, VERTICES, FACES)
+    assert list(cache._memory) == ['b', 'c']
+    cache.get('b')
+    assert list(cache._memory) == ['c', 'b']
+    # still on disk
+    assert cache.get('a') is not None
+
+def test_disk_eviction(tmp_path):
+    cache = MeshCache(str(tmp_path), max_entries=0)
+    cache.put('a', VERTICES, FACES)
+    size = os.path.getsize(tmp_path / 'a.npz')
+    cache.max_bytes = 2 * size + size // 2
+    os.utime(tmp_path / 'a.npz', (1, 1))
+    cache.put('b', VERTICES, FACES)
+    os.utime(tmp_path / 'b.npz', (2, 2))
+    # reading a marks it as recently used, so b is evicted for c
+    assert cache.get('a') is not None
+    cache.put('c', VERTICES, FACES)
+    assert sorted(os.listdir(tmp_path)) == ['a.npz', 'c.npz']
+
+def test_unwritable_directory(tmp_path):
+    (tmp_path / 'file').touch()
+    cache = MeshCache(str(tmp_path / 'file' / 'cache'))
+    cache.put('a', VERTICES, FACES)
+    assert np.array_equal(cache.get('a')[0], VERTICES)
+    mesh = StellatedDodecahedronBuilder.build_from_keys(['base'], cache=cache)
+    assert len(mesh.faces) == 36
+
+def test_builder_hits(tmp_path, monkeypatch):
+    cache = MeshCache(str(tmp_path))
+    validated = []
+    monkeypatch.setattr(
+        StellatedDodecahedronBuilder, 'validate_normals', validated.append
+    )
+    meshes = [
+        StellatedDodecahedronBuilder.build_from_keys(
+            ['base', 'first_shell'], cache=cache, validate=True, weld=True
+        )
+        for _ in range(2)
+    ]
+    assert len(os.listdir(tmp_path)) == 1
+    # validated on both the miss and the hit, with the same result
+    assert validated == meshes
+    assert np.array_equal(meshes[0].vertices, meshes[1].vertices)
+    assert np.array_equal(meshes[0].faces, meshes[1].faces)
+    assert meshes[0].faces.dtype == meshes[1].faces.dtype
+    # the cached arrays aren't shared with the mesh
+    meshes[1].vertices[0] = 0
+    assert not np.array_equal(meshes[1].vertices, meshes[0].vertices)
@@ -0,0 +1,30 @@
+import numpy as np
+from common.mesh_library import MeshLibrary
+from stellations.stellated_dodecahedra.stellated_dodecahedron_builder import StellatedDodecahedronBuilder
+from stellations.stellated_dodecahedra.stellation_regions import get_stellation_regions
+
+def test_gather():
+    square = ([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], [[0, 1, 2], [0, 2, 3]])
+    triangle = ([[0, 0, 1], [1, 0, 1], [0, 1, 1]], [[0, 1, 2]])
+    empty = (np.empty((0, 3)), np.empty((0, 3)))
+    library = MeshLibrary({'square': square, 'triangle': triangle, 'empty': empty})
+    assert len(library) == 3 and 'square' in library
+
+    vertices, faces = library.gather(['triangle', 'empty', 'square'])
+    assert np.array_equal(vertices, np.concatenate([triangle[0], square[0]]))
+    assert np.array_equal(faces, np.concatenate([triangle[1], np.array(square[1]) + 3]))
+
+    vertices, faces = library.gather([])
+    assert vertices.shape == (0, 3) and faces.shape == (0, 3)
+    assert not library.vertices.flags.writeable
+
+def test_library_builds_match_regions():
+    regions = get_stellation_regions()
+    for keys in (['base'], ['second_shell', 'third_shell']):
+        for options in ({}, {'weld': True, 'drop_interior': True}):
+            from_library = StellatedDodecahedronBuilder.build_from_library(keys, **options)
+            from_regions = StellatedDodecahedronBuilder.build_from_regions(
+                [region for k in keys for region in regions[k]], **options
+            )
+            assert np.allclose(from_library.vertices, from_regions.vertices)
+            assert np.array_equal(from_library.faces, from_regions.faces)
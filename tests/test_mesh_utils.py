@@ -0,0 +1,48 @@
+import numpy as np
+import trimesh
+from common.mesh_utils import (
+    WELD_TOLERANCE, interior_faces, remove_unreferenced_vertices,
+    weld_vertices, winding_numbers
+)
+
+def cube_soup(centre=(0.0, 0.0, 0.0), size=1.0):
+    """
+    A cube as triangle soup: three separate vertices for every triangle.
+    """
+    cube = trimesh.creation.box(extents=[size] * 3)
+    vertices = cube.vertices[cube.faces].reshape(-1, 3) + centre
+    return vertices, np.arange(len(vertices)).reshape(-1, 3)
+
+def test_weld_vertices():
+    vertices, faces = cube_soup()
+    # disturb the vertices by less than the tolerance, across cell borders
+    noise = np.random.default_rng(0).uniform(-0.2, 0.2, vertices.shape)
+    welded, welded_faces = weld_vertices(vertices + WELD_TOLERANCE * noise, faces)
+    assert len(welded) == 8
+    mesh = trimesh.Trimesh(welded, welded_faces, process=False)
+    assert mesh.is_watertight and np.isclose(mesh.volume, 1.0)
+
+def test_weld_removes_collapsed_faces():
+    vertices = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1e-10]])
+    faces = np.array([[0, 1, 2], [0, 3, 1]])
+    welded, welded_faces = weld_vertices(vertices, faces)
+    assert len(welded) == 3
+    assert np.allclose(welded[welded_faces], vertices[faces[:1]])
+
+def test_winding_numbers():
+    vertices, faces = cube_soup()
+    points = np.array([[0.0, 0.0, 0.0], [0.4, -0.4, 0.3], [2.0, 0.0, 0.0]])
+    assert np.allclose(winding_numbers(points, vertices, faces), [1, 1, 0])
+
+def test_interior_faces():
+    # a small cube inside a large one
+    inner = cube_soup(size=0.5)
+    outer = cube_soup(size=2.0)
+    vertices = np.concatenate([inner[0], outer[0]])
+    faces = np.concatenate([inner[1], outer[1] + len(inner[0])])
+    hidden = interior_faces(vertices, faces)
+    assert np.array_equal(hidden, np.arange(len(faces)) < len(inner[1]))
+
+    kept, kept_faces = remove_unreferenced_vertices(vertices, faces[~hidden])
+    assert np.array_equal(kept, outer[0])
+    assert np.array_equal(kept_faces, outer[1])
@@ -0,0 +1,155 @@
+import os.path
+import numpy as np
+import pytest
+from common import export
+from common.polyhedron import Polyhedron
+from misc.permutahedron import Permutahedron
+from platonic.cube import Cube
+from platonic.dodecahedron import Dodecahedron
+from platonic.icosahedron import Icosahedron
+from platonic.octahedron import Octahedron
+from platonic.tetrahedron import Tetrahedron
+from stellations.misc_stellations.small_triambic_icosahedron import SmallTriambicIcosahedron
+from stellations.misc_stellations.stella_octangula import StellaOctangula
+
+# volume of each platonic solid with circumradius 1, from its edge length a
+PLATONIC_VOLUMES = {
+    Tetrahedron: (lambda a: a ** 3 / (6.0 * np.sqrt(2.0)))(np.sqrt(8.0 / 3.0)),
+    Cube: (2.0 / np.sqrt(3.0)) ** 3,
+    Octahedron: 4.0 / 3.0,
+    Dodecahedron: (lambda a: (15.0 + 7.0 * np.sqrt(5.0)) / 4.0 * a ** 3)(
+        4.0 / (np.sqrt(3.0) * (1.0 + np.sqrt(5.0)))
+    ),
+    Icosahedron: (lambda a: 5.0 / 12.0 * (3.0 + np.sqrt(5.0)) * a ** 3)(
+        1.0 / np.sin(2.0 * np.pi / 5.0)
+    )
+}
+
+# vertices, edges and faces
+COUNTS = {
+    Tetrahedron: (4, 6, 4),
+    Cube: (8, 12, 6),
+    Octahedron: (6, 12, 8),
+    Dodecahedron: (20, 30, 12),
+    Icosahedron: (12, 30, 20),
+    Permutahedron: (24, 36, 14)
+}
+
+def edges(faces):
+    return {
+        frozenset([face[i - 1], face[i]]) for face in faces for i in range(len(face))
+    }
+
+@pytest.mark.parametrize('cls', list(COUNTS))
+def test_face_tables(cls):
+    solid = cls(2.0)
+    solid.validate()
+    assert (len(solid.vertices), len(edges(solid.faces)), len(solid.faces)) == COUNTS[cls]
+    # every face is a regular polygon
+    for face in solid.faces:
+        sides = np.linalg.norm(
+            solid.vertices[list(face)] - solid.vertices[list(face[1:]) + [face[0]]],
+            axis=1
+        )
+        assert np.allclose(sides, sides[0])
+
+@pytest.mark.parametrize('cls', list(PLATONIC_VOLUMES))
+def test_platonic_volumes(cls):
+    solid = cls(2.0)
+    assert np.allclose(np.linalg.norm(solid.vertices, axis=1), 2.0)
+    assert np.isclose(solid.mesh.volume, 8.0 * PLATONIC_VOLUMES[cls])
+
+def test_permutahedron_volume():
+    # a truncated octahedron with edge a has volume 8√2 a^3
+    solid = Permutahedron()
+    face = list(solid.faces[0])
+    a = np.linalg.norm(solid.vertices[face[0]] - solid.vertices[face[1]])
+    assert np.isclose(solid.mesh.volume, 8.0 * np.sqrt(2.0) * a ** 3)
+
+def test_polyhedron_is_abstract():
+    with pytest.raises(TypeError):
+        Polyhedron()
+
+def test_geometry_is_cached():
+    small, large = Cube(), Cube(2.0)
+    assert small.vertices is Cube().vertices
+    assert np.allclose(large.vertices, 2.0 * small.vertices)
+    assert large.faces is small.faces
+    assert large.mesh is large.mesh
+    with pytest.raises(ValueError):
+        large.vertices[0, 0] = 0.0
+    assert Cube.name() == 'cube'
+    assert StellaOctangula.name() == 'stella_octangula'
+
+def test_validate():
+    # two interpenetrating tetrahedra are closed but not convex
+    StellaOctangula().validate()
+
+    class InsideOut(Tetrahedron):
+        __slots__ = ()
+
+        @staticmethod
+        def unit_faces():
+            return [face[::-1] for face in Tetrahedron.unit_faces()]
+
+    with pytest.raises(ValueError):
+        InsideOut().validate()
+
+    class Open(Tetrahedron):
+        __slots__ = ()
+
+        @staticmethod
+        def unit_faces():
+            return Tetrahedron.unit_faces()[1:]
+
+    with pytest.raises(ValueError):
+        Open().validate()
+
+def test_small_triambic_icosahedron():
+    solid = SmallTriambicIcosahedron(2.0)
+    solid.validate()
+    assert len(solid.vertices) == 32
+    assert len(solid.triangles) == 60
+    # the icosahedron and the 20 pyramids on its faces
+    icosahedron = Icosahedron(2.0)
+    bases = solid.vertices[SmallTriambicIcosahedron._icosahedron_faces()]
+    apexes = solid.vertices[12:]
+    area = np.linalg.norm(np.cross(bases[0, 1] - bases[0, 0], bases[0, 2] - bases[0, 0])) / 2.0
+    heights = np.linalg.norm(apexes, axis=1) - np.linalg.norm(bases.mean(axis=1), axis=1)
+    assert np.isclose(
+        solid.mesh.volume, icosahedron.mesh.volume + np.sum(area * heights / 3.0)
+    )
+
+def test_copies():
+    copies = Dodecahedron.copies([1.0, 2.0], translations=[[0, 0, 0], [5, 0, 0]])
+    assert np.allclose(copies[0], Dodecahedron().vertices)
+    assert np.allclose(copies[1], Dodecahedron(2.0).vertices + [5, 0, 0])
+    # a quarter turn about z
+    rotation = np.array([[0.0, -1.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+    (turned,) = Cube.copies(2.0, rotations=[rotation])
+    assert np.allclose(turned, Cube(2.0).vertices @ rotation.T)
+
+def test_combined():
+    triangles = Cube().triangles
+    vertices, faces = Cube.combined(Cube.copies([1.0, 3.0]))
+    assert vertices.shape == (16, 3)
+    assert np.array_equal(faces[:len(triangles)], triangles)
+    assert np.allclose(
+        vertices[faces[len(triangles):]], Cube(3.0).vertices[triangles]
+    )
+
+def test_export_sweep(tmp_path):
+    previous = export.OUTPUT_DIR
+    try:
+        export.set_output_dir(str(tmp_path))
+        with export.ExportQueue() as exports:
+            files = Cube.export_sweep([1, 2.5], format='npz', queue=exports)
+        assert files == [
+            os.path.join(str(tmp_path), 'platonic', 'npz', f'cube_{radius}.npz')
+            for radius in ['1', '2.5']
+        ]
+        vertices, faces = export.read_npz(files[1])
+        assert np.allclose(vertices, Cube(2.5).vertices)
+        assert np.array_equal(faces, Cube().triangles)
+    finally:
+        export.set_output_dir(previous)
@@ -0,0 +1,67 @@
+import json
+import tracemalloc
+import numpy as np
+import pytest
+from common import profiling
+from stellations.stellated_icosahedra.stellated_icosahedron_builder import StellatedIcosahedronBuilder
+
+@pytest.fixture
+def profile():
+    was_tracing = tracemalloc.is_tracing()
+    previous = profiling.take()
+    yield profiling
+    profiling.disable()
+    profiling.take()
+    profiling.add(previous)
+    if not was_tracing:
+        tracemalloc.stop()
+
+def test_disabled():
+    assert not profiling.enabled()
+    with profiling.stage('nothing'):
+        pass
+    assert 'nothing' not in profiling.summary()
+
+def test_summary_and_trace(profile):
+    profile.enable(memory=True)
+    for _ in range(3):
+        with profile.stage('outer'):
+            with profile.stage('inner'):
+                data = np.ones(100000)
+            del data
+    summary = profile.summary()
+    assert summary['outer']['calls'] == summary['inner']['calls'] == 3
+    assert summary['outer']['seconds'] >= summary['inner']['seconds']
+    # the inner stage's allocation counts towards the outer one's
+    assert summary['outer']['bytes'] >= summary['inner']['bytes'] >= 800000
+
+    events = profile.chrome_trace()['traceEvents']
+    assert [event['name'] for event in events] == ['inner', 'outer'] * 3
+    assert all(event['ph'] == 'X' and 'bytes' in event['args'] for event in events)
+
+def test_write(profile, tmp_path):
+    profile.enable()
+    with profile.stage('stage'):
+        pass
+    profile.write(str(tmp_path / 'profile.json'))
+    profile.write(str(tmp_path / 'profile.trace.json'))
+    with open(tmp_path / 'profile.json') as f:
+        assert json.load(f)['stage']['calls'] == 1
+    with open(tmp_path / 'profile.trace.json') as f:
+        assert json.load(f)['traceEvents'][0]['name'] == 'stage'
+
+def test_take_and_add(profile):
+    profile.enable()
+    with profile.stage('stage'):
+        pass
+    events = profile.take()
+    assert len(events) == 1
+    assert profile.summary() == {}
+    # as if from a worker process
+    profile.add(events * 2)
+    assert profile.summary()['stage']['calls'] == 2
+
+def test_pipeline_stages(profile):
+    profile.enable()
+    StellatedIcosahedronBuilder.build_from_notation('C')
+    assert {'from_xy', 'rotate'} <= set(profile.summary())
@@ -0,0 +1,38 @@
+from multiprocessing import shared_memory
+import numpy as np
+import pytest
+from common.shared_mesh import MeshPool, SharedMesh
+from platonic.icosahedron import Icosahedron
+
+def build_icosahedron(radius):
+    solid = Icosahedron(radius)
+    return solid.vertices, solid.triangles
+
+def test_shared_mesh_is_freed():
+    solid = Icosahedron()
+    mesh = SharedMesh.create(solid.vertices, solid.triangles)
+    with mesh:
+        assert np.array_equal(mesh.vertices, solid.vertices)
+        assert np.array_equal(mesh.faces, solid.triangles)
+    assert mesh.vertices is None
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(mesh.name)
+
+def test_mesh_pool():
+    radii = [1.0, 2.0, 3.0]
+    names = []
+    with MeshPool(2) as pool:
+        for radius in radii:
+            pool.submit(radius, build_icosahedron, radius)
+        results = {}
+        for radius, mesh in pool.results():
+            names.append(mesh.name)
+            with mesh:
+                results[radius] = mesh.vertices.copy(), mesh.faces.copy()
+    assert sorted(results) == radii
+    for radius, (vertices, faces) in results.items():
+        assert np.allclose(vertices, Icosahedron(radius).vertices)
+        assert np.array_equal(faces, Icosahedron().triangles)
+    for name in names:
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name)
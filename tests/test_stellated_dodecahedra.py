@@ -0,0 +1,76 @@
+import os
+import numpy as np
+from common.stl import read_stl
+from stellations.stellated_dodecahedra import main
+from stellations.stellated_dodecahedra.stellated_dodecahedron_builder import StellatedDodecahedronBuilder
+
+def test_all_stellation_keys():
+    key_sets = main.all_stellation_keys()
+    assert len(key_sets) == 2 ** 4 - 1
+    assert key_sets[0] == ['base']
+    assert key_sets[-1] == ['base', 'first_shell', 'second_shell', 'third_shell']
+
+def test_stellation_name():
+    assert main.stellation_name(['second_shell']) == 'great_dodecahedron'
+    assert main.stellation_name(['third_shell', 'base']) == 'third_shell-base'
+
+def test_generate(tmp_path, data_dir):
+    key_sets = [['first_shell'], ['base', 'second_shell']]
+    path = tmp_path / 'stl'
+    main.generate_stellated_dodecahedra(key_sets, str(path), processes=2)
+    assert sorted(name for name in os.listdir(path) if name.endswith('.stl')) == [
+        'base-second_shell.stl', 'small_stellated_dodecahedron.stl'
+    ]
+    records = read_stl(str(path / 'small_stellated_dodecahedron.stl'))
+    mesh = StellatedDodecahedronBuilder.build_from_keys(['first_shell'], cache=None)
+    assert np.allclose(records['vertices'], mesh.vertices[mesh.faces])
+
+def generated(path, capsys, key_sets=None, **options):
+    """
+    Run generate_stellated_dodecahedra and return the number of files it
+    wrote.
+    """
+    main.generate_stellated_dodecahedra(key_sets, str(path), processes=1, **options)
+    done = capsys.readouterr().out.splitlines()[-1]
+    return int(done.split()[1])
+
+def test_incremental_rebuild(tmp_path, data_dir, capsys, monkeypatch):
+    key_sets = [['first_shell'], ['base', 'second_shell']]
+    path = tmp_path / 'stl'
+    assert generated(path, capsys, key_sets) == 2
+    records = main.load_dependencies(str(path))
+    assert sorted(records) == ['base-second_shell.stl', 'small_stellated_dodecahedron.stl']
+    assert records['small_stellated_dodecahedron.stl']['output'] == \
+        main.output_stamp(str(path / 'small_stellated_dodecahedron.stl'))
+    assert generated(path, capsys, key_sets) == 0
+    assert generated(path, capsys, key_sets, overwrite=True) == 2
+
+    # a file changed, replaced or removed since it was written
+    file = path / 'small_stellated_dodecahedron.stl'
+    with open(file, 'ab') as f:
+        f.write(b'\0')
+    assert generated(path, capsys, key_sets) == 1
+    os.utime(file, ns=(0, 0))
+    assert generated(path, capsys, key_sets) == 1
+    os.remove(file)
+    assert generated(path, capsys, key_sets) == 1
+    assert generated(path, capsys, key_sets) == 0
+
+    # only the files using a changed region
+    records = main.load_dependencies(str(path))
+    records['base-second_shell.stl']['regions']['base'] = 'changed'
+    main.save_dependencies(str(path), records)
+    assert generated(path, capsys, key_sets) == 1
+    # everything, when the code changes
+    monkeypatch.setattr(main, 'CODE_VERSION', 'changed')
+    assert generated(path, capsys, key_sets) == 2
+
+def test_committed_files_are_current(tmp_path, data_dir, capsys):
+    # so that rebuilding them in a fresh clone, which has no record of
+    # them, changes nothing
+    path = tmp_path / 'stl'
+    main.generate_all_primitive_stellated_dodecahedra(str(path))
+    for name in main.PRIMITIVE_STELLATED_DODECAHEDRA:
+        committed = os.path.join(main.OUTPUT_DIR, 'stl', f'{name}.stl')
+        with open(path / f'{name}.stl', 'rb') as f, open(committed, 'rb') as g:
+            assert f.read() == g.read(), name
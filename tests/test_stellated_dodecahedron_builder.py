@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+from stellations.stellated_dodecahedra.main import (
+    PRIMITIVE_STELLATED_DODECAHEDRA, all_stellation_keys
+)
+from stellations.stellated_dodecahedra.stellated_dodecahedron_builder import StellatedDodecahedronBuilder
+from stellations.stellated_dodecahedra.stellation_regions import get_stellation_regions
+
+φ = (1.0 + np.sqrt(5.0)) / 2.0
+
+def icosahedron_volume(edge):
+    return 5.0 / 12.0 * (3.0 + np.sqrt(5.0)) * edge ** 3
+
+def build(keys, **options):
+    regions = get_stellation_regions()
+    return StellatedDodecahedronBuilder.build_from_regions(
+        [region for k in keys for region in regions[k]], **options
+    )
+
+def test_primitive_stellated_dodecahedra():
+    meshes = {
+        name: build(keys) for name, keys in PRIMITIVE_STELLATED_DODECAHEDRA.items()
+    }
+    # the dodecahedron inscribed in the unit sphere has edge 2 / (√3 φ)
+    edge = 2.0 / (np.sqrt(3.0) * φ)
+    assert np.isclose(
+        meshes['dodecahedron'].volume,
+        (15.0 + 7.0 * np.sqrt(5.0)) / 4.0 * edge ** 3
+    )
+    # the small stellated and great dodecahedra have the vertices of an
+    # icosahedron with edge a, and the former has a core of edge a / φ^2
+    for name in ('small_stellated_dodecahedron', 'great_dodecahedron'):
+        hull = meshes[name].convex_hull
+        assert len(hull.vertices) == 12
+    a = (hull.volume / icosahedron_volume(1.0)) ** (1.0 / 3.0)
+    assert np.isclose(
+        meshes['great_dodecahedron'].volume, 5.0 / 4.0 * (np.sqrt(5.0) - 1.0) * a ** 3
+    )
+    assert np.isclose(
+        meshes['small_stellated_dodecahedron'].volume,
+        5.0 / 4.0 * (7.0 + 3.0 * np.sqrt(5.0)) * (a / φ ** 2) ** 3
+    )
+    # the great stellated dodecahedron has the vertices of a dodecahedron
+    assert len(meshes['great_stellated_dodecahedron'].convex_hull.vertices) == 20
+
+def test_every_polygon_is_on_all_12_faces():
+    regions = get_stellation_regions()['first_shell']
+    mesh = build(['first_shell'])
+    # a fan of n - 2 triangles per polygon, on each of the 12 face planes
+    assert len(mesh.faces) == 12 * sum(len(region) - 2 for region in regions)
+    assert len(mesh.vertices) == 12 * sum(len(region) for region in regions)
+    assert np.allclose(np.linalg.norm(mesh.face_normals, axis=1), 1.0)
+
+def test_faces_point_outward():
+    for keys in PRIMITIVE_STELLATED_DODECAHEDRA.values():
+        mesh = build(keys, validate=True)
+        # every face lies in a face plane n . x = d with d > 0 and faces
+        # along n
+        assert np.all(np.einsum('ij,ij->i', mesh.face_normals, mesh.triangles_center) > 0)
+        assert mesh.volume > 0
+
+def test_validate_normals():
+    mesh = build(['base'])
+    StellatedDodecahedronBuilder.validate_normals(mesh)
+    flipped = mesh.copy()
+    flipped.faces = flipped.faces[:, ::-1]
+    with pytest.raises(ValueError):
+        StellatedDodecahedronBuilder.validate_normals(flipped)
+
+@pytest.mark.parametrize('keys', all_stellation_keys())
+def test_welded_meshes_are_closed(keys):
+    mesh = StellatedDodecahedronBuilder.build_from_keys(
+        keys, cache=None, weld=True, drop_interior=True
+    )
+    assert mesh.is_watertight and mesh.is_winding_consistent
+    # each shell contains those inside it, so only the outermost is left
+    outermost = build(keys[-1:], weld=True)
+    assert np.isclose(mesh.volume, outermost.volume)
+    assert len(mesh.faces) == len(outermost.faces)
+
+def test_welding():
+    vertices, faces = StellatedDodecahedronBuilder.build_arrays(
+        get_stellation_regions()['first_shell'], weld=True
+    )
+    # the points of the star and the vertices of the dodecahedron beneath
+    assert len(vertices) == 12 + 20
+    assert len(faces) == 60
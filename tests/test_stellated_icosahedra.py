@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from platonic.icosahedron import Icosahedron
+from stellations.misc_stellations.small_triambic_icosahedron import SmallTriambicIcosahedron
+from stellations.stellated_icosahedra.main import FIFTY_NINE_ICOSAHEDRA
+from stellations.stellated_icosahedra.stellated_icosahedron_builder import StellatedIcosahedronBuilder
+from stellations.stellated_icosahedra.stellation_cells import get_stellation_cells
+
+def is_closed(mesh):
+    """
+    Whether every edge of every face is matched by the reversed edge of
+    another, so the surface is closed and consistently wound even where
+    pieces of it meet along an edge.
+    """
+    edges = mesh.faces[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2)
+    forward = np.unique(edges, axis=0, return_counts=True)
+    backward = np.unique(edges[:, ::-1], axis=0, return_counts=True)
+    return all(np.array_equal(f, b) for f, b in zip(forward, backward))
+
+def test_main_stellations():
+    meshes = {
+        notation: StellatedIcosahedronBuilder.build_from_notation(notation, weld=True)
+        for notation in 'ABCDEFGH'
+    }
+    for mesh in meshes.values():
+        assert mesh.is_watertight
+    assert np.isclose(meshes['A'].volume, Icosahedron().mesh.volume)
+    assert np.isclose(meshes['B'].volume, SmallTriambicIcosahedron().mesh.volume)
+    # the compound of five octahedra's vertices are an icosidodecahedron's;
+    # the great icosahedron's an icosahedron's
+    assert len(meshes['C'].convex_hull.vertices) == 30
+    assert len(meshes['G'].convex_hull.vertices) == 12
+    assert len(meshes['H'].convex_hull.vertices) == 60
+    volumes = [meshes[notation].volume for notation in 'ABCDEFGH']
+    assert np.all(np.diff(volumes) > 0)
+
+def test_fifty_nine():
+    cells = get_stellation_cells()
+    assert list(FIFTY_NINE_ICOSAHEDRA) == cells.stellations()
+    assert len(set(FIFTY_NINE_ICOSAHEDRA)) == 59
+    chiral = [
+        notation for notation in FIFTY_NINE_ICOSAHEDRA
+        if set(cells.mirror_image(np.array(sorted(
+            cells.cells(cells.parse(notation))
+        )))) != cells.cells(cells.parse(notation))
+    ]
+    assert len(chiral) == 27
+
+@pytest.mark.parametrize('notation', FIFTY_NINE_ICOSAHEDRA)
+def test_fifty_nine_are_closed(notation):
+    mesh = StellatedIcosahedronBuilder.build_from_notation(notation, weld=True)
+    assert is_closed(mesh)
+    assert mesh.volume > 0
+
+def test_is_stellation():
+    cells = get_stellation_cells()
+    assert cells.is_stellation(cells.cells(['C']))
+    # the shell 'c' alone would leave the cells of 'a' and 'b' enclosed
+    assert not cells.is_stellation(cells.cells(['c']))
+    # 'a' and 'e1' share no face
+    assert not cells.is_stellation(cells.cells(['a', 'e1']))
+    assert not cells.is_stellation(set())
+
+def test_notation():
+    cells = get_stellation_cells()
+    for notation in FIFTY_NINE_ICOSAHEDRA:
+        assert cells.notation(cells.cells(cells.parse(notation))) == notation
+    assert cells.parse("De2f1''g1") == ['D', 'e2', "f1''", 'g1']
+    with pytest.raises(ValueError):
+        cells.parse('Dx')
@@ -0,0 +1,74 @@
+import numpy as np
+from common.stellation_diagram import (
+    plane_lines, plane_points, signed_area, stellation_diagram, trace_regions,
+    unique_points
+)
+from stellations.stellated_dodecahedra.dodecahedron import Dodecahedron
+from stellations.stellated_dodecahedra.stellation_regions import get_stellation_regions
+from stellations.stellated_dodecahedra.utils import FACE_PLANE
+from stellations.stellated_icosahedra.stellation_cells import get_stellation_cells
+
+def test_trace_regions_of_a_grid():
+    # the lines x = 0, x = 1, x = 2, y = 0 and y = 1 bound two unit squares
+    vertices = np.array([[x, y] for x in range(3) for y in range(2)], dtype=float)
+    on_line = np.column_stack(
+        [vertices[:, 0] == x for x in range(3)] +
+        [vertices[:, 1] == y for y in range(2)]
+    )
+    regions = trace_regions(vertices, on_line)
+    assert len(regions) == 2
+    for region in regions:
+        assert np.isclose(signed_area(vertices[region]), 1.0)
+
+def test_icosahedron_diagram():
+    cells = get_stellation_cells()
+    assert len(cells.regions) == 67
+    assert sorted(cells.names) == [
+        'a', 'b', 'c', 'd', 'e1', 'e2', 'f1', "f1'", "f1''", 'f2', 'g1', 'g2', 'h'
+    ]
+
+def test_dodecahedron_diagram():
+    midpoints = Dodecahedron().faces.mean(axis=1)
+    distances = np.linalg.norm(midpoints, axis=1)
+    regions = stellation_diagram(
+        midpoints / distances[:, None], distances, FACE_PLANE
+    )
+    # the same regions as those grouped by shell
+    shells = get_stellation_regions()
+    expected = [region for shell in shells.values() for region in shell]
+    assert len(regions) == len(expected) == 16
+    assert np.allclose(
+        sorted(signed_area(region) for region in regions),
+        sorted(signed_area(region) for region in expected)
+    )
+    # every region is anticlockwise
+    assert all(signed_area(region) > 0 for region in regions)
+
+def test_plane_lines():
+    # two faces of a cube meet in an edge unless they are opposite
+    normals = np.concatenate([np.identity(3), -np.identity(3)])
+    distances = np.ones(6)
+    pairs, points, directions = plane_lines(normals, distances)
+    assert len(pairs) == 12
+    assert not np.any(np.all(normals[pairs[:, 0]] == -normals[pairs[:, 1]], axis=1))
+    for r in range(2):
+        assert np.allclose(np.einsum('mi,mi->m', normals[pairs[:, r]], points), 1.0)
+        assert np.allclose(np.einsum('mi,mi->m', normals[pairs[:, r]], directions), 0.0)
+    # the points nearest the origin are the midpoints of the edges
+    assert np.allclose(np.einsum('mi,mi->m', points, directions), 0.0)
+    assert np.allclose(np.linalg.norm(points, axis=1), np.sqrt(2.0))
+
+def test_plane_points_and_unique_points():
+    # the six faces of a cube meet in threes at its eight vertices
+    normals = np.concatenate([np.identity(3), -np.identity(3)])
+    distances = np.ones(6)
+    triples, points = plane_points(normals, distances)
+    assert len(triples) == 8
+    assert np.allclose(np.abs(points), 1.0)
+    assert np.allclose(
+        np.einsum('mri,mi->mr', normals[triples], points), distances[triples]
+    )
+
+    first, inverse = unique_points(np.concatenate([points, points + 1e-12]))
+    assert np.array_equal(first, np.arange(8))
+    assert np.array_equal(inverse, np.tile(np.arange(8), 2))
@@ -0,0 +1,48 @@
+import numpy as np
+from common.stl import HEADER_SIZE, StlWriter, read_stl, write_stl
+from platonic.cube import Cube
+
+def unit_normals(vertices, faces):
+    normals = np.cross(
+        vertices[faces[:, 1]] - vertices[faces[:, 0]],
+        vertices[faces[:, 2]] - vertices[faces[:, 0]]
+    )
+    return normals / np.linalg.norm(normals, axis=1)[:, None]
+
+def test_round_trip(tmp_path):
+    cube = Cube(1.5)
+    file = str(tmp_path / 'cube.stl')
+    write_stl(file, cube.vertices, cube.triangles)
+    records = read_stl(file)
+    assert len(records) == len(cube.triangles)
+    assert np.allclose(records['vertices'], cube.vertices[cube.triangles])
+    assert np.allclose(
+        records['normal'], unit_normals(cube.vertices, cube.triangles), atol=1e-6
+    )
+
+def test_chunks_and_count(tmp_path):
+    # several writes, each in several chunks, share one triangle count
+    cube = Cube()
+    file = str(tmp_path / 'cubes.stl')
+    with StlWriter(file, header=b'cubes', chunk_size=5) as writer:
+        writer.write(cube.vertices, cube.triangles)
+        writer.write(cube.vertices + 3.0, cube.triangles)
+    with open(file, 'rb') as f:
+        assert f.read(5) == b'cubes'
+        f.seek(HEADER_SIZE)
+        assert int.from_bytes(f.read(4), 'little') == 2 * len(cube.triangles)
+    records = read_stl(file)
+    assert np.allclose(
+        records['vertices'][len(cube.triangles):],
+        cube.vertices[cube.triangles] + 3.0
+    )
+
+def test_integer_and_degenerate_triangles(tmp_path):
+    vertices = [[0, 0, 0], [1, 0, 0], [0, 1, 0], [2, 0, 0]]
+    faces = [[0, 1, 2], [0, 1, 3]]
+    file = str(tmp_path / 'triangles.stl')
+    write_stl(file, vertices, faces)
+    records = read_stl(file)
+    assert np.allclose(records['vertices'], np.array(vertices)[faces])
+    # the second triangle is a line, and gets a zero normal
+    assert np.allclose(records['normal'], [[0, 0, 1], [0, 0, 0]])
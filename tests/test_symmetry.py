@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from common.symmetry import (
+    _keys, generate_group, icosahedral_group, octahedral_group, orbit,
+    orbit_representatives, rotation, tetrahedral_group
+)
+from platonic.dodecahedron import Dodecahedron
+from platonic.icosahedron import Icosahedron
+from stellations.stellated_dodecahedra.rotations import get_rotations
+from stellations.stellated_dodecahedra.utils import FACE_PLANE
+
+def test_rotation():
+    assert np.allclose(rotation([0, 0, 2], np.pi / 2) @ [1, 0, 0], [0, 1, 0])
+    assert np.allclose(rotation([1, 1, 1], 2 * np.pi / 3) @ [1, 0, 0], [0, 1, 0])
+
+@pytest.mark.parametrize('group, order', [
+    (tetrahedral_group, 12), (octahedral_group, 24), (icosahedral_group, 60)
+])
+def test_groups(group, order):
+    group = group()
+    assert group.shape == (order, 3, 3)
+    assert np.allclose(group[0], np.identity(3))
+    assert np.allclose(group @ group.transpose(0, 2, 1), np.identity(3))
+    assert np.allclose(np.linalg.det(group), 1.0)
+    # distinct and closed under multiplication
+    keys = set(_keys(group, 1e-6))
+    assert len(keys) == order
+    assert set(_keys((group[:, None] @ group[None]).reshape(-1, 3, 3), 1e-6)) == keys
+    assert not group.flags.writeable
+
+def test_generate_group():
+    # a rotation by 2π/5 generates a cyclic group of order 5
+    assert len(generate_group([rotation([0, 0, 1], 2 * np.pi / 5)])) == 5
+
+def test_icosahedral_group_is_a_symmetry():
+    for solid in (Icosahedron(), Dodecahedron()):
+        images = orbit(icosahedral_group(), solid.vertices)
+        # each rotation permutes the vertices
+        distances = np.linalg.norm(
+            images[:, :, None] - solid.vertices[None, None], axis=-1
+        )
+        assert np.allclose(distances.min(axis=2), 0.0)
+
+def test_orbit_representatives():
+    icosahedron = Icosahedron()
+    midpoint = icosahedron.vertices[list(icosahedron.faces[0])].mean(axis=0)
+    representatives = orbit_representatives(icosahedral_group(), midpoint)
+    assert len(representatives) == 20
+    assert np.allclose(representatives[0], np.identity(3))
+
+def test_dodecahedron_rotations():
+    # the 12 rotations send face 0 to each of the 12 faces
+    midpoints = get_rotations() @ FACE_PLANE.from_xy(np.zeros(2))
+    assert len(set(_keys(midpoints, 1e-6))) == 12